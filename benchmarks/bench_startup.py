@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Benchmark startup time (time to the first rendered frame)
+Launches the game with PYUNO_STARTUP_PROBE set, which makes the start menu
+print a marker after its first frame and quit, and times each launch from
+process start to the marker. Works for source runs and built executables.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 5]
+    python benchmarks/bench_startup.py --exe dist_final/PyUNO_Final --exe dist_lite/PyUNO/PyUNO
+"""
+
+import os
+import sys
+import argparse
+import statistics
+import subprocess
+import time
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+FIRST_FRAME_MARKER = "PYUNO_FIRST_FRAME"
+
+
+def time_to_first_frame(command, runs=5, timeout=60.0, headless=True):
+    """
+    Launch command runs times and return the seconds until each printed the first-frame marker
+    headless uses SDL's dummy video driver so no window opens.
+    """
+    env = dict(os.environ, PYUNO_STARTUP_PROBE="1")
+    if headless:
+        env.setdefault("SDL_VIDEODRIVER", "dummy")
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        process = subprocess.Popen(command, cwd=project_root, env=env, stdout=subprocess.PIPE,
+                                   stderr=subprocess.DEVNULL, text=True)
+        try:
+            for line in process.stdout:
+                if line.startswith(FIRST_FRAME_MARKER):
+                    times.append(time.perf_counter() - start)
+                    break
+            else:
+                # Windowed Windows builds have no stdout, but the probe still
+                # quits right after the first frame
+                if process.wait(timeout) != 0:
+                    raise RuntimeError(f"{command[0]} exited without rendering a frame")
+                times.append(time.perf_counter() - start)
+        finally:
+            try:
+                process.wait(timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+            process.stdout.close()
+    return times
+
+
+def report(label, times):
+    print(f"{label}: median {statistics.median(times) * 1000:.0f} ms, "
+          f"min {min(times) * 1000:.0f} ms, max {max(times) * 1000:.0f} ms ({len(times)} runs)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure PyUNO time to first frame")
+    parser.add_argument("--exe", action="append", default=[],
+                        help="Built executable to time (repeatable); defaults to running main_game.py from source")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--window", action="store_true", help="Open a real window instead of SDL's dummy driver")
+    args = parser.parse_args()
+
+    commands = [[os.path.abspath(exe)] for exe in args.exe] or [[sys.executable, "main_game.py"]]
+    for command in commands:
+        label = "source" if command[0] == sys.executable else command[0]
+        report(label, time_to_first_frame(command, args.runs, headless=not args.window))
+
+
+if __name__ == "__main__":
+    main()
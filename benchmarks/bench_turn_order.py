@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark turn scheduling on large tables
+Compares TurnOrder lookups with the old modular arithmetic and measures
+how many AI turns per second a 10-player table can take.
+
+Usage:
+    python benchmarks/bench_turn_order.py [--players 10]
+"""
+
+import os
+import sys
+import argparse
+import random
+import timeit
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+from pyuno.core.uno_classes import Game, SEAT_AI
+from pyuno.core.turn_order import TurnOrder
+
+
+def bench_scheduler(num_players, number):
+    order = TurnOrder(num_players)
+    state = {'index': 0, 'direction': 1}
+
+    def modular():
+        # The arithmetic previously repeated in next_player and select_color
+        state['index'] = (state['index'] + state['direction']) % num_players
+        state['index'] = (state['index'] + state['direction'] * 2) % num_players
+
+    def table():
+        order.advance()
+        order.advance(skip=True)
+
+    return timeit.timeit(modular, number=number), timeit.timeit(table, number=number)
+
+
+def bench_ai_turns(num_players, games):
+    turns = 0
+    elapsed = 0.0
+    for seed in range(games):
+        random.seed(seed)
+        game = Game.from_seat_types([SEAT_AI] * num_players)
+        game.start_game()
+        start = timeit.default_timer()
+        for _ in range(2000):
+            if game.check_winner():
+                break
+            game.handle_ai_turn()
+            turns += 1
+        elapsed += timeit.default_timer() - start
+    return turns, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--players", type=int, default=10)
+    parser.add_argument("--number", type=int, default=200000)
+    parser.add_argument("--games", type=int, default=50)
+    args = parser.parse_args()
+
+    modular, table = bench_scheduler(args.players, args.number)
+    print(f"Scheduler ({args.players} seats, {args.number} advance+skip pairs)")
+    print(f"  modular arithmetic: {modular * 1e9 / args.number:8.1f} ns/pair")
+    print(f"  TurnOrder tables:   {table * 1e9 / args.number:8.1f} ns/pair")
+
+    turns, elapsed = bench_ai_turns(args.players, args.games)
+    print(f"AI turns ({args.players} seats, {args.games} games)")
+    print(f"  {turns} turns in {elapsed:.3f}s -> {turns / elapsed:,.0f} turns/s")
+
+
+if __name__ == "__main__":
+    main()
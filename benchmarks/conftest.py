@@ -0,0 +1,14 @@
+"""
+Shared setup for the pytest-benchmark suite
+Run it through run_benchmarks.py, which stores baselines and fails on regressions.
+"""
+
+import os
+import sys
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+# Render into an off-screen surface, with no window or audio device
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Run the pytest-benchmark suite against the stored baseline
+Fails when a benchmark's median is more than --threshold percent slower
+than the latest baseline saved for this platform and Python version.
+Timings only compare on the machine that took them, so baselines are
+not committed: save one locally in benchmarks/baselines before making a
+change, and again after an intended speed change.
+
+Usage:
+    python benchmarks/run_benchmarks.py                  # compare, fail on >25% regressions
+    python benchmarks/run_benchmarks.py --threshold 10 -k engine
+    python benchmarks/run_benchmarks.py --save-baseline
+"""
+
+import os
+import sys
+import argparse
+
+import pytest
+from pytest_benchmark.utils import get_machine_id
+
+benchmarks_dir = os.path.dirname(os.path.abspath(__file__))
+BASELINE_DIR = os.path.join(benchmarks_dir, "baselines")
+
+
+def pytest_args(save_baseline=False, threshold=25, extra=()):
+    args = [benchmarks_dir, "-q", "-p", "no:cacheprovider",
+            f"--benchmark-storage=file://{BASELINE_DIR}", "--benchmark-sort=name"]
+    if save_baseline:
+        args.append("--benchmark-save=baseline")
+    else:
+        # Medians ignore the occasional descheduled round that skews means
+        args += ["--benchmark-compare", f"--benchmark-compare-fail=median:{threshold}%"]
+    return args + list(extra)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run PyUNO benchmarks and check for regressions")
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the new baseline")
+    parser.add_argument("--threshold", type=int, default=25,
+                        help="Allowed slowdown of a benchmark's median, in percent (default 25)")
+    args, extra = parser.parse_known_args()
+    if not args.save_baseline and not os.path.isdir(os.path.join(BASELINE_DIR, get_machine_id())):
+        print("No baseline for this machine yet; run with --save-baseline first", file=sys.stderr)
+        return 2
+    return pytest.main(pytest_args(args.save_baseline, args.threshold, extra))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
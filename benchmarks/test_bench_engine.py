@@ -0,0 +1,77 @@
+"""
+Benchmarks for the rules engine hot paths
+"""
+
+import random
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from pyuno.core.uno_classes import Card, Deck, Player
+from pyuno.sim.headless import play_headless_game
+
+FULL_DECK = Deck(random.Random(0)).cards
+
+
+def test_card_construction(benchmark):
+    benchmark(lambda: [Card("red", "7"), Card("blue", "skip"), Card("wild", "drawfour")])
+
+
+def test_can_play_on(benchmark):
+    top = Card("green", "5")
+
+    def check_deck():
+        return sum(card.can_play_on(top, None) for card in FULL_DECK)
+
+    assert benchmark(check_deck) > 0
+
+
+@pytest.mark.parametrize("hand_size", [7, 30, 100])
+def test_get_playable_cards(benchmark, hand_size):
+    player = Player("bench", "ai")
+    player.hand = random.Random(hand_size).sample(FULL_DECK, hand_size)
+    top = Card("yellow", "reverse")
+    benchmark(player.get_playable_cards, top, None)
+
+
+def test_deck_shuffle(benchmark):
+    deck = Deck(random.Random(1))
+    benchmark(deck.shuffle)
+
+
+def test_deck_draw(benchmark):
+    # A fresh shuffled deck per round, drawn down to the last card
+    def setup():
+        deck = Deck(random.Random(2))
+        deck.shuffle()
+        return (deck,), {}
+
+    def draw_all(deck):
+        while deck.cards:
+            deck.draw_card()
+
+    benchmark.pedantic(draw_all, setup=setup, rounds=200)
+
+
+def test_deck_reshuffle(benchmark):
+    # Every card but one is on the discard pile, so the next draw reshuffles
+    def setup():
+        deck = Deck(random.Random(3))
+        deck.discard_pile, deck.cards = deck.cards, deck.cards[:1]
+        deck.draw_card()
+        return (deck,), {}
+
+    def reshuffle(deck):
+        return deck.draw_card()
+
+    assert benchmark.pedantic(reshuffle, setup=setup, rounds=200) is not None
+
+
+@pytest.mark.parametrize("players", [2, 4])
+def test_ai_game(benchmark, players):
+    # Whole games through handle_ai_turn, the same seeds every round
+    def play():
+        return [play_headless_game([None] * players, seed) for seed in range(10)]
+
+    benchmark(play)
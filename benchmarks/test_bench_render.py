@@ -0,0 +1,34 @@
+"""
+Benchmark for drawing one frame of the game table under SDL's dummy driver
+"""
+
+import random
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+pygame = pytest.importorskip("pygame")
+
+from pyuno.core.uno_classes import Game, SEAT_HUMAN, SEAT_AI
+from pyuno.ui import uno_ui
+from pyuno.ui.layout import HandLayout
+
+
+@pytest.fixture(scope="module")
+def table():
+    screen = uno_ui.init_display()
+    game = Game.from_seat_types([SEAT_HUMAN] + [SEAT_AI] * 3, rng=random.Random(0))
+    game.start_game()
+    layout = HandLayout()
+    # Load and scale the cards and fonts once, outside the timed rounds
+    uno_ui.draw_game_frame(screen, game, game.players[0], layout, (0, 0))
+    yield screen, game, layout
+    pygame.quit()
+    uno_ui.screen = None
+
+
+def test_render_frame(benchmark, table):
+    screen, game, layout = table
+    mouse_pos = (screen.get_width() // 2, screen.get_height() - 60)
+    winner = benchmark(uno_ui.draw_game_frame, screen, game, game.players[0], layout, mouse_pos)
+    assert winner is None
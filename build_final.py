@@ -7,6 +7,7 @@ Cross-platform support for Windows, macOS, and Linux
 
 import os
 import sys
+import argparse
 import subprocess
 import shutil
 import platform
@@ -74,10 +75,68 @@ def ensure_icon_exists(platform_info):
     else:  # Linux - use PNG
         return str(png_path) if png_path.exists() else None
 
+def build_card_atlas(asset_dir):
+    """Build the card texture atlas next to the bundled assets"""
+    try:
+        from src.pyuno.utils.card_atlas import build_atlas
+        index = build_atlas(asset_dir, asset_dir)
+        print(f"✓ Card atlas built ({len(index['cards'])} cards)")
+    except Exception as e:
+        # The game builds the atlas on first run instead
+        print(f"Warning: Could not build card atlas: {e}")
+
+# Modules left out of the --lite bundle. pygame imports these optionally and
+# the game never uses them; numpy and pkg_resources alone add several hundred
+# milliseconds to every launch via pygame.surfarray and pygame.pkgdata.
+LITE_EXCLUDES = [
+    "pygame.examples", "pygame.tests", "pygame.docs", "pygame.mixer", "pygame.mixer_music",
+    "pygame.sndarray", "pygame.surfarray", "pygame.camera", "pygame._camera_opencv",
+    "pygame._camera_vidcapture", "pygame.midi", "pygame.pypm", "pygame.ftfont", "pygame.freetype",
+    "numpy", "pkg_resources", "setuptools", "tkinter",
+]
+
+def get_executable_path(dist_dir, name, platform_info, onedir):
+    """Path of the program PyInstaller produced, for launching it"""
+    ext = '.exe' if platform_info['name'] == 'Windows' else ''
+    if platform_info['name'] == 'macOS':
+        return os.path.join(dist_dir, f"{name}.app", "Contents", "MacOS", name)
+    if onedir:
+        return os.path.join(dist_dir, name, name + ext)
+    return os.path.join(dist_dir, name + ext)
+
+def report_startup_improvement(platform_info, runs=5):
+    """Time the lite build against the standard one-file build, if both exist"""
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmarks'))
+    from bench_startup import time_to_first_frame
+    import statistics
+    
+    builds = [("one-file", get_executable_path("dist_final", "PyUNO_Final", platform_info, False)),
+              ("lite one-dir", get_executable_path("dist_lite", "PyUNO", platform_info, True))]
+    medians = {}
+    for label, path in builds:
+        if not os.path.exists(path):
+            print(f"Startup ({label}): no build at {path}")
+            continue
+        try:
+            medians[label] = statistics.median(time_to_first_frame([os.path.abspath(path)], runs))
+            print(f"Startup ({label}): {medians[label] * 1000:.0f} ms to first frame (median of {runs})")
+        except RuntimeError as e:
+            print(f"Warning: Could not time {label} build: {e}")
+    if len(medians) == 2:
+        before, after = medians["one-file"], medians["lite one-dir"]
+        print(f"✓ Lite build starts {(before - after) * 1000:.0f} ms faster "
+              f"({(1 - after / before) * 100:.0f}% less time to first frame)")
+    elif "one-file" not in medians:
+        print("Build the standard executable too (python build_final.py) to compare startup times")
+
 # Removed create_patched_ui_file function - using original files for stability
 
-def create_final_executable():
-    """Create the final working executable with cross-platform support"""
+def create_final_executable(lite=False):
+    """
+    Create the final working executable with cross-platform support
+    With lite, build a trimmed one-dir bundle instead of a one-file executable:
+    nothing is unpacked to a temp dir at launch and unused modules are left out.
+    """
     
     platform_info = get_platform_info()
     print(f"Creating PyUNO executable for {platform_info['name']}...")
@@ -110,28 +169,39 @@ def create_final_executable():
         # Copy main source
         shutil.copytree('src', 'build_temp/src', dirs_exist_ok=True)
         shutil.copy('main_game.py', 'build_temp/')
+        shutil.copytree('assets', 'build_temp/assets', dirs_exist_ok=True)
         print("✓ Source files copied successfully")
         
     except Exception as e:
         print(f"Error copying source files: {e}")
         return False
     
+    # Pack the card images into one atlas so the game opens one file instead of 55
+    build_card_atlas('build_temp/assets')
+    
     # Platform-specific settings
     separator = platform_info['separator']
     
     # Build command - simplified for stability
+    name = "PyUNO" if lite else "PyUNO_Final"
+    dist_dir = "dist_lite" if lite else "dist_final"
     cmd = [
         "pyinstaller",
-        "--onefile",
-        "--name", "PyUNO_Final",
-        f"--add-data=assets{separator}assets",
+        "--onedir" if lite else "--onefile",
+        "--name", name,
+        f"--add-data=build_temp/assets{separator}assets",
         "--hidden-import", "pygame",
-        "--collect-all", "pygame",
-        "--distpath", "dist_final",
+        "--distpath", dist_dir,
         "--workpath", "build_final",
         "--specpath", ".",
         "--noconfirm"
     ]
+    if lite:
+        # PyInstaller's pygame hook collects what the game imports; skip the rest
+        for module in LITE_EXCLUDES:
+            cmd.extend(["--exclude-module", module])
+    else:
+        cmd.extend(["--collect-all", "pygame"])
     
     # Add windowed flag carefully
     if platform_info['windowed_flag']:
@@ -155,6 +225,10 @@ def create_final_executable():
         result = subprocess.run(cmd, check=True, capture_output=True, text=True)
         print("✓ Final build successful!")
         
+        if lite:
+            print(f"✓ Executable created: {get_executable_path(dist_dir, name, platform_info, True)}")
+            return True
+        
         executable_name = f"PyUNO_Final{platform_info['executable_ext']}"
         print(f"✓ Executable created: dist_final/{executable_name}")
         
@@ -211,11 +285,24 @@ cd "$(dirname "$0")"
 
 def main():
     """Main function"""
+    parser = argparse.ArgumentParser(description="Build PyUNO executables")
+    parser.add_argument("--lite", action="store_true",
+                        help="Build a trimmed one-dir bundle in dist_lite/ and compare its startup time")
+    parser.add_argument("--runs", type=int, default=5, help="Launches per build when timing startup")
+    args = parser.parse_args()
+    
     platform_info = get_platform_info()
     
     print(f"PyUNO Final Build - {platform_info['name']} Edition")
     print("=" * 50)
     
+    if args.lite:
+        if not create_final_executable(lite=True):
+            print("\n❌ Build failed. Check errors above.")
+            sys.exit(1)
+        report_startup_improvement(platform_info, args.runs)
+        return
+    
     success = create_final_executable()
     
     if success:
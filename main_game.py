@@ -1,41 +1,93 @@
 import pygame
 import sys
-from src.pyuno.core.uno_classes import Game, Player, Card
-from src.pyuno.ui.uno_ui import start_menu, main_game_ui
-
-def initialize_game():
-    # Create game instance
-    game = Game()
-    
-    # Create players
-    players = [
-        Player("Player 1"),
-        Player("Player 2"),
-        Player("Player 3"),
-        Player("Player 4")
-    ]
-    
-    # Add players to game
-    for player in players:
-        game.add_player(player)
-    
+import argparse
+from src.pyuno.core.uno_classes import Game, Player, Card, SEAT_HUMAN, SEAT_AI, SEAT_REMOTE, SEAT_TYPES
+
+# Seat-type table for the default table: one local human against three AIs
+DEFAULT_SEAT_TYPES = [SEAT_HUMAN, SEAT_AI, SEAT_AI, SEAT_AI]
+
+def parse_seat_types(value):
+    """Parse a comma separated seat-type table such as 'human,ai,ai'."""
+    seat_types = [seat.strip().lower() for seat in value.split(',') if seat.strip()]
+    for seat_type in seat_types:
+        if seat_type not in SEAT_TYPES:
+            raise argparse.ArgumentTypeError(f"Invalid seat type: {seat_type}")
+    if len(seat_types) < 2:
+        raise argparse.ArgumentTypeError("Need at least 2 seats")
+    return seat_types
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="PyUNO")
+    parser.add_argument("--seats", type=parse_seat_types, default=None,
+                        help="Comma separated seat types (human, ai; remote needs --connect), e.g. human,ai,ai,ai")
+    parser.add_argument("--players", type=int, default=None,
+                        help="Number of players; seat 1 is human, the rest are AI")
+    parser.add_argument("--connect", metavar="HOST:PORT", default=None,
+                        help="Play as a thin client of a game server instead of locally")
+    parser.add_argument("--table", default=None,
+                        help="Table to join on the server; a new one is created from --seats if omitted")
+    parser.add_argument("--seat", type=int, default=None, help="Seat to take at the server table")
+    parser.add_argument("--record", metavar="PATH", default=None, help="Save a replay of the game to PATH")
+    parser.add_argument("--replay", metavar="PATH", default=None,
+                        help="Watch a recorded game instead of playing (--seat fixes whose hand is shown)")
+    return parser.parse_args(argv)
+
+def connect_remote_game(address, table_id=None, seat=None, seat_types=None):
+    """Join (or create) a table on a game server and return its local mirror."""
+    from src.pyuno.net.client import GameClient, RemoteGame
+    host, _, port = address.rpartition(':')
+    client = GameClient(host or '127.0.0.1', int(port))
+    if seat_types is not None:
+        # Local seats become remote seats on the server
+        seat_types = [SEAT_REMOTE if seat_type == SEAT_HUMAN else seat_type for seat_type in seat_types]
+    return RemoteGame.join(client, table_id, seat, seat_types)
+
+def initialize_game(seat_types=None):
+    # Create game instance with one player per seat
+    if seat_types is None:
+        seat_types = DEFAULT_SEAT_TYPES
+    game = Game.from_seat_types(seat_types)
+
     # Start the game
     game.start_game()
-    
+
     return game
 
 def main():
-    # Initialize Pygame
-    pygame.init()
-    
+    args = parse_args()
+    seat_types = args.seats
+    if seat_types is None and args.players:
+        seat_types = [SEAT_HUMAN] + [SEAT_AI] * (max(args.players, 2) - 1)
+
+    if seat_types and SEAT_REMOTE in seat_types and not args.connect:
+        sys.exit("Remote seats are played through a game server; add --connect HOST:PORT")
+    if args.record and args.connect:
+        sys.exit("--record only works for local games")
+    if args.replay:
+        from src.pyuno.net.replay import Replay
+        from src.pyuno.ui.replay_ui import replay_ui
+        replay_ui(Replay.load(args.replay), args.seat)
+        sys.exit()
+
+    # Imported here so importing this module (e.g. for initialize_game) doesn't load the UI
+    from src.pyuno.ui.uno_ui import start_menu, main_game_ui
+
     # Show start menu
     if start_menu():
         # Initialize game
-        game = initialize_game()
-        
+        if args.connect:
+            game = connect_remote_game(args.connect, args.table, args.seat, seat_types)
+        else:
+            game = initialize_game(seat_types)
+
+        recorder = None
+        if args.record:
+            from src.pyuno.net.replay import ReplayRecorder
+            recorder = ReplayRecorder(game, args.record)
+
         # Start main game UI
-        main_game_ui(game)
-    
+        main_game_ui(game, recorder)
+
     pygame.quit()
     sys.exit()
 
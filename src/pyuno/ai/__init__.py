@@ -0,0 +1,7 @@
+"""
+AI strategies for PyUNO
+"""
+
+from .strategies import Strategy, DefaultStrategy, RandomStrategy, HoarderStrategy, FeatureStrategy, CountingStrategy, EndgameStrategy, STRATEGIES, get_strategy
+
+__all__ = ['Strategy', 'DefaultStrategy', 'RandomStrategy', 'HoarderStrategy', 'FeatureStrategy', 'CountingStrategy', 'EndgameStrategy', 'STRATEGIES', 'get_strategy']
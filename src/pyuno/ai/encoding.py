@@ -0,0 +1,128 @@
+"""
+Fixed-size NumPy encoding of game states and moves for learned policies
+Observations are uint8 vectors of OBS_SIZE values seen from one seat:
+
+    [HAND]        own hand, count per card face (ids 0-53 as in core/cards.py)
+    [TOP]         top card face, one-hot
+    [COLOR]       color to match (the top card's, or the one chosen for a wild), one-hot
+    [PENDING]     cards pending on an active draw stack
+    [STACK]       1 while a draw stack is active
+    [DIRECTION]   1 for clockwise play
+    [CHOOSING]    1 when the decision is a color for a just-played wild
+    [OPPONENTS]   opponents' hand sizes in turn order, next player first, zero padded
+
+Actions are 0-53 play a card face, ACTION_DRAW draw, and
+ACTION_COLOR + 0..3 name red, yellow, green or blue for a wild.
+"""
+
+import numpy as np
+
+from ..core.cards import CARD_IDS, COLORS
+from ..core.uno_classes import Game
+from .features import FACE_VALUE, NUM_FACES, features_for, playable_faces
+
+MAX_OPPONENTS = 9
+
+HAND = slice(0, NUM_FACES)
+TOP = slice(NUM_FACES, 2 * NUM_FACES)
+COLOR = slice(2 * NUM_FACES, 2 * NUM_FACES + len(COLORS))
+PENDING = COLOR.stop
+STACK = PENDING + 1
+DIRECTION = STACK + 1
+CHOOSING = DIRECTION + 1
+OPPONENTS = slice(CHOOSING + 1, CHOOSING + 1 + MAX_OPPONENTS)
+OBS_SIZE = OPPONENTS.stop
+
+ACTION_DRAW = NUM_FACES
+ACTION_COLOR = NUM_FACES + 1
+NUM_ACTIONS = ACTION_COLOR + len(COLORS)
+
+DRAW_VALUES = ("drawtwo", "drawfour")
+
+
+def new_observation(count=None):
+    """Zeroed observation array, or a (count, OBS_SIZE) batch of them."""
+    return np.zeros(OBS_SIZE if count is None else (count, OBS_SIZE), dtype=np.uint8)
+
+
+def new_mask(count=None):
+    return np.zeros(NUM_ACTIONS if count is None else (count, NUM_ACTIONS), dtype=bool)
+
+
+def encode_observation(game: Game, seat: int, out: np.ndarray) -> np.ndarray:
+    """Write seat's view of the game into out (a uint8 array of OBS_SIZE) and return it."""
+    features = features_for(game)
+    out[:] = 0
+    out[HAND] = features.face_counts[seat]
+    top_card = game.deck.get_top_card()
+    if top_card is not None:
+        out[TOP.start + CARD_IDS[top_card.name]] = 1
+        color = game.selected_color if top_card.color == "wild" else top_card.color
+        if color:
+            out[COLOR.start + COLORS.index(color)] = 1
+    out[PENDING] = min(game.draw_cards_pending, 255)
+    out[STACK] = game.draw_stack_active
+    out[DIRECTION] = game.direction == 1
+    out[CHOOSING] = game.waiting_for_color
+    seats = len(game.players)
+    step = game.direction
+    for k in range(1, min(seats, MAX_OPPONENTS + 1)):
+        out[OPPONENTS.start + k - 1] = min(features.hand_sizes[(seat + k * step) % seats], 255)
+    return out
+
+
+def legal_mask(game: Game, seat: int, out: np.ndarray) -> np.ndarray:
+    """
+    Mark the actions seat may take in out (a bool array of NUM_ACTIONS)
+    Drawing is allowed only with nothing playable or an active draw stack,
+    and a draw stack can only be passed on with the same draw card.
+    """
+    out[:] = False
+    if game.waiting_for_color:
+        out[ACTION_COLOR:] = True
+        return out
+    top_card = game.deck.get_top_card()
+    if top_card is None:
+        out[ACTION_DRAW] = True
+        return out
+    counts = features_for(game).face_counts[seat]
+    stack_value = top_card.value if game.draw_stack_active else None
+    playable = False
+    for face in playable_faces(top_card.name, game.selected_color):
+        if counts[face]:
+            value = FACE_VALUE[face]
+            if stack_value and value in DRAW_VALUES and value != stack_value:
+                continue
+            out[face] = True
+            playable = True
+    out[ACTION_DRAW] = game.draw_stack_active or not playable
+    return out
+
+
+def card_action(card) -> int:
+    return CARD_IDS[card.name]
+
+
+def color_action(color: str) -> int:
+    return ACTION_COLOR + COLORS.index(color)
+
+
+def apply_action(game: Game, action: int) -> bool:
+    """
+    Take an action for the current player; returns whether the game accepted it
+    A drawn card that can be played is played at once, as the built-in AI
+    does; a wild then leaves the game waiting for a color action.
+    """
+    player = game.get_current_player()
+    if action >= ACTION_COLOR:
+        return game.select_color(COLORS[action - ACTION_COLOR])
+    if action == ACTION_DRAW:
+        top_card = game.deck.get_top_card()
+        card = game.draw_card(player)
+        if card is not None and top_card is not None and card.can_play_on(top_card, game.selected_color):
+            game.play_card(player, card)
+        return True
+    for card in player.hand:
+        if CARD_IDS[card.name] == action:
+            return game.play_card(player, card)
+    return False
@@ -0,0 +1,285 @@
+"""
+Endgame search for positions with few cards left in hand
+Once the hands add up to a few cards, EndgameSolver looks ahead instead of
+following a heuristic: an expectimax search in which every seat picks the
+move that maximises its own chance of winning (max^n), and a card drawn
+from the deck is a chance event over the faces of a full deck.
+
+Positions are compact tuples (hands as sorted face ids, top face, seat to
+move, direction, pending draw stack), and the rules follow the engine,
+e.g. a resolved wild leaves a zero of its color on top. Draws are
+modelled as coming from a fresh deck, so a position's value doesn't
+depend on the game it came from and solved positions are cached across
+games in a bounded LRU table. Penalty draws of several cards end the
+search there, and are scored by hand sizes like the depth cut-off.
+
+Opponents' hands are hidden, so move_values() deals them a few times from
+the cards the opponent model hasn't seen and picks the move that is best
+on average.
+"""
+
+import random
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Optional, Sequence, Tuple
+
+from ..core.cards import CARD_IDS, COLORS
+from ..core.uno_classes import Game
+from .features import DECK_COUNTS, FACE_COLOR, FACE_VALUE, NUM_FACES, WILD, features_for
+from .opponent_model import DECK_SIZE, model_for
+
+ENDGAME_CARDS = 8  # Search once the hands hold this many cards in total
+LEAF_BASE = 0.5  # A seat's weight at a cut-off is LEAF_BASE ** hand size
+SPARE_VALUES = tuple(str(value) for value in range(1, 10))  # Interchangeable: same rules, same count in a deck
+RESOLVED_WILD = tuple(CARD_IDS[f"{color}_0"] for color in COLORS)  # What the engine leaves on top of a wild
+DRAW = None  # The move when nothing can be played
+EXACT = 1 << 30  # Cached depth of a value that was searched to the end of every line
+
+Move = Optional[Tuple[int, Optional[int]]]  # (face, color index for a wild), or DRAW
+Position = Tuple[Tuple[Tuple[int, ...], ...], int, int, int, int]  # hands, top, seat to move, direction, pending
+
+
+class _OutOfTime(Exception):
+    pass
+
+
+def leaf_values(sizes: Sequence[int]) -> Tuple[float, ...]:
+    """Estimated chances of winning from hand sizes alone."""
+    weights = [LEAF_BASE ** size for size in sizes]
+    total = sum(weights)
+    return tuple(weight / total for weight in weights)
+
+
+def playable(face: int, top: int, pending: int) -> bool:
+    """Whether face can go on top; on a draw stack only the same draw card passes it on."""
+    value = FACE_VALUE[face]
+    if pending and value in ("drawtwo", "drawfour") and value != FACE_VALUE[top]:
+        return False
+    return FACE_COLOR[face] == WILD or FACE_COLOR[face] == FACE_COLOR[top] or value == FACE_VALUE[top]
+
+
+@lru_cache(maxsize=None)
+def draw_chances(unused: Tuple[str, ...]) -> Tuple[Tuple[int, float], ...]:
+    """
+    (face, chance) of drawing each face from a full deck, given the values
+    1-9 that appear nowhere in the position. Those values are interchangeable,
+    so one of them stands for all and takes their combined chance.
+    """
+    chances = []
+    for face, count in enumerate(DECK_COUNTS):
+        value = FACE_VALUE[face]
+        if value in unused:
+            if value != unused[0]:
+                continue
+            count *= len(unused)
+        chances.append((face, count / DECK_SIZE))
+    return tuple(chances)
+
+
+def position_of(game: Game) -> Position:
+    """A game's position with every hand face up."""
+    hands = tuple(tuple(sorted(CARD_IDS[card.name] for card in player.hand)) for player in game.players)
+    pending = game.draw_cards_pending if game.draw_stack_active else 0
+    return hands, CARD_IDS[game.deck.get_top_card().name], game.current_player_index, game.direction, pending
+
+
+def after_play(position: Position, face: int, color: Optional[int] = None):
+    """
+    Position after the seat to move plays face (naming color for a wild)
+    Returns (position, None), or (None, hand sizes) when the play ends in
+    penalty draws of unknown cards.
+    """
+    hands, top, seat, direction, pending = position
+    seats = len(hands)
+    hand = list(hands[seat])
+    hand.remove(face)
+    value = FACE_VALUE[face]
+    # As in the engine, calling UNO passes the turn on before the card takes effect
+    base = (seat + direction) % seats if len(hand) == 1 else seat
+    if hand and pending and value != FACE_VALUE[top]:
+        # Breaking the stack: the pending cards are drawn before the card is played
+        sizes = [len(other) for other in hands]
+        sizes[seat] += pending - 1
+        return None, sizes
+    if hand and value == "drawfour":
+        # The next seat draws four (on top of any stack) and misses its turn
+        sizes = [len(other) for other in hands]
+        sizes[seat] -= 1
+        sizes[(base + direction) % seats] += 4 + pending
+        return None, sizes
+    hands = hands[:seat] + (tuple(hand),) + hands[seat + 1:]
+    top = RESOLVED_WILD[color] if color is not None else face
+    step = 1
+    if value == "skip":
+        step = 2
+    elif value == "reverse":
+        direction = -direction
+        if seats == 2:
+            step = 2
+    elif value == "drawtwo":
+        pending += 2
+    return (hands, top, (base + step * direction) % seats, direction, pending), None
+
+
+class EndgameSolver:
+    def __init__(self, max_cards: int = ENDGAME_CARDS, time_budget: float = 0.05, max_depth: int = 12,
+                 samples: int = 4, cache_size: int = 200_000, seed: Optional[int] = None):
+        self.max_cards = max_cards
+        self.time_budget = time_budget
+        self.max_depth = max_depth
+        self.samples = samples
+        self.cache_size = cache_size
+        self.cache: "OrderedDict[tuple, Tuple[int, Tuple[float, ...]]]" = OrderedDict()
+        self.rng = random.Random(seed)
+        self.nodes = 0
+        self._deadline = 0.0
+        self._cut_off = False
+
+    def applies(self, game: Game) -> bool:
+        return sum(features_for(game).hand_sizes) <= self.max_cards
+
+    def move_values(self, game: Game, seat: int) -> Dict[Move, float]:
+        """Seat's chance of winning after each of its moves, averaged over a few deals of the hidden hands."""
+        _, top, _, direction, pending = position_of(game)
+        deadline = time.perf_counter() + self.time_budget
+        totals: Dict[Move, float] = {}
+        for i in range(self.samples):
+            hands = self.deal(game, seat)
+            budget = (deadline - time.perf_counter()) / (self.samples - i)
+            for move, values in self.solve((hands, top, seat, direction, pending), budget):
+                totals[move] = totals.get(move, 0.0) + values[seat] / self.samples
+        return totals
+
+    def best_move(self, game: Game, seat: int) -> Move:
+        values = self.move_values(game, seat)
+        return max(values, key=values.get)
+
+    def deal(self, game: Game, seat: int) -> Tuple[Tuple[int, ...], ...]:
+        """
+        Seat's own hand and a guess at everyone else's
+        Opponents get cards the opponent model hasn't seen played, avoiding
+        colors they are known to lack while there are enough other cards.
+        """
+        features = features_for(game)
+        model = model_for(game)
+        own = features.face_counts[seat]
+        pool = [face for face in range(NUM_FACES)
+                for _ in range(max(0, DECK_COUNTS[face] - model.seen_faces[face] - own[face]))]
+        self.rng.shuffle(pool)
+        hands = []
+        for other, size in enumerate(features.hand_sizes):
+            if other == seat:
+                hands.append(tuple(face for face in range(NUM_FACES) for _ in range(own[face])))
+                continue
+            lacks = model.lacks_color[other]
+            allowed = [face for face in pool if FACE_COLOR[face] == WILD or not lacks[FACE_COLOR[face]]]
+            hand = (allowed if len(allowed) >= size else pool)[:size]
+            for face in hand:
+                pool.remove(face)
+            hands.append(tuple(sorted(hand)))
+        return tuple(hands)
+
+    def solve(self, position: Position, time_budget: Optional[float] = None):
+        """
+        Values of the moves in a position, deepening until the search is
+        exact or the time budget runs out; returns [(move, values), ...].
+        """
+        self._deadline = time.perf_counter() + (self.time_budget if time_budget is None else time_budget)
+        hands, top, seat, _, pending = position
+        moves = self._moves(hands[seat], top, pending)
+        result = [(move, leaf_values([len(hand) for hand in hands])) for move in moves]
+        for depth in range(1, self.max_depth + 1):
+            self._cut_off = False
+            try:
+                result = [(move, self._after(position, move, depth - 1)) for move in moves]
+            except _OutOfTime:
+                break
+            if not self._cut_off:
+                break  # Every line was searched to its end
+        return result
+
+    def _moves(self, hand, top: int, pending: int):
+        moves = []
+        for face in sorted(set(hand)):
+            if playable(face, top, pending):
+                if FACE_COLOR[face] == WILD:
+                    moves.extend((face, color) for color in range(len(COLORS)))
+                else:
+                    moves.append((face, None))
+        return moves or [DRAW]
+
+    def _search(self, position: Position, depth: int) -> Tuple[float, ...]:
+        hands, top, seat, _, pending = position
+        for winner, hand in enumerate(hands):
+            if not hand:
+                return tuple(1.0 if other == winner else 0.0 for other in range(len(hands)))
+        entry = self.cache.get(position)
+        if entry is not None and entry[0] >= depth:
+            self.cache.move_to_end(position)
+            if entry[0] != EXACT:
+                self._cut_off = True
+            return entry[1]
+        if depth == 0:
+            self._cut_off = True
+            return leaf_values([len(hand) for hand in hands])
+        self.nodes += 1
+        if not self.nodes & 255 and time.perf_counter() > self._deadline:
+            raise _OutOfTime
+        cut_off, self._cut_off = self._cut_off, False
+        best = None
+        for move in self._moves(hands[seat], top, pending):
+            values = self._after(position, move, depth - 1)
+            if best is None or values[seat] > best[seat]:
+                best = values
+        self.cache[position] = (depth if self._cut_off else EXACT, best)
+        self._cut_off |= cut_off
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return best
+
+    def _after(self, position: Position, move: Move, depth: int) -> Tuple[float, ...]:
+        """Value after the seat to move makes move."""
+        if move is DRAW:
+            hands, _, seat, _, pending = position
+            if pending:
+                sizes = [len(hand) for hand in hands]
+                sizes[seat] += pending
+                return leaf_values(sizes)
+            return self._draw(position, depth)
+        position, sizes = after_play(position, *move)
+        if position is None:
+            return leaf_values(sizes)
+        return self._search(position, depth)
+
+    def _draw(self, position: Position, depth: int) -> Tuple[float, ...]:
+        """Chance node: the seat to move draws one card and plays it at once if it can."""
+        hands, top, seat, direction, _ = position
+        expected = [0.0] * len(hands)
+        next_seat = (seat + direction) % len(hands)
+        used = {FACE_VALUE[top]}
+        for hand in hands:
+            used.update(FACE_VALUE[face] for face in hand)
+        for face, chance in draw_chances(tuple(value for value in SPARE_VALUES if value not in used)):
+            drawn = hands[:seat] + (tuple(sorted(hands[seat] + (face,))),) + hands[seat + 1:]
+            if not playable(face, top, 0):
+                values = self._search((drawn, top, next_seat, direction, 0), depth)
+            elif FACE_COLOR[face] == WILD:
+                values = max((self._after((drawn, top, seat, direction, 0), (face, color), depth)
+                              for color in range(len(COLORS))), key=lambda values: values[seat])
+            else:
+                values = self._after((drawn, top, seat, direction, 0), (face, None), depth)
+            for other, value in enumerate(values):
+                expected[other] += chance * value
+        return tuple(expected)
+
+
+_shared: Optional[EndgameSolver] = None
+
+
+def shared_solver() -> EndgameSolver:
+    """One solver per process, so its cache of solved positions carries over between games."""
+    global _shared
+    if _shared is None:
+        _shared = EndgameSolver()
+    return _shared
@@ -0,0 +1,100 @@
+"""
+Incrementally maintained hand features for AI decisions
+HandFeatures follows a game through its listener events and keeps, for
+every seat, per-face, per-color, action and wild counts plus hand sizes,
+and the colors seen on the discard pile since the last reshuffle. Each
+card movement costs O(1), so reading the features never scans a hand or
+the discard pile. Card faces use the 0-53 ids from core/cards.py.
+"""
+
+from functools import lru_cache
+from typing import Optional, Tuple
+from weakref import WeakKeyDictionary
+
+from ..core.cards import CARD_IDS, CARD_NAMES, COLORS, card_from_id
+from ..core.uno_classes import Card, Game
+
+NUM_FACES = len(CARD_NAMES)
+WILD = -1
+
+FACE_COLOR = tuple(COLORS.index(name.split("_")[0]) if not name.startswith("wild") else WILD for name in CARD_NAMES)
+FACE_VALUE = tuple(name.split("_", 1)[1] for name in CARD_NAMES)
+ACTION_VALUES = ("skip", "reverse", "drawtwo")
+
+# Copies of each face in a full deck, and of each color
+DECK_COUNTS = tuple(4 if color == WILD else 1 if value == "0" else 2 for color, value in zip(FACE_COLOR, FACE_VALUE))
+COLOR_TOTAL = sum(count for color, count in zip(FACE_COLOR, DECK_COUNTS) if color == 0)
+
+
+@lru_cache(maxsize=None)
+def playable_faces(top_name: str, selected_color: Optional[str]) -> Tuple[int, ...]:
+    """Faces that can be played on a top card, from a table filled on first use."""
+    top = Card(*top_name.split("_", 1))
+    return tuple(face for face in range(NUM_FACES) if card_from_id(face).can_play_on(top, selected_color))
+
+
+class HandFeatures:
+    def __init__(self, game: Game):
+        """Scan the game once; from then on the game's card events keep the counts current."""
+        seats = len(game.players)
+        self.face_counts = [[0] * NUM_FACES for _ in range(seats)]
+        self.color_counts = [[0] * len(COLORS) for _ in range(seats)]
+        self.action_counts = [0] * seats
+        self.wild_counts = [0] * seats
+        self.hand_sizes = [0] * seats
+        self.seen_colors = [0] * len(COLORS)  # Colored cards played since the last reshuffle
+        self._top = game.deck.get_top_card()
+        for seat, player in enumerate(game.players):
+            for card in player.hand:
+                self._add(seat, card)
+        for card in game.deck.discard_pile:
+            self._see(card)
+        game.add_listener(self.on_event)
+
+    def on_event(self, event: str, *args):
+        if event == "draw":
+            self._add(*args)
+        elif event == "play":
+            seat, card = args
+            self._add(seat, card, -1)
+            self._see(card)
+            self._top = card
+        elif event == "reshuffle":
+            # Everything below the top card went back into the deck
+            self.seen_colors = [0] * len(COLORS)
+            if self._top is not None:
+                self._see(self._top)
+
+    def _add(self, seat: int, card: Card, delta: int = 1):
+        face = CARD_IDS[card.name]
+        self.face_counts[seat][face] += delta
+        self.hand_sizes[seat] += delta
+        color = FACE_COLOR[face]
+        if color == WILD:
+            self.wild_counts[seat] += delta
+        else:
+            self.color_counts[seat][color] += delta
+            if FACE_VALUE[face] in ACTION_VALUES:
+                self.action_counts[seat] += delta
+
+    def _see(self, card: Card):
+        color = FACE_COLOR[CARD_IDS[card.name]]
+        if color != WILD:
+            self.seen_colors[color] += 1
+
+    def unseen(self, seat: int, color: int) -> int:
+        """Cards of a color that seat has not seen: neither in its hand nor played since the last reshuffle."""
+        return max(0, COLOR_TOTAL - self.seen_colors[color] - self.color_counts[seat][color])
+
+
+_features: "WeakKeyDictionary[Game, HandFeatures]" = WeakKeyDictionary()
+
+
+def features_for(game: Game) -> HandFeatures:
+    """The game's HandFeatures, created (and attached to the game) on first use."""
+    features = _features.get(game)
+    if features is None or len(features.hand_sizes) != len(game.players):
+        if features is not None:
+            game.remove_listener(features.on_event)
+        features = _features[game] = HandFeatures(game)
+    return features
@@ -0,0 +1,91 @@
+"""
+Card-counting opponent model
+OpponentModel follows a game's listener events and keeps running counts
+of the cards seen on the discard pile, every seat's hand size and, per
+seat, the colors it is known not to hold: a seat that draws on its turn
+instead of playing ("forced_draw") had nothing in the color to match,
+until it picks up more cards. Every event is O(1), so the model never
+rescans the discard pile, which can hold 100+ cards.
+"""
+
+from weakref import WeakKeyDictionary
+
+from ..core.cards import CARD_IDS, COLORS
+from ..core.uno_classes import Card, Game
+from .features import FACE_COLOR, NUM_FACES, WILD, COLOR_TOTAL
+
+DECK_SIZE = 108
+
+
+class OpponentModel:
+    def __init__(self, game: Game):
+        """Read the public state once; the game's events keep the model current from then on."""
+        seats = len(game.players)
+        self.seen_faces = [0] * NUM_FACES  # Played since the last reshuffle
+        self.seen_colors = [0] * len(COLORS)
+        self.seen_total = 0
+        self.hand_sizes = [len(player.hand) for player in game.players]
+        self.lacks_color = [[False] * len(COLORS) for _ in range(seats)]
+        self._top = game.deck.get_top_card()
+        for card in game.deck.discard_pile:
+            self._see(card)
+        game.add_listener(self.on_event)
+
+    def on_event(self, event: str, *args):
+        if event == "draw":
+            seat = args[0]
+            self.hand_sizes[seat] += 1
+            # The new card may be of any color
+            flags = self.lacks_color[seat]
+            flags[0] = flags[1] = flags[2] = flags[3] = False
+        elif event == "play":
+            seat, card = args
+            self.hand_sizes[seat] -= 1
+            self._see(card)
+            self._top = card
+        elif event == "forced_draw":
+            seat, color = args
+            self.lacks_color[seat][COLORS.index(color)] = True
+        elif event == "reshuffle":
+            self.seen_faces = [0] * NUM_FACES
+            self.seen_colors = [0] * len(COLORS)
+            self.seen_total = 0
+            if self._top is not None:
+                self._see(self._top)
+
+    def _see(self, card: Card):
+        face = CARD_IDS[card.name]
+        self.seen_faces[face] += 1
+        self.seen_total += 1
+        color = FACE_COLOR[face]
+        if color != WILD:
+            self.seen_colors[color] += 1
+
+    def color_probability(self, seat: int, color: int, own_color_count: int = 0, own_hand_size: int = 0) -> float:
+        """
+        Chance that seat holds at least one card of a color
+        Zero when the seat is known to lack it; otherwise each of its cards
+        is treated as an independent draw from the cards the viewer has not
+        seen (not played since the last reshuffle and not in the viewer's
+        own hand, given by own_color_count and own_hand_size).
+        """
+        if self.lacks_color[seat][color]:
+            return 0.0
+        unknown = DECK_SIZE - self.seen_total - own_hand_size
+        remaining = COLOR_TOTAL - self.seen_colors[color] - own_color_count
+        if unknown <= 0 or remaining <= 0:
+            return 0.0
+        return 1.0 - (1.0 - min(1.0, remaining / unknown)) ** self.hand_sizes[seat]
+
+
+_models: "WeakKeyDictionary[Game, OpponentModel]" = WeakKeyDictionary()
+
+
+def model_for(game: Game) -> OpponentModel:
+    """The game's OpponentModel, created (and attached to the game) on first use."""
+    model = _models.get(game)
+    if model is None or len(model.hand_sizes) != len(game.players):
+        if model is not None:
+            game.remove_listener(model.on_event)
+        model = _models[game] = OpponentModel(game)
+    return model
@@ -0,0 +1,143 @@
+"""
+Learned policies evaluated with NumPy on the CPU
+MLPPolicy is a small multilayer perceptron (ReLU hidden layers) over the
+observations from encoding.py, scoring all NUM_ACTIONS actions. Weights
+come from an .npz file holding w0, b0, w1, b1, ... for each layer.
+
+PolicyBatcher collects decision requests from many games into
+preallocated arrays and answers them all with one forward pass, which is
+what makes a policy affordable across thousands of tables; see
+sim/batched.py. PolicyStrategy plugs a policy into a single seat the
+ordinary way, one forward pass per decision.
+"""
+
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from ..core.cards import CARD_IDS, COLORS
+from ..core.uno_classes import Game
+from .encoding import (OBS_SIZE, NUM_ACTIONS, ACTION_DRAW, ACTION_COLOR, encode_observation, legal_mask, new_mask,
+                       new_observation)
+from .strategies import Strategy
+
+
+class MLPPolicy:
+    def __init__(self, weights: Sequence[np.ndarray], biases: Sequence[np.ndarray]):
+        if not weights or len(weights) != len(biases):
+            raise ValueError("A policy needs one bias per weight matrix")
+        if weights[0].shape[0] != OBS_SIZE or weights[-1].shape[1] != NUM_ACTIONS:
+            raise ValueError(f"Policy must map {OBS_SIZE} inputs to {NUM_ACTIONS} actions")
+        for weight, bias, following in zip(weights, biases, list(weights[1:]) + [None]):
+            if bias.shape != (weight.shape[1],) or (following is not None and following.shape[0] != weight.shape[1]):
+                raise ValueError("Policy layer shapes don't line up")
+        self.weights = [np.asarray(weight, dtype=np.float32) for weight in weights]
+        self.biases = [np.asarray(bias, dtype=np.float32) for bias in biases]
+
+    @classmethod
+    def load(cls, path: str) -> "MLPPolicy":
+        with np.load(path) as data:
+            layers = sum(1 for key in data.files if key.startswith("w"))
+            return cls([data[f"w{i}"] for i in range(layers)], [data[f"b{i}"] for i in range(layers)])
+
+    def save(self, path: str):
+        arrays = {}
+        for i, (weight, bias) in enumerate(zip(self.weights, self.biases)):
+            arrays[f"w{i}"] = weight
+            arrays[f"b{i}"] = bias
+        np.savez(path, **arrays)
+
+    @classmethod
+    def random(cls, hidden: Sequence[int] = (128,), seed: Optional[int] = None) -> "MLPPolicy":
+        """An untrained policy with He-initialised weights, e.g. as a starting point or for benchmarks."""
+        rng = np.random.default_rng(seed)
+        sizes = [OBS_SIZE, *hidden, NUM_ACTIONS]
+        weights = [rng.standard_normal((n_in, n_out)).astype(np.float32) * np.sqrt(2.0 / n_in)
+                   for n_in, n_out in zip(sizes, sizes[1:])]
+        return cls(weights, [np.zeros(n_out, dtype=np.float32) for n_out in sizes[1:]])
+
+    def logits(self, obs: np.ndarray) -> np.ndarray:
+        """Action scores for a (batch, OBS_SIZE) array of observations."""
+        x = obs.astype(np.float32)
+        last = len(self.weights) - 1
+        for i, (weight, bias) in enumerate(zip(self.weights, self.biases)):
+            x = x @ weight
+            x += bias
+            if i < last:
+                np.maximum(x, 0.0, out=x)
+        return x
+
+    def act(self, obs: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        """The best legal action for each row."""
+        logits = self.logits(obs)
+        logits[~mask] = -np.inf
+        return logits.argmax(axis=1)
+
+
+class PolicyBatcher:
+    """
+    Queues decisions from many games and evaluates them together
+    submit() encodes a seat's view into the next row of preallocated
+    arrays; evaluate() runs one forward pass over every queued row and
+    returns the chosen actions in submission order.
+    """
+
+    def __init__(self, policy: MLPPolicy, capacity: int = 1024):
+        self.policy = policy
+        self.obs = new_observation(capacity)
+        self.mask = new_mask(capacity)
+        self.pending = 0
+        self.batches = 0
+        self.decisions = 0
+
+    def submit(self, game: Game, seat: int) -> int:
+        if self.pending == len(self.obs):
+            # Grow rather than fail; the arrays are reused from then on
+            self.obs = np.concatenate([self.obs, new_observation(len(self.obs))])
+            self.mask = np.concatenate([self.mask, new_mask(len(self.mask))])
+        row = self.pending
+        encode_observation(game, seat, self.obs[row])
+        legal_mask(game, seat, self.mask[row])
+        self.pending += 1
+        return row
+
+    def evaluate(self) -> np.ndarray:
+        count, self.pending = self.pending, 0
+        if not count:
+            return np.empty(0, dtype=np.int64)
+        self.batches += 1
+        self.decisions += count
+        return self.policy.act(self.obs[:count], self.mask[:count])
+
+
+class PolicyStrategy(Strategy):
+    """Plays one seat with a policy, one forward pass per decision."""
+
+    name = "policy"
+
+    def __init__(self, policy: MLPPolicy):
+        self.policy = policy
+        self._obs = new_observation(1)
+        self._mask = new_mask(1)
+
+    def _act(self, game: Game, player) -> int:
+        seat = game.players.index(player)
+        encode_observation(game, seat, self._obs[0])
+        legal_mask(game, seat, self._mask[0])
+        if game.waiting_for_color:
+            return int(self.policy.act(self._obs, self._mask)[0])
+        # The game only asks when a card will be played, so drawing isn't an option here
+        self._mask[0, ACTION_DRAW] = False
+        if not self._mask.any():
+            return -1
+        return int(self.policy.act(self._obs, self._mask)[0])
+
+    def choose_card(self, game: Game, player, playable_cards: List):
+        action = self._act(game, player)
+        for card in playable_cards:
+            if CARD_IDS[card.name] == action:
+                return card
+        return playable_cards[0]
+
+    def choose_color(self, game: Game, player) -> str:
+        return COLORS[self._act(game, player) - ACTION_COLOR]
@@ -0,0 +1,229 @@
+"""
+Pluggable AI strategies for PyUNO
+Assign a strategy to a seat with player.strategy = SomeStrategy(); the
+Game asks it for a card whenever that seat has playable cards and for a
+color whenever it plays a wild.
+"""
+
+from typing import Dict, List, Optional, Type
+
+from ..core.cards import CARD_IDS, COLORS as FACE_COLORS
+from ..core.uno_classes import Card, Game, Player
+from .features import FACE_COLOR, FACE_VALUE, WILD, features_for, playable_faces
+from .opponent_model import model_for
+from .endgame import DRAW, EndgameSolver, shared_solver
+
+COLORS = ["red", "yellow", "green", "blue"]
+ACTION_VALUES = ("drawfour", "drawtwo", "skip", "reverse")
+
+
+class Strategy:
+    """Base class for AI strategies."""
+
+    name = "base"
+
+    def choose_card(self, game: Game, player: Player, playable_cards: List[Card]) -> Card:
+        """Pick one of the playable cards (never empty)."""
+        raise NotImplementedError
+
+    def choose_color(self, game: Game, player: Player) -> str:
+        """Pick the color for a wild card that was just played."""
+        return most_common_color(player)
+
+
+def most_common_color(player: Player) -> str:
+    color_counts = {"red": 0, "yellow": 0, "green": 0, "blue": 0}
+    for card in player.hand:
+        if card.color != "wild":
+            color_counts[card.color] += 1
+    return max(color_counts.items(), key=lambda x: x[1])[0]
+
+
+class DefaultStrategy(Strategy):
+    """The Game's built-in play: action cards first, otherwise a random card."""
+
+    name = "default"
+
+    def choose_card(self, game: Game, player: Player, playable_cards: List[Card]) -> Card:
+        return game._choose_best_card(playable_cards, game.draw_stack_active)
+
+    def choose_color(self, game: Game, player: Player) -> str:
+        return game._choose_best_color(player)
+
+
+class RandomStrategy(Strategy):
+    """Plays a random playable card and names a random color."""
+
+    name = "random"
+
+    def choose_card(self, game: Game, player: Player, playable_cards: List[Card]) -> Card:
+        return game.rng.choice(playable_cards)
+
+    def choose_color(self, game: Game, player: Player) -> str:
+        return game.rng.choice(COLORS)
+
+
+class HoarderStrategy(Strategy):
+    """Sheds number cards first and keeps action and wild cards for later."""
+
+    name = "hoarder"
+
+    def choose_card(self, game: Game, player: Player, playable_cards: List[Card]) -> Card:
+        if game.draw_stack_active:
+            for card in playable_cards:
+                if card.value in ("drawtwo", "drawfour"):
+                    return card
+        numbers = [card for card in playable_cards if card.value.isdigit()]
+        if numbers:
+            # Highest number first, from the color we hold most of
+            color = most_common_color(player)
+            return max(numbers, key=lambda card: (card.color == color, int(card.value)))
+        actions = [card for card in playable_cards if card.color != "wild"]
+        return actions[0] if actions else playable_cards[0]
+
+
+# Linear model weights for FeatureStrategy
+FACE_WEIGHTS = {"skip": 0.8, "reverse": 0.8, "drawtwo": 1.0, "standard": -1.5, "drawfour": -1.0}
+NUMBER_WEIGHT = 0.05  # Per pip: shed high numbers first
+SAME_COLOR_WEIGHT = 0.3  # Per card kept in the played color, so the next turn can follow
+UNSEEN_WEIGHT = -0.1  # Per unseen card of the played color, i.e. how easily opponents follow
+ATTACK_WEIGHT = 3.0  # For skip/draw cards when the next player is close to winning
+ATTACK_HAND_SIZE = 2
+ATTACK_VALUES = ("skip", "drawtwo", "drawfour")
+
+
+class FeatureStrategy(Strategy):
+    """
+    Scores each distinct playable card face with a small linear model over
+    incrementally maintained features (see features.py): card kind, how
+    many cards of the color are kept, unseen cards of that color and the
+    next player's hand size. The loop runs over card faces, at most 54,
+    so a decision costs the same whatever the hand size.
+    """
+
+    name = "features"
+
+    def choose_card(self, game: Game, player: Player, playable_cards: List[Card]) -> Card:
+        features = features_for(game)
+        seat = game.current_player_index
+        counts = features.face_counts[seat]
+        colors = features.color_counts[seat]
+        top_card = game.deck.get_top_card()
+        threatened = features.hand_sizes[game.turn_order.peek()] <= ATTACK_HAND_SIZE
+        stack_value = top_card.value if game.draw_stack_active else None
+
+        best_face, best_score = -1, None
+        for face in playable_faces(top_card.name, game.selected_color):
+            if not counts[face]:
+                continue
+            value = FACE_VALUE[face]
+            if stack_value and value in ("drawtwo", "drawfour") and value != stack_value:
+                continue  # Can't stack one draw type on the other
+            score = FACE_WEIGHTS.get(value, NUMBER_WEIGHT * int(value) if value.isdigit() else 0.0)
+            color = FACE_COLOR[face]
+            if color != WILD:
+                score += SAME_COLOR_WEIGHT * (colors[color] - 1) + self.color_score(game, features, seat, color, 1)
+            if threatened and value in ATTACK_VALUES:
+                score += ATTACK_WEIGHT
+            if stack_value and value == stack_value:
+                score += 10.0  # Passing the stack on beats drawing it
+            if best_score is None or score > best_score:
+                best_face, best_score = face, score
+
+        for card in playable_cards:
+            if CARD_IDS[card.name] == best_face:
+                return card
+        return playable_cards[0]
+
+    def choose_color(self, game: Game, player: Player) -> str:
+        features = features_for(game)
+        seat = game.players.index(player)
+        colors = features.color_counts[seat]
+        best = max(range(len(FACE_COLORS)),
+                   key=lambda color: colors[color] + self.color_score(game, features, seat, color, 0))
+        return FACE_COLORS[best]
+
+    def color_score(self, game: Game, features, seat: int, color: int, played: int) -> float:
+        """How good it is to leave color on top for the next player; played is 1 if the card leaves our hand."""
+        return UNSEEN_WEIGHT * features.unseen(seat, color)
+
+
+FOLLOW_WEIGHT = -2.0  # Times the chance that the next player can follow the color
+
+
+class CountingStrategy(FeatureStrategy):
+    """
+    FeatureStrategy that counts cards: it prefers leaving a color the next
+    player probably can't follow, using the opponent model's seen-card
+    counts and the colors that player was seen drawing on.
+    """
+
+    name = "counting"
+
+    def color_score(self, game: Game, features, seat: int, color: int, played: int) -> float:
+        model = model_for(game)
+        next_seat = game.turn_order.peek()
+        own_colors = features.color_counts[seat][color] - played
+        return FOLLOW_WEIGHT * model.color_probability(next_seat, color, own_colors, features.hand_sizes[seat] - played)
+
+
+SOLVER_MARGIN = 0.2  # How much better the solver's move must look to overrule the heuristic
+
+
+class EndgameStrategy(CountingStrategy):
+    """
+    CountingStrategy that consults a search once few cards are left in hand
+    (see endgame.py) and plays its move when it wins clearly more often
+    than the heuristic's. The solver's cache is shared by every instance in
+    the process unless a solver is passed in.
+    """
+
+    name = "endgame"
+
+    def __init__(self, solver: Optional[EndgameSolver] = None):
+        self.solver = solver if solver is not None else shared_solver()
+        self._values: Dict = {}  # Solver's move values, kept for the color when a wild is chosen
+
+    def choose_card(self, game: Game, player: Player, playable_cards: List[Card]) -> Card:
+        card = super().choose_card(game, player, playable_cards)
+        self._values = {}
+        if not self.solver.applies(game):
+            return card
+        values = self.solver.move_values(game, game.players.index(player))
+        baseline = max((value for move, value in values.items() if move is not DRAW and move[0] == CARD_IDS[card.name]),
+                       default=0.0)
+        best = max(values, key=values.get)
+        if best is not DRAW and values[best] > baseline + SOLVER_MARGIN:
+            card = next(other for other in playable_cards if CARD_IDS[other.name] == best[0])
+        if card.color == "wild":
+            self._values = values
+        return card
+
+    def choose_color(self, game: Game, player: Player) -> str:
+        color = super().choose_color(game, player)
+        values, self._values = self._values, {}
+        face = CARD_IDS[game.deck.get_top_card().name]
+        options = {move[1]: value for move, value in values.items() if move is not DRAW and move[0] == face}
+        if options:
+            best = max(options, key=options.get)
+            if options[best] > options[FACE_COLORS.index(color)] + SOLVER_MARGIN:
+                return FACE_COLORS[best]
+        return color
+
+
+STRATEGIES: Dict[str, Type[Strategy]] = {
+    DefaultStrategy.name: DefaultStrategy,
+    RandomStrategy.name: RandomStrategy,
+    HoarderStrategy.name: HoarderStrategy,
+    FeatureStrategy.name: FeatureStrategy,
+    CountingStrategy.name: CountingStrategy,
+    EndgameStrategy.name: EndgameStrategy,
+}
+
+
+def get_strategy(name: str) -> Strategy:
+    """Create a registered strategy by name."""
+    try:
+        return STRATEGIES[name]()
+    except KeyError:
+        raise ValueError(f"Unknown strategy: {name}")
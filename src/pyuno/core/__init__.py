@@ -2,6 +2,9 @@
 Core game logic for PyUNO
 """
 
-from .uno_classes import Card, Deck, Player, Game
+from .uno_classes import Card, Deck, Player, Game, SEAT_HUMAN, SEAT_AI, SEAT_REMOTE, SEAT_TYPES
+from .turn_order import TurnOrder
+from .cards import CARD_NAMES, CARD_IDS, card_id, card_from_id
 
-__all__ = ['Card', 'Deck', 'Player', 'Game'] 
\ No newline at end of file
+__all__ = ['Card', 'Deck', 'Player', 'Game', 'TurnOrder', 'SEAT_HUMAN', 'SEAT_AI', 'SEAT_REMOTE', 'SEAT_TYPES',
+           'CARD_NAMES', 'CARD_IDS', 'card_id', 'card_from_id'] 
\ No newline at end of file
@@ -0,0 +1,23 @@
+"""
+Card face ids shared by the wire format, replays and the AI
+Every distinct card face gets a one-byte id, 0-53: the four colors'
+0-9, skip, reverse and drawtwo in COLORS order, then the two wilds.
+"""
+
+from .uno_classes import Card
+
+COLORS = ["red", "yellow", "green", "blue"]
+
+CARD_NAMES = ([f"{color}_{value}" for color in COLORS
+               for value in ["0", "1", "2", "3", "4", "5", "6", "7", "8", "9", "skip", "reverse", "drawtwo"]]
+              + ["wild_standard", "wild_drawfour"])
+CARD_IDS = {name: i for i, name in enumerate(CARD_NAMES)}
+_CARDS = [Card(*name.split("_", 1)) for name in CARD_NAMES]
+
+
+def card_id(card: Card) -> int:
+    return CARD_IDS[card.name]
+
+
+def card_from_id(card_id: int) -> Card:
+    return _CARDS[card_id]
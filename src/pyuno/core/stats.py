@@ -0,0 +1,161 @@
+"""
+Counters and timers for the rules engine
+Game.enable_stats() wraps the game's play_card, draw_card, select_color,
+handle_ai_turn and playability checks on that one instance, so a game
+without stats runs exactly the same code as before and games running
+side by side are counted apart. The figures can be written out in the
+Prometheus text format, e.g. for node_exporter's textfile collector.
+"""
+
+import os
+import time
+from typing import Dict, Optional
+
+TIMED_METHODS = ("play_card", "draw_card", "select_color", "handle_ai_turn")
+DRAW_STACK_BUCKETS = (2, 4, 6, 8, 12, 16)
+
+class Timer:
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+
+class GameStats:
+    """
+    Call counts and times (inclusive: handle_ai_turn contains the
+    play_card it makes), reshuffles, cards drawn, the lengths of draw
+    stacks when they are paid off and the Card.can_play_on checks the game
+makes.
+    One GameStats can be attached to many games in turn to total a whole simulation.
+    """
+
+    def __init__(self):
+        self.timers: Dict[str, Timer] = {name: Timer() for name in TIMED_METHODS}
+        self.reshuffles = 0
+        self.cards_drawn = 0
+        self.draw_stack_counts = [0] * (len(DRAW_STACK_BUCKETS) + 1)  # Last slot is +Inf
+        self.draw_stack_total = 0
+        self.can_play_on_calls = 0
+        self._game = None
+        self._depth = 0
+
+    def attach(self, game):
+        if self._game is not None:
+            self.detach()
+        self._game = game
+        for name in TIMED_METHODS:
+            setattr(game, name, self._timed(name, getattr(game, name)))
+        game._can_play = self._counted_can_play(game._can_play)
+        game._playable_cards = self._counted_playable_cards(game._playable_cards)
+        game.add_listener(self._on_event)
+
+    def detach(self):
+        game = self._game
+        if game is None:
+            return
+        for name in TIMED_METHODS + ("_can_play", "_playable_cards"):
+            delattr(game, name)  # The class method shows through again
+        game.remove_listener(self._on_event)
+        self._game = None
+
+    def _counted_can_play(self, method):
+        def counted(card, top_card):
+            self.can_play_on_calls += 1
+            return method(card, top_card)
+        return counted
+
+    def _counted_playable_cards(self, method):
+        def counted(player, top_card):
+            self.can_play_on_calls += len(player.hand)
+            return method(player, top_card)
+        return counted
+
+    def _timed(self, name, method):
+        timer = self.timers[name]
+        game = self._game
+
+        def timed(*args):
+            outermost = self._depth == 0
+            pending = game.draw_cards_pending if outermost and game.draw_stack_active else 0
+            self._depth += 1
+            start = time.perf_counter()
+            try:
+                return method(*args)
+            finally:
+                timer.record(time.perf_counter() - start)
+                self._depth -= 1
+                if pending and not game.draw_stack_active:
+                    self.record_draw_stack(pending)
+        return timed
+
+    def _on_event(self, event, *args):
+        if event == "draw":
+            self.cards_drawn += 1
+        elif event == "reshuffle":
+            self.reshuffles += 1
+
+    def record_draw_stack(self, length: int):
+        for i, bound in enumerate(DRAW_STACK_BUCKETS):
+            if length <= bound:
+                self.draw_stack_counts[i] += 1
+                break
+        else:
+            self.draw_stack_counts[-1] += 1
+        self.draw_stack_total += length
+
+    def summary(self) -> dict:
+        return {
+            "calls": {name: {"count": t.count, "total_ms": round(t.total * 1000, 3),
+                             "max_ms": round(t.max * 1000, 3)} for name, t in self.timers.items()},
+            "reshuffles": self.reshuffles,
+            "cards_drawn": self.cards_drawn,
+            "draw_stacks": sum(self.draw_stack_counts),
+            "draw_stack_cards": self.draw_stack_total,
+            "can_play_on_calls": self.can_play_on_calls,
+        }
+
+    def to_prometheus(self, labels: Optional[Dict[str, str]] = None) -> str:
+        """The figures in the Prometheus text exposition format; labels are added to every series."""
+        base = ",".join(f'{key}="{value}"' for key, value in (labels or {}).items())
+
+        def series(name, value, **extra):
+            pairs = [base] if base else []
+            pairs += [f'{key}="{label}"' for key, label in extra.items()]
+            return f"{name}{{{','.join(pairs)}}} {value}" if pairs else f"{name} {value}"
+
+        lines = ["# HELP pyuno_game_call_seconds Time spent in Game methods",
+                 "# TYPE pyuno_game_call_seconds summary"]
+        for name, timer in self.timers.items():
+            lines.append(series("pyuno_game_call_seconds_sum", repr(timer.total), method=name))
+            lines.append(series("pyuno_game_call_seconds_count", timer.count, method=name))
+        lines += ["# HELP pyuno_game_call_seconds_max Longest single call",
+                  "# TYPE pyuno_game_call_seconds_max gauge"]
+        for name, timer in self.timers.items():
+            lines.append(series("pyuno_game_call_seconds_max", repr(timer.max), method=name))
+        for name, value, help_text in (
+                ("pyuno_reshuffles_total", self.reshuffles, "Discard pile reshuffles into the deck"),
+                ("pyuno_cards_drawn_total", self.cards_drawn, "Cards moved from the deck to a hand"),
+                ("pyuno_can_play_on_calls_total", self.can_play_on_calls, "Card.can_play_on checks made by the game")):
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter", series(name, value)]
+        lines += ["# HELP pyuno_draw_stack_length Cards drawn when a draw stack is paid off",
+                  "# TYPE pyuno_draw_stack_length histogram"]
+        cumulative = 0
+        for bound, count in zip(DRAW_STACK_BUCKETS + ("+Inf",), self.draw_stack_counts):
+            cumulative += count
+            lines.append(series("pyuno_draw_stack_length_bucket", cumulative, le=bound))
+        lines.append(series("pyuno_draw_stack_length_sum", self.draw_stack_total))
+        lines.append(series("pyuno_draw_stack_length_count", cumulative))
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str, labels: Optional[Dict[str, str]] = None):
+        """Write the figures to path, replacing it atomically so scrapers never see half a file."""
+        with open(path + ".tmp", "w") as f:
+            f.write(self.to_prometheus(labels))
+        os.replace(path + ".tmp", path)
@@ -0,0 +1,46 @@
+"""
+Turn scheduling for PyUNO tables of any size
+"""
+
+from typing import List, Tuple
+
+
+class TurnOrder:
+    """Tracks whose turn it is and in which direction play moves.
+
+    Successor tables for both directions are precomputed whenever the
+    number of seats changes, so advancing one seat or skipping one seat
+    is a single list lookup instead of modular arithmetic.
+    """
+
+    def __init__(self, num_seats: int = 0):
+        self.index = 0
+        self.direction = 1  # 1 for clockwise, -1 for counterclockwise
+        self.num_seats = 0
+        # (one step, two steps) successor tables for each direction
+        self._forward: Tuple[List[int], List[int]] = ([], [])
+        self._backward: Tuple[List[int], List[int]] = ([], [])
+        self.resize(num_seats)
+
+    def resize(self, num_seats: int):
+        """Rebuild the successor tables for a table with num_seats seats."""
+        self.num_seats = num_seats
+        seats = range(num_seats)
+        self._forward = ([(i + 1) % num_seats for i in seats], [(i + 2) % num_seats for i in seats])
+        self._backward = ([(i - 1) % num_seats for i in seats], [(i - 2) % num_seats for i in seats])
+        if num_seats and self.index >= num_seats:
+            self.index %= num_seats
+
+    def peek(self, skip: bool = False) -> int:
+        """Index of the seat that would play next, without advancing."""
+        tables = self._forward if self.direction == 1 else self._backward
+        return tables[skip][self.index]
+
+    def advance(self, skip: bool = False) -> int:
+        """Move to the next seat (jumping one seat if skip is set) and return it."""
+        tables = self._forward if self.direction == 1 else self._backward
+        self.index = tables[skip][self.index]
+        return self.index
+
+    def reverse(self):
+        self.direction = -self.direction
@@ -1,6 +1,13 @@
 import random
-from typing import List, Optional
+from typing import Callable, List, Optional, Sequence
 import time
+from .turn_order import TurnOrder
+
+# Seat types describe who controls a player's turns
+SEAT_HUMAN = "human"    # Local player using the pygame UI
+SEAT_AI = "ai"          # Played automatically by handle_ai_turn
+SEAT_REMOTE = "remote"  # Controlled by a client connected over the network
+SEAT_TYPES = (SEAT_HUMAN, SEAT_AI, SEAT_REMOTE)
 
 class Card:
     VALID_COLORS = ["red", "yellow", "green", "blue", "wild"]
@@ -48,9 +55,12 @@ class Card:
         return result
 
 class Deck:
-    def __init__(self):
+    def __init__(self, rng=None):
+        # Anything with shuffle()/choice(), e.g. random.Random(seed) for reproducible games
+        self.rng = rng if rng is not None else random
         self.cards: List[Card] = []
         self.discard_pile: List[Card] = []
+        self.reshuffle_count = 0  # How many times the discard pile went back into the deck
         self._initialize_deck()
 
     def _initialize_deck(self):
@@ -70,7 +80,7 @@ class Deck:
             self.cards.append(Card("wild", "drawfour"))
 
     def shuffle(self):
-        random.shuffle(self.cards)
+        self.rng.shuffle(self.cards)
 
     def draw_card(self) -> Optional[Card]:
         if not self.cards:
@@ -83,6 +93,7 @@ class Deck:
             self.cards = self.discard_pile.copy()
             self.discard_pile = [top_card]
             self.shuffle()
+            self.reshuffle_count += 1
         # If only one card in discard pile, we can't reshuffle
         # This should rarely happen as cards are constantly being played
 
@@ -93,8 +104,12 @@ class Deck:
         return self.discard_pile[-1] if self.discard_pile else None
 
 class Player:
-    def __init__(self, name: str):
+    def __init__(self, name: str, seat_type: Optional[str] = None):
+        if seat_type is not None and seat_type not in SEAT_TYPES:
+            raise ValueError(f"Invalid seat type: {seat_type}")
         self.name = name
+        self.seat_type = seat_type  # Assigned by Game.add_player when left as None
+        self.strategy = None  # AI strategy for this seat; None uses the Game's built-in choices
         self.hand: List[Card] = []
         self.has_called_uno = False
         self.uno_penalties = 0  # Track how many times player forgot to call UNO
@@ -143,12 +158,18 @@ class Player:
     def has_won(self) -> bool:
         return len(self.hand) == 0
 
+    def is_ai(self) -> bool:
+        return self.seat_type == SEAT_AI
+
+    def is_human(self) -> bool:
+        return self.seat_type == SEAT_HUMAN
+
 class Game:
-    def __init__(self):
-        self.deck = Deck()
+    def __init__(self, rng=None):
+        self.rng = rng if rng is not None else random
+        self.deck = Deck(self.rng)
         self.players: List[Player] = []
-        self.current_player_index = 0
-        self.direction = 1  # 1 for clockwise, -1 for counterclockwise
+        self.turn_order = TurnOrder()
         self.game_started = False
         self.waiting_for_color = False
         self.waiting_for_uno_call = False  # New state for UNO call management
@@ -160,9 +181,98 @@ class Game:
         self.draw_stack_active = False  # Track if draw stack is active
         self.uno_call_window = 3.0  # Time window in seconds to call UNO after playing a card
         self.last_card_played_time = 0  # Track when the last card was played
+        # Callbacks told about every card movement, called as listener(event, *args):
+        #   ("draw", player_index, card)  card moved from the deck to a hand
+        #   ("play", player_index, card)  card moved from a hand to the discard pile
+        #   ("resolve", color)            top wild replaced by its chosen color
+        #   ("reshuffle",)                discard pile below the top card went back into the deck
+        #   ("forced_draw", player_index, color)  player drew on their turn instead of playing on color,
+        #                                         and the drawn card couldn't be played either
+        self.listeners: List[Callable] = []
+        # Counters and timers, only present after enable_stats()
+        self.stats = None
+
+    @classmethod
+    def from_seat_types(cls, seat_types: Sequence[str], names: Optional[Sequence[str]] = None, rng=None) -> 'Game':
+        """Create a game with one player per entry of a seat-type table."""
+        game = cls(rng)
+        for i, seat_type in enumerate(seat_types):
+            name = names[i] if names else f"Player {i + 1}"
+            game.add_player(Player(name, seat_type))
+        return game
+
+    @property
+    def current_player_index(self) -> int:
+        return self.turn_order.index
+
+    @current_player_index.setter
+    def current_player_index(self, index: int):
+        self.turn_order.index = index
+
+    @property
+    def direction(self) -> int:
+        return self.turn_order.direction
+
+    @direction.setter
+    def direction(self, direction: int):
+        self.turn_order.direction = direction
+
+    def enable_stats(self, stats=None):
+        """
+        Start counting calls, timings and card movements in self.stats
+        Pass an existing GameStats to keep totalling across several games.
+        """
+        from .stats import GameStats
+        if self.stats is None:
+            self.stats = stats if stats is not None else GameStats()
+            self.stats.attach(self)
+        return self.stats
+
+    def disable_stats(self):
+        """Stop counting; the figures stay readable on the returned GameStats."""
+        stats, self.stats = self.stats, None
+        if stats is not None:
+            stats.detach()
+        return stats
+
+    def add_listener(self, listener: Callable):
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener: Callable):
+        self.listeners.remove(listener)
+
+    def _emit(self, event: str, *args):
+        for listener in self.listeners:
+            listener(event, *args)
+
+    def _draw_for(self, player: Player) -> Optional[Card]:
+        """Move the top card of the deck into a player's hand."""
+        reshuffles = self.deck.reshuffle_count
+        card = self.deck.draw_card()
+        if self.listeners and self.deck.reshuffle_count != reshuffles:
+            self._emit("reshuffle")
+        if card:
+            player.add_card(card)
+            if self.listeners:
+                self._emit("draw", self.players.index(player), card)
+        return card
 
     def add_player(self, player: Player):
+        # Without an explicit seat type the classic layout applies:
+        # the first seat is the local human, everyone else is AI
+        if player.seat_type is None:
+            player.seat_type = SEAT_HUMAN if not self.players else SEAT_AI
         self.players.append(player)
+        self.turn_order.resize(len(self.players))
+
+    def _sync_turn_order(self):
+        # The players list may be replaced wholesale (e.g. by tests), so
+        # rebuild the successor tables lazily when the seat count changes
+        if self.turn_order.num_seats != len(self.players):
+            self.turn_order.resize(len(self.players))
+
+    def _update_ai_turn(self):
+        self.is_ai_turn = self.players[self.turn_order.index].seat_type == SEAT_AI
 
     def start_game(self):
         if len(self.players) < 2:
@@ -173,9 +283,7 @@ class Game:
         # Deal 7 cards to each player
         for _ in range(7):
             for player in self.players:
-                card = self.deck.draw_card()
-                if card:
-                    player.add_card(card)
+                self._draw_for(player)
 
         # Start the discard pile with a non-wild card
         while True:
@@ -184,10 +292,12 @@ class Game:
                 self.deck.play_card(card)
                 break
             elif card:
-                self.deck.cards.append(card)
+                # Put wild cards back at the bottom so the next draw is a different card
+                self.deck.cards.insert(0, card)
 
         self.game_started = True
-        self.is_ai_turn = self.current_player_index != 0  # True if first player is AI
+        self._sync_turn_order()
+        self._update_ai_turn()
 
     def call_uno(self, player: Player) -> bool:
         """Handle UNO call from a player. Returns True if valid call."""
@@ -219,9 +329,7 @@ class Game:
         """Apply UNO penalty to a player - draw 2 cards."""
         player.apply_uno_penalty()
         for _ in range(2):
-            drawn_card = self.deck.draw_card()
-            if drawn_card:
-                player.add_card(drawn_card)
+            self._draw_for(player)
 
     def handle_uno_timeout(self) -> bool:
         """Handle UNO call timeout - apply penalty and advance turn. Returns True if timeout was handled."""
@@ -242,16 +350,14 @@ class Game:
         return False
 
     def next_player(self):
-        if self.skip_next_turn:
-            self.skip_next_turn = False
-            self.current_player_index = (self.current_player_index + self.direction * 2) % len(self.players)
-        else:
-            self.current_player_index = (self.current_player_index + self.direction) % len(self.players)
-        
-        self.is_ai_turn = self.current_player_index != 0  # True if current player is AI
+        self._sync_turn_order()
+        skip = self.skip_next_turn
+        self.skip_next_turn = False
+        self.turn_order.advance(skip)
+        self._update_ai_turn()
 
     def reverse_direction(self):
-        self.direction *= -1
+        self.turn_order.reverse()
         # If there are only 2 players, reverse acts like skip
         if len(self.players) == 2:
             self.skip_next_turn = True
@@ -264,7 +370,7 @@ class Game:
             return False
 
         top_card = self.deck.get_top_card()
-        if not top_card or not card.can_play_on(top_card, self.selected_color):
+        if not top_card or not self._can_play(card, top_card):
             return False
 
         # Handle draw cards stacking
@@ -272,9 +378,7 @@ class Game:
             if card.value not in ["drawtwo", "drawfour"]:
                 # Stack is broken - apply penalties to current player who is breaking the stack
                 for _ in range(self.draw_cards_pending):
-                    drawn_card = self.deck.draw_card()
-                    if drawn_card:
-                        player.add_card(drawn_card)
+                    self._draw_for(player)
                 self.draw_cards_pending = 0
                 self.draw_stack_active = False
                 
@@ -294,6 +398,8 @@ class Game:
 
         player.remove_card(card)
         self.deck.play_card(card)
+        if self.listeners:
+            self._emit("play", self.players.index(player), card)
         self.last_played_card = card
         self.selected_color = None
         
@@ -305,11 +411,11 @@ class Game:
         if needs_uno_call:
             self.waiting_for_uno_call = True
             # For AI players, automatically call UNO
-            if player != self.players[0]:  # Not the human player
+            if player.seat_type == SEAT_AI:
                 self.call_uno(player)
                 self.waiting_for_uno_call = False
             else:
-                # For human player, handle special cards but don't advance turn yet
+                # For human and remote players, handle special cards but don't advance turn yet
                 if card.value == "reverse":
                     self.reverse_direction()
                 elif card.value == "drawfour":
@@ -363,14 +469,13 @@ class Game:
         
         # Handle draw four penalty BEFORE changing the card
         if current_wild.value == "drawfour":
-            next_player = self.players[(self.current_player_index + self.direction) % len(self.players)]
+            self._sync_turn_order()
+            next_player = self.players[self.turn_order.peek()]
             for _ in range(4):
-                drawn_card = self.deck.draw_card()
-                if drawn_card:
-                    next_player.add_card(drawn_card)
+                self._draw_for(next_player)
             # Skip the next player's turn by advancing twice
-            self.current_player_index = (self.current_player_index + self.direction * 2) % len(self.players)
-            self.is_ai_turn = self.current_player_index != 0
+            self.turn_order.advance(skip=True)
+            self._update_ai_turn()
         else:
             self.next_player()
         
@@ -381,6 +486,8 @@ class Game:
         
         # Replace the wild card in the discard pile
         self.deck.discard_pile[-1] = new_card
+        if self.listeners:
+            self._emit("resolve", color)
         
         # Reset the waiting state
         self.waiting_for_color = False
@@ -402,7 +509,7 @@ class Game:
         if not top_card:
             return True
             
-        return not player.can_play_card(top_card, self.selected_color)
+        return not self._playable_cards(player, top_card)
 
     def draw_card(self, player: Player) -> Optional[Card]:
         if not self.game_started or player != self.get_current_player():
@@ -410,12 +517,8 @@ class Game:
 
         # If draw stack is active, player must draw the accumulated cards and their turn is skipped
         if self.draw_stack_active:
-            cards_drawn = 0
             for _ in range(self.draw_cards_pending):
-                drawn_card = self.deck.draw_card()
-                if drawn_card:
-                    player.add_card(drawn_card)
-                    cards_drawn += 1
+                self._draw_for(player)
             self.draw_cards_pending = 0
             self.draw_stack_active = False
             # Skip the current player's turn by advancing to the next player
@@ -423,17 +526,32 @@ class Game:
             return None
 
         # Normal draw - player draws one card
-        card = self.deck.draw_card()
+        card = self._draw_for(player)
+        top_card = self.deck.get_top_card()
+        if card and top_card and self._can_play(card, top_card):
+            # If player draws a card, they must play it if possible. It may still be
+            # kept (e.g. when playing it would leave one card), so this is no sign of
+            # lacking the color
+            return card
+        if self.listeners:
+            color = top_card.color if top_card else None
+            if color == "wild":
+                color = self.selected_color
+            if color:
+                self._emit("forced_draw", self.players.index(player), color)
         if card:
-            player.add_card(card)
-            # If player draws a card, they must play it if possible
-            top_card = self.deck.get_top_card()
-            if top_card and card.can_play_on(top_card, self.selected_color):
-                return card
-            else:
-                self.next_player()
+            self.next_player()
         return card
 
+    # Every playability check the game makes goes through these two, so
+    # GameStats can count them on one game by wrapping them on the instance
+
+    def _can_play(self, card: Card, top_card: Card) -> bool:
+        return card.can_play_on(top_card, self.selected_color)
+
+    def _playable_cards(self, player: Player, top_card: Card) -> List[Card]:
+        return player.get_playable_cards(top_card, self.selected_color)
+
     def check_winner(self) -> Optional[Player]:
         for player in self.players:
             if player.has_won():
@@ -456,36 +574,44 @@ class Game:
             self.call_uno(current_player)
 
         # Get playable cards
-        playable_cards = current_player.get_playable_cards(top_card, self.selected_color)
+        playable_cards = self._playable_cards(current_player, top_card)
         
         if playable_cards:
             # Choose the best card to play
-            chosen_card = self._choose_best_card(playable_cards, self.draw_stack_active)
+            if current_player.strategy is not None:
+                chosen_card = current_player.strategy.choose_card(self, current_player, playable_cards)
+            else:
+                chosen_card = self._choose_best_card(playable_cards, self.draw_stack_active)
             if self.play_card(current_player, chosen_card):
                 # If it's a wild card, choose the most common color in hand
                 if chosen_card.color == "wild":
-                    chosen_color = self._choose_best_color(current_player)
+                    chosen_color = self._choose_color_for(current_player)
                     self.select_color(chosen_color)
                 return True
             else:
                 # If card couldn't be played, draw a card
                 drawn_card = self.draw_card(current_player)
-                if drawn_card and drawn_card.can_play_on(top_card, self.selected_color):
+                if drawn_card and self._can_play(drawn_card, top_card):
                     self.play_card(current_player, drawn_card)
                     if drawn_card.color == "wild":
-                        chosen_color = self._choose_best_color(current_player)
+                        chosen_color = self._choose_color_for(current_player)
                         self.select_color(chosen_color)
                 return True
         else:
             # No playable cards, draw a card
             drawn_card = self.draw_card(current_player)
-            if drawn_card and drawn_card.can_play_on(top_card, self.selected_color):
+            if drawn_card and self._can_play(drawn_card, top_card):
                 self.play_card(current_player, drawn_card)
                 if drawn_card.color == "wild":
-                    chosen_color = self._choose_best_color(current_player)
+                    chosen_color = self._choose_color_for(current_player)
                     self.select_color(chosen_color)
             return True
 
+    def _choose_color_for(self, player: Player) -> str:
+        if player.strategy is not None:
+            return player.strategy.choose_color(self, player)
+        return self._choose_best_color(player)
+
     def _choose_best_card(self, playable_cards: List[Card], draw_stack_active: bool) -> Card:
         """Choose the best card to play based on strategy."""
         if draw_stack_active:
@@ -493,13 +619,13 @@ class Game:
             for card in playable_cards:
                 if card.value in ["drawtwo", "drawfour"]:
                     return card
-            return random.choice(playable_cards)
+            return self.rng.choice(playable_cards)
         
         # Normal strategy
         for card in playable_cards:
             if card.value in ["drawfour", "drawtwo", "skip", "reverse"]:
                 return card
-        return random.choice(playable_cards)
+        return self.rng.choice(playable_cards)
 
     def _choose_best_color(self, player: Player) -> str:
         """Choose the best color based on the cards in hand."""
@@ -0,0 +1,7 @@
+"""
+Networking for PyUNO: wire protocol and multi-table game server
+"""
+
+from .server import GameServer
+
+__all__ = ['GameServer']
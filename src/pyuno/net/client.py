@@ -0,0 +1,285 @@
+"""
+Thin client for playing on a remote PyUNO game server
+RemoteGame mirrors the parts of the Game interface that main_game_ui uses,
+so the pygame UI can drive a table hosted by net/server.py unchanged.
+"""
+
+import queue
+import socket
+import threading
+from typing import Dict, List, Optional
+
+from ..core.uno_classes import Card, Player, SEAT_HUMAN, SEAT_REMOTE
+from .protocol import (ProtocolError, encode_message, decode_message, card_from_name,
+                       apply_delta)
+
+
+class GameClient:
+    """
+    Blocking JSON-lines connection to a game server
+    A reader thread collects replies and pushed messages; request() waits
+    for its reply while send() returns at once and leaves the reply in the
+    incoming queue for the owner to handle.
+    """
+
+    def __init__(self, host: str, port: int, timeout: float = 5.0):
+        self.timeout = timeout
+        self.sock = socket.create_connection((host, port), timeout=timeout)
+        self.sock.settimeout(None)
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.incoming: "queue.Queue[dict]" = queue.Queue()
+        self.connected = True
+        self._next_id = 0
+        self._waiting: Dict[int, queue.Queue] = {}
+        self._lock = threading.Lock()
+        self._reader = threading.Thread(target=self._read_loop, daemon=True)
+        self._reader.start()
+
+    def _read_loop(self):
+        stream = self.sock.makefile("rb")
+        try:
+            for line in stream:
+                message = decode_message(line)
+                waiter = self._waiting.pop(message.get("id"), None)
+                if waiter is not None:
+                    waiter.put(message)
+                else:
+                    self.incoming.put(message)
+        except (OSError, ProtocolError):
+            pass
+        self.connected = False
+        self.incoming.put({"type": "disconnected"})
+
+    def send(self, op: str, **fields) -> int:
+        with self._lock:
+            self._next_id += 1
+            request_id = self._next_id
+            fields.update(op=op, id=request_id)
+            self.sock.sendall(encode_message(fields))
+        return request_id
+
+    def request(self, op: str, **fields) -> dict:
+        waiter: queue.Queue = queue.Queue()
+        with self._lock:
+            self._next_id += 1
+            request_id = self._next_id
+            self._waiting[request_id] = waiter
+            fields.update(op=op, id=request_id)
+            self.sock.sendall(encode_message(fields))
+        try:
+            reply = waiter.get(timeout=self.timeout)
+        except queue.Empty:
+            self._waiting.pop(request_id, None)
+            raise ProtocolError(f"No reply to {op}")
+        if not reply.get("ok"):
+            raise ProtocolError(reply.get("error", "Request failed"))
+        return reply
+
+    def close(self):
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.sock.close()
+
+
+class RemoteDeck:
+    """Stands in for Deck: only the discard pile's top card is known."""
+
+    def __init__(self):
+        self.top_card: Optional[Card] = None
+        self.size = 0
+
+    def get_top_card(self) -> Optional[Card]:
+        return self.top_card
+
+
+class RemoteGame:
+    """
+    Local mirror of a table hosted on a game server
+    The confirmed state is the last seat view from the server with every
+    delta applied. Moves are predicted locally (the played card leaves the
+    hand, input is blocked until the server answers) and the prediction is
+    replaced by confirmed state as soon as the next delta arrives.
+    """
+
+    def __init__(self, client: GameClient, table_id: str, seat: int, state: dict):
+        self.client = client
+        self.table_id = table_id
+        self.seat = seat
+        self.view = state
+        self.deck = RemoteDeck()
+        self.players: List[Player] = []
+        self.error_message = ""
+        self._pending_requests = set()
+        self._rebuild_players()
+        self._refresh()
+
+    @classmethod
+    def join(cls, client: GameClient, table_id: Optional[str] = None, seat: Optional[int] = None,
+             seat_types: Optional[List[str]] = None) -> 'RemoteGame':
+        """Join a table, creating one from seat_types first if no table is given."""
+        if table_id is None:
+            seat_types = seat_types or [SEAT_REMOTE, "ai", "ai", "ai"]
+            table_id = client.request("create_table", seats=seat_types)["table"]
+        fields = {"table": table_id}
+        if seat is not None:
+            fields["seat"] = seat
+        reply = client.request("join", **fields)
+        return cls(client, table_id, reply["seat"], reply["state"])
+
+    # ---- Applying server state ----
+
+    def poll(self):
+        """Apply every message received since the last call."""
+        changed = False
+        while True:
+            try:
+                message = self.client.incoming.get_nowait()
+            except queue.Empty:
+                break
+            if message.get("type") == "delta" and message.get("table") == self.table_id:
+                players_before = len(self.view["players"])
+                apply_delta(self.view, message["changes"])
+                if len(self.view["players"]) != players_before:
+                    self._rebuild_players()
+                changed = True
+            elif message.get("type") == "table_closed" and message.get("table") == self.table_id:
+                self.error_message = "The server closed this table"
+                changed = True
+            elif "id" in message:
+                self._pending_requests.discard(message["id"])
+                if not message.get("ok"):
+                    # The prediction was wrong; fall back to the server's state
+                    self.error_message = message.get("error", "")
+                    if "state" not in message:
+                        self._pending_requests.add(self.client.send("state", table=self.table_id, seat=self.seat))
+                    changed = True
+                if "state" in message:
+                    self.view = message["state"]
+                    self._rebuild_players()
+                    changed = True
+        if changed:
+            self._refresh()
+
+    def _rebuild_players(self):
+        """
+        Match the Player objects to the view's seats
+        Existing players are kept, since the UI holds on to them (e.g. as
+        its viewer); new ones are only made when the number of seats changes.
+        """
+        seats = self.view["players"]
+        if len(self.players) != len(seats):
+            self.players = [Player(info["name"]) for info in seats]
+        for i, (player, info) in enumerate(zip(self.players, seats)):
+            player.name = info["name"]
+            player.seat_type = SEAT_HUMAN if i == self.seat else info["seat_type"]
+
+    def _refresh(self):
+        """Copy the confirmed view onto the mirror objects, dropping predictions."""
+        view = self.view
+        for i, (player, info) in enumerate(zip(self.players, view["players"])):
+            if i == self.seat:
+                player.hand = [card_from_name(name) for name in view.get("hand", [])]
+            else:
+                # Opponent hands are only known by size
+                player.hand = [None] * info["cards"]
+            player.has_called_uno = info["called_uno"]
+        self.deck.top_card = card_from_name(view["top_card"]) if view["top_card"] else None
+        self.deck.size = view["deck_size"]
+        self.current_player_index = view["current"]
+        self.direction = view["direction"]
+        self.selected_color = view["selected_color"]
+        self.waiting_for_color = view["waiting_for_color"]
+        self.waiting_for_uno_call = view["waiting_for_uno_call"]
+        self.draw_cards_pending = view["draw_cards_pending"]
+        self.draw_stack_active = view["draw_stack_active"]
+        self.game_started = True
+        # Every seat but ours is played elsewhere; the UI waits while it's their turn
+        self.is_ai_turn = self.current_player_index != self.seat
+
+    # ---- Game interface used by the UI ----
+
+    def _my_turn(self, player: Player) -> bool:
+        return (player is self.players[self.seat] and self.current_player_index == self.seat
+                and not self.is_ai_turn and self.view["winner"] is None)
+
+    def _send(self, op: str, **fields):
+        self._pending_requests.add(self.client.send(op, table=self.table_id, seat=self.seat, **fields))
+
+    def get_current_player(self) -> Player:
+        return self.players[self.current_player_index]
+
+    def can_draw_card(self, player: Player) -> bool:
+        if not self._my_turn(player) or self.waiting_for_color or self.waiting_for_uno_call:
+            return False
+        if self.draw_stack_active:
+            return True
+        top_card = self.deck.get_top_card()
+        return top_card is None or not player.can_play_card(top_card, self.selected_color)
+
+    def play_card(self, player: Player, card: Card) -> bool:
+        if not self._my_turn(player) or self.waiting_for_color or self.waiting_for_uno_call:
+            return False
+        top_card = self.deck.get_top_card()
+        if not top_card or not card.can_play_on(top_card, self.selected_color):
+            return False
+        if (self.draw_stack_active and card.value in ("drawtwo", "drawfour")
+                and card.value != top_card.value):
+            # Draw twos and draw fours don't stack on each other
+            return False
+
+        self._send("play", card=str(card))
+
+        # Predict the outcome so the hand and highlights update immediately
+        player.remove_card(card)
+        self.deck.top_card = card
+        self.selected_color = None
+        if card.color == "wild":
+            self.waiting_for_color = True
+        if player.has_one_card():
+            self.waiting_for_uno_call = True
+        if not self.waiting_for_color and not self.waiting_for_uno_call:
+            self.is_ai_turn = True
+        return True
+
+    def draw_card(self, player: Player) -> Optional[Card]:
+        if not self.can_draw_card(player):
+            return None
+        self._send("draw")
+        # The drawn card arrives with the next delta; block input until then
+        self.is_ai_turn = True
+        return None
+
+    def select_color(self, color: str) -> bool:
+        if not self.waiting_for_color or color not in ("red", "yellow", "green", "blue"):
+            return False
+        self._send("select_color", color=color)
+        self.selected_color = color
+        self.waiting_for_color = False
+        if not self.waiting_for_uno_call:
+            self.is_ai_turn = True
+        return True
+
+    def call_uno(self, player: Player) -> bool:
+        if player is not self.players[self.seat] or not player.has_one_card() or player.has_called_uno:
+            return False
+        self._send("call_uno")
+        player.has_called_uno = True
+        if self.waiting_for_uno_call:
+            self.waiting_for_uno_call = False
+            if not self.waiting_for_color:
+                self.is_ai_turn = True
+        return True
+
+    def check_winner(self) -> Optional[Player]:
+        winner = self.view["winner"]
+        return self.players[winner] if winner is not None else None
+
+    def handle_ai_turn(self) -> bool:
+        # Other seats are played by the server
+        return False
+
+    def handle_uno_timeout(self) -> bool:
+        # The server applies the UNO penalty when the call window runs out
+        return False
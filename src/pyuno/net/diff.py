@@ -0,0 +1,247 @@
+"""
+Incremental game-state diffs for spectators and replays
+GameDiffer listens to a Game's card movements and, after each move, turns
+them into a short list of ops; encode_ops packs those into a few bytes.
+Observers rebuild the table with StateMirror, starting from a keyframe.
+
+Ops:
+    (OP_MOVE, src_zone, dst_zone, card_id)  a card moved between zones
+    (OP_SET, field, value)                  a scalar field changed
+    (OP_RESOLVE, color_id)                  top wild replaced by its chosen color
+    (OP_RESHUFFLE,)                         discard pile below the top went back into the deck
+    (OP_KEYFRAME, deck_size, discard_ids, hands)  full card layout, followed by OP_SETs
+Zones are ZONE_DECK, ZONE_DISCARD and ZONE_HAND + player index.
+"""
+
+import struct
+from typing import List, Optional, Tuple
+
+from ..core.cards import CARD_IDS, COLORS, card_from_id, card_id
+from ..core.uno_classes import Card, Game
+
+OP_MOVE = 1
+OP_SET = 2
+OP_RESOLVE = 3
+OP_RESHUFFLE = 4
+OP_KEYFRAME = 16
+
+ZONE_DECK = 0
+ZONE_DISCARD = 1
+ZONE_HAND = 2
+
+# Scalar fields; FIELD_CALLED_UNO + player index holds that player's UNO flag
+FIELD_CURRENT = 0
+FIELD_DIRECTION = 1
+FIELD_PENDING = 2
+FIELD_STACK_ACTIVE = 3
+FIELD_SELECTED_COLOR = 4
+FIELD_WAITING_COLOR = 5
+FIELD_WAITING_UNO = 6
+FIELD_CALLED_UNO = 16
+
+NO_COLOR = 255
+
+
+def game_scalars(game: Game) -> dict:
+    """Scalar fields of a game keyed by field number."""
+    selected_color = game.selected_color
+    scalars = {
+        FIELD_CURRENT: game.current_player_index,
+        FIELD_DIRECTION: game.direction,
+        FIELD_PENDING: game.draw_cards_pending,
+        FIELD_STACK_ACTIVE: int(game.draw_stack_active),
+        FIELD_SELECTED_COLOR: COLORS.index(selected_color) if selected_color else NO_COLOR,
+        FIELD_WAITING_COLOR: int(game.waiting_for_color),
+        FIELD_WAITING_UNO: int(game.waiting_for_uno_call),
+    }
+    for i, player in enumerate(game.players):
+        scalars[FIELD_CALLED_UNO + i] = int(player.has_called_uno)
+    return scalars
+
+
+def keyframe_ops(game: Game) -> list:
+    ops: list = [(OP_KEYFRAME, len(game.deck.cards),
+                  [card_id(card) for card in game.deck.discard_pile],
+                  [[card_id(card) for card in player.hand] for player in game.players])]
+    ops.extend((OP_SET, field, value) for field, value in game_scalars(game).items())
+    return ops
+
+
+class GameDiffer:
+    """
+    Produces per-move diffs for a game
+    Card movements are collected from the game's listener events, so the
+    cost of a diff depends on what changed, not on pile or hand sizes.
+    Scalars are compared against their last sent values at each flush.
+    """
+
+    def __init__(self, game: Game, keyframe_interval: int = 100):
+        self.game = game
+        self.keyframe_interval = keyframe_interval
+        self._ops: list = []
+        self._scalars: dict = {}
+        self._flushes = 0
+        self._needs_keyframe = True
+        game.add_listener(self._on_event)
+
+    def close(self):
+        self.game.remove_listener(self._on_event)
+
+    def _on_event(self, event: str, *args):
+        if event == "draw":
+            self._ops.append((OP_MOVE, ZONE_DECK, ZONE_HAND + args[0], card_id(args[1])))
+        elif event == "play":
+            self._ops.append((OP_MOVE, ZONE_HAND + args[0], ZONE_DISCARD, card_id(args[1])))
+        elif event == "resolve":
+            self._ops.append((OP_RESOLVE, COLORS.index(args[0])))
+        elif event == "reshuffle":
+            self._ops.append((OP_RESHUFFLE,))
+
+    def request_keyframe(self):
+        """Make the next flush a keyframe, e.g. when a new observer joins."""
+        self._needs_keyframe = True
+
+    def flush(self) -> list:
+        """Return the ops describing everything that changed since the last flush."""
+        self._flushes += 1
+        if self._needs_keyframe or (self.keyframe_interval and self._flushes % self.keyframe_interval == 0):
+            self._needs_keyframe = False
+            self._ops = []
+            ops = keyframe_ops(self.game)
+            self._scalars = {op[1]: op[2] for op in ops[1:]}
+            return ops
+
+        ops, self._ops = self._ops, []
+        for field, value in game_scalars(self.game).items():
+            if self._scalars.get(field) != value:
+                self._scalars[field] = value
+                ops.append((OP_SET, field, value))
+        return ops
+
+
+# ---- Binary encoding ----
+
+_MOVE = struct.Struct("<BBBB")
+_SET = struct.Struct("<BBh")
+_RESOLVE = struct.Struct("<BB")
+
+
+def encode_ops(ops: list) -> bytes:
+    """Pack ops into bytes: 4 per move or field change, 2 per resolve, 1 per reshuffle."""
+    out = bytearray()
+    for op in ops:
+        kind = op[0]
+        if kind == OP_MOVE:
+            out += _MOVE.pack(*op)
+        elif kind == OP_SET:
+            out += _SET.pack(*op)
+        elif kind == OP_RESOLVE:
+            out += _RESOLVE.pack(*op)
+        elif kind == OP_RESHUFFLE:
+            out.append(OP_RESHUFFLE)
+        elif kind == OP_KEYFRAME:
+            _, deck_size, discard, hands = op
+            out += bytes((OP_KEYFRAME, deck_size, len(hands), len(discard)))
+            out += bytes(discard)
+            for hand in hands:
+                out.append(len(hand))
+                out += bytes(hand)
+        else:
+            raise ValueError(f"Unknown op: {op}")
+    return bytes(out)
+
+
+def decode_ops(data: bytes) -> list:
+    ops: list = []
+    pos = 0
+    while pos < len(data):
+        kind = data[pos]
+        if kind == OP_MOVE:
+            ops.append(_MOVE.unpack_from(data, pos))
+            pos += _MOVE.size
+        elif kind == OP_SET:
+            ops.append(_SET.unpack_from(data, pos))
+            pos += _SET.size
+        elif kind == OP_RESOLVE:
+            ops.append(_RESOLVE.unpack_from(data, pos))
+            pos += _RESOLVE.size
+        elif kind == OP_RESHUFFLE:
+            ops.append((OP_RESHUFFLE,))
+            pos += 1
+        elif kind == OP_KEYFRAME:
+            deck_size, num_players, discard_len = data[pos + 1], data[pos + 2], data[pos + 3]
+            pos += 4
+            discard = list(data[pos:pos + discard_len])
+            pos += discard_len
+            hands = []
+            for _ in range(num_players):
+                hand_len = data[pos]
+                hands.append(list(data[pos + 1:pos + 1 + hand_len]))
+                pos += 1 + hand_len
+            ops.append((OP_KEYFRAME, deck_size, discard, hands))
+        else:
+            raise ValueError(f"Unknown op code {kind} at offset {pos}")
+    return ops
+
+
+class StateMirror:
+    """Observer-side copy of a table rebuilt from diff ops."""
+
+    def __init__(self):
+        self.deck_size = 0
+        self.discard: List[int] = []
+        self.hands: List[List[int]] = []
+        self.scalars: dict = {}
+        self.synced = False  # False until the first keyframe has been applied
+
+    def apply(self, ops: list):
+        for op in ops:
+            kind = op[0]
+            if kind == OP_KEYFRAME:
+                _, self.deck_size, discard, hands = op
+                self.discard = list(discard)
+                self.hands = [list(hand) for hand in hands]
+                self.scalars = {}
+                self.synced = True
+            elif not self.synced:
+                # Deltas before the first keyframe can't be applied
+                continue
+            elif kind == OP_MOVE:
+                _, src, dst, card = op
+                if src == ZONE_DECK:
+                    self.deck_size -= 1
+                elif src == ZONE_DISCARD:
+                    self.discard.pop()
+                else:
+                    self.hands[src - ZONE_HAND].remove(card)
+                if dst == ZONE_DECK:
+                    self.deck_size += 1
+                elif dst == ZONE_DISCARD:
+                    self.discard.append(card)
+                else:
+                    self.hands[dst - ZONE_HAND].append(card)
+            elif kind == OP_SET:
+                self.scalars[op[1]] = op[2]
+            elif kind == OP_RESOLVE:
+                self.discard[-1] = CARD_IDS[f"{COLORS[op[1]]}_0"]
+            elif kind == OP_RESHUFFLE:
+                self.deck_size += len(self.discard) - 1
+                self.discard = self.discard[-1:]
+
+    def top_card(self) -> Optional[Card]:
+        return card_from_id(self.discard[-1]) if self.discard else None
+
+    def selected_color(self) -> Optional[str]:
+        color = self.scalars.get(FIELD_SELECTED_COLOR, NO_COLOR)
+        return COLORS[color] if color != NO_COLOR else None
+
+    def snapshot(self) -> Tuple:
+        return (self.deck_size, tuple(self.discard), tuple(tuple(hand) for hand in self.hands),
+                tuple(sorted(self.scalars.items())))
+
+
+def game_snapshot(game: Game) -> Tuple:
+    """The state a StateMirror should hold for this game, for comparisons."""
+    return (len(game.deck.cards), tuple(card_id(card) for card in game.deck.discard_pile),
+            tuple(tuple(card_id(card) for card in player.hand) for player in game.players),
+            tuple(sorted(game_scalars(game).items())))
@@ -0,0 +1,139 @@
+"""
+JSON-lines wire protocol shared by the PyUNO game server and its clients
+Every message is one JSON object terminated by a newline.
+
+Requests carry an "op" and an optional "id" that is echoed in the reply:
+    {"id": 1, "op": "create_table", "seats": ["remote", "ai", "ai"]}
+    {"id": 1, "ok": true, "table": "t1"}
+Errors are reported in the reply instead of closing the connection:
+    {"id": 2, "ok": false, "error": "Not your turn"}
+Messages pushed by the server without a request carry a "type" instead.
+Seated clients receive the full seat view once when joining and afterwards
+only "delta" messages listing the fields that changed (see diff_views).
+Seated and watching clients get a "table_closed" message when a table is
+closed or the server shuts down.
+"""
+
+import json
+from collections import Counter
+from typing import Optional
+
+from ..core.uno_classes import Card, Game
+
+ENCODING = "utf-8"
+MAX_LINE_LENGTH = 64 * 1024
+
+
+class ProtocolError(Exception):
+    """Raised for malformed or invalid protocol messages."""
+
+
+def encode_message(message: dict) -> bytes:
+    return (json.dumps(message, separators=(",", ":")) + "\n").encode(ENCODING)
+
+
+def decode_message(line: bytes) -> dict:
+    try:
+        message = json.loads(line.decode(ENCODING))
+    except (UnicodeDecodeError, ValueError) as e:
+        raise ProtocolError(f"Invalid message: {e}")
+    if not isinstance(message, dict):
+        raise ProtocolError("Message must be a JSON object")
+    return message
+
+
+def card_from_name(name: str) -> Card:
+    """Parse a card name such as 'red_5' or 'wild_drawfour' back into a Card."""
+    color, _, value = name.partition("_")
+    try:
+        return Card(color, value)
+    except ValueError as e:
+        raise ProtocolError(str(e))
+
+
+def seat_view(game: Game, seat: Optional[int] = None) -> dict:
+    """
+    Describe the game as seen from one seat
+    Only the seat's own hand is revealed; other players show card counts.
+    Pass seat=None for a spectator view without any hand.
+    """
+    top_card = game.deck.get_top_card()
+    winner = game.check_winner()
+    view = {
+        "players": [{"name": p.name, "seat_type": p.seat_type, "cards": len(p.hand),
+                     "called_uno": p.has_called_uno} for p in game.players],
+        "top_card": str(top_card) if top_card else None,
+        "deck_size": len(game.deck.cards),
+        "current": game.current_player_index,
+        "direction": game.direction,
+        "selected_color": game.selected_color,
+        "waiting_for_color": game.waiting_for_color,
+        "waiting_for_uno_call": game.waiting_for_uno_call,
+        "draw_cards_pending": game.draw_cards_pending,
+        "draw_stack_active": game.draw_stack_active,
+        "winner": game.players.index(winner) if winner else None,
+    }
+    if seat is not None:
+        view["seat"] = seat
+        view["hand"] = [str(card) for card in game.players[seat].hand]
+    return view
+
+
+def diff_views(old: dict, new: dict) -> dict:
+    """
+    Compute the changes that turn seat view old into seat view new
+    Scalar fields are sent only when they changed, players only with their
+    changed fields, and the hand as cards removed and appended. The hand is
+    sent in full only if the add/remove form would not reproduce its order.
+    """
+    changes = {}
+    for key, value in new.items():
+        if key not in ("players", "hand") and old.get(key) != value:
+            changes[key] = value
+
+    old_players = old.get("players", [])
+    new_players = new.get("players", [])
+    if len(old_players) != len(new_players):
+        changes["players"] = new_players
+    else:
+        player_changes = {}
+        for i, (old_player, new_player) in enumerate(zip(old_players, new_players)):
+            fields = {k: v for k, v in new_player.items() if old_player.get(k) != v}
+            if fields:
+                player_changes[str(i)] = fields
+        if player_changes:
+            changes["players"] = player_changes
+
+    if "hand" in new and old.get("hand") != new["hand"]:
+        old_hand = old.get("hand", [])
+        removed = list((Counter(old_hand) - Counter(new["hand"])).elements())
+        # Cards are removed by first occurrence and drawn cards are appended
+        kept = _apply_hand_change(old_hand, {"remove": removed})
+        if new["hand"][:len(kept)] == kept:
+            changes["hand"] = {"remove": removed, "add": new["hand"][len(kept):]}
+        else:
+            changes["hand"] = {"set": new["hand"]}
+    return changes
+
+
+def _apply_hand_change(hand: list, change: dict) -> list:
+    if "set" in change:
+        return list(change["set"])
+    hand = list(hand)
+    for card in change.get("remove", []):
+        hand.remove(card)
+    hand.extend(change.get("add", []))
+    return hand
+
+
+def apply_delta(view: dict, changes: dict) -> dict:
+    """Apply changes produced by diff_views to a seat view in place."""
+    for key, value in changes.items():
+        if key == "players" and isinstance(value, dict):
+            for index, fields in value.items():
+                view["players"][int(index)].update(fields)
+        elif key == "hand":
+            view["hand"] = _apply_hand_change(view.get("hand", []), value)
+        else:
+            view[key] = value
+    return view
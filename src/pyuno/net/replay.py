@@ -0,0 +1,247 @@
+"""
+Recorded games that can be played back and sought to any turn
+ReplayRecorder stores one frame of diff ops (see diff.py) per move, plus a
+full keyframe of the table every keyframe_interval frames. Replay.seek()
+starts from the nearest keyframe at or before the turn and applies at
+most keyframe_interval - 1 frames, so seeking costs the same anywhere in
+a game and nothing is re-simulated.
+
+File layout (little-endian):
+    magic, u32 header length, JSON header (players, keyframe interval)
+    u32 frame count, then per frame: u16 length, encoded ops
+    u32 keyframe count, then per keyframe: u32 frame index, u16 length, encoded ops
+
+    python -m pyuno.net.replay game.pyrep --players 4 --seed 7
+"""
+
+import argparse
+import bisect
+import json
+import struct
+from typing import List, Optional, Sequence, Tuple
+
+from ..core.cards import card_from_id
+from ..core.uno_classes import Game, Player
+from .client import RemoteDeck
+from .diff import (FIELD_CALLED_UNO, FIELD_CURRENT, FIELD_DIRECTION, FIELD_PENDING, FIELD_STACK_ACTIVE,
+                   FIELD_WAITING_COLOR, FIELD_WAITING_UNO, GameDiffer, StateMirror, decode_ops,
+                   encode_ops, keyframe_ops)
+
+MAGIC = b"PYUNORP1"
+KEYFRAME_INTERVAL = 32
+
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+
+
+class ReplayRecorder:
+    """
+    Records a game's frames as it is played
+    Call capture() after each move; calls that find nothing changed add no
+    frame, so the UI can call it every frame. Frame 0 is the table as it
+    was when the recorder was attached.
+    """
+
+    def __init__(self, game: Game, path: Optional[str] = None, keyframe_interval: int = KEYFRAME_INTERVAL):
+        self.game = game
+        self.path = path
+        self.keyframe_interval = keyframe_interval
+        self.players = [(player.name, player.seat_type) for player in game.players]
+        self.frames: List[bytes] = []
+        self.keyframes: List[Tuple[int, bytes]] = []
+        # Keyframes are taken here, by frame count; the differ only makes the first one
+        self.differ = GameDiffer(game, keyframe_interval=0)
+
+    def capture(self) -> bool:
+        """Record what changed since the last call; returns whether there was anything."""
+        ops = self.differ.flush()
+        if not ops:
+            return False
+        frame = encode_ops(ops)
+        turn = len(self.frames)
+        self.frames.append(frame)
+        if turn == 0:
+            self.keyframes.append((0, frame))
+        elif turn % self.keyframe_interval == 0:
+            self.keyframes.append((turn, encode_ops(keyframe_ops(self.game))))
+        return True
+
+    def replay(self) -> 'Replay':
+        return Replay(self.players, list(self.frames), list(self.keyframes), self.keyframe_interval)
+
+    def close(self):
+        """Stop listening to the game, writing the replay to path if one was given."""
+        self.differ.close()
+        if self.path is not None:
+            self.replay().save(self.path)
+
+
+class Replay:
+    """
+    A recorded game and a cursor into it
+    seek() moves the cursor to a turn and returns the mirrored table there.
+    Stepping forward applies a single frame; anything else restarts from
+    the nearest keyframe unless the cursor is already closer.
+    """
+
+    def __init__(self, players: Sequence[Tuple[str, Optional[str]]], frames: List[bytes],
+                 keyframes: List[Tuple[int, bytes]], keyframe_interval: int = KEYFRAME_INTERVAL):
+        if not keyframes or keyframes[0][0] != 0:
+            raise ValueError("Replay has no keyframe for turn 0")
+        self.players = [tuple(player) for player in players]
+        self.frames = frames
+        self.keyframes = keyframes
+        self.keyframe_interval = keyframe_interval
+        self._keyframe_turns = [turn for turn, _ in keyframes]
+        self.mirror = StateMirror()
+        self.turn = -1
+        self.frames_applied = 0  # Frames decoded by the last seek, keyframe included
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def seek(self, turn: int) -> StateMirror:
+        """The table after the given turn's frame, clamped to the recording."""
+        turn = max(0, min(turn, len(self.frames) - 1))
+        keyframe = bisect.bisect_right(self._keyframe_turns, turn) - 1
+        start = self._keyframe_turns[keyframe]
+        self.frames_applied = 0
+        if not start <= self.turn <= turn:
+            self.mirror = StateMirror()
+            self.mirror.apply(decode_ops(self.keyframes[keyframe][1]))
+            self.turn = start
+            self.frames_applied = 1
+        for frame in self.frames[self.turn + 1:turn + 1]:
+            self.mirror.apply(decode_ops(frame))
+        self.frames_applied += turn - self.turn
+        self.turn = turn
+        return self.mirror
+
+    def step(self, turns: int = 1) -> StateMirror:
+        return self.seek(self.turn + turns)
+
+    def save(self, path: str):
+        header = json.dumps({"players": self.players, "keyframe_interval": self.keyframe_interval}).encode()
+        out = bytearray(MAGIC)
+        out += _U32.pack(len(header)) + header
+        out += _U32.pack(len(self.frames))
+        for frame in self.frames:
+            out += _U16.pack(len(frame)) + frame
+        out += _U32.pack(len(self.keyframes))
+        for turn, frame in self.keyframes:
+            out += _U32.pack(turn) + _U16.pack(len(frame)) + frame
+        with open(path, "wb") as f:
+            f.write(out)
+
+    @classmethod
+    def load(cls, path: str) -> 'Replay':
+        with open(path, "rb") as f:
+            data = f.read()
+        if not data.startswith(MAGIC):
+            raise ValueError(f"{path} is not a PyUNO replay")
+        pos = len(MAGIC)
+
+        def u32():
+            nonlocal pos
+            value = _U32.unpack_from(data, pos)[0]
+            pos += _U32.size
+            return value
+
+        def chunk():
+            nonlocal pos
+            length = _U16.unpack_from(data, pos)[0]
+            pos += _U16.size + length
+            return data[pos - length:pos]
+
+        header_length = u32()
+        header = json.loads(data[pos:pos + header_length])
+        pos += header_length
+        frames = [chunk() for _ in range(u32())]
+        keyframes = []
+        for _ in range(u32()):
+            turn = u32()
+            keyframes.append((turn, chunk()))
+        return cls(header["players"], frames, keyframes, header["keyframe_interval"])
+
+
+class ReplayGame:
+    """
+    Read-only stand-in for Game showing a replay's current table
+    Has the parts of the Game interface that draw_game_frame uses; every
+    hand is known, and nothing can be played.
+    """
+
+    def __init__(self, replay: Replay):
+        self.replay = replay
+        self.players = [Player(name, seat_type) for name, seat_type in replay.players]
+        self.deck = RemoteDeck()
+        self.seek(0)
+
+    def seek(self, turn: int):
+        mirror = self.replay.seek(turn)
+        scalars = mirror.scalars
+        for i, (player, hand) in enumerate(zip(self.players, mirror.hands)):
+            player.hand = [card_from_id(card) for card in hand]
+            player.has_called_uno = bool(scalars.get(FIELD_CALLED_UNO + i))
+        self.deck.top_card = mirror.top_card()
+        self.deck.size = mirror.deck_size
+        self.current_player_index = scalars.get(FIELD_CURRENT, 0)
+        self.direction = scalars.get(FIELD_DIRECTION, 1)
+        self.selected_color = mirror.selected_color()
+        self.waiting_for_color = bool(scalars.get(FIELD_WAITING_COLOR))
+        self.waiting_for_uno_call = bool(scalars.get(FIELD_WAITING_UNO))
+        self.draw_cards_pending = scalars.get(FIELD_PENDING, 0)
+        self.draw_stack_active = bool(scalars.get(FIELD_STACK_ACTIVE))
+
+    @property
+    def turn(self) -> int:
+        return self.replay.turn
+
+    def get_current_player(self) -> Player:
+        return self.players[self.current_player_index]
+
+    def can_draw_card(self, player: Player) -> bool:
+        return False
+
+    def check_winner(self) -> Optional[Player]:
+        for player in self.players:
+            if not player.hand:
+                return player
+        return None
+
+
+def record_game(strategies: Sequence, seed: Optional[int] = None, max_turns: int = 2000,
+                keyframe_interval: int = KEYFRAME_INTERVAL) -> Replay:
+    """Play a headless game between AI strategies and return its replay."""
+    from ..sim.headless import new_headless_game
+
+    game = new_headless_game(strategies, seed)
+    recorder = ReplayRecorder(game, keyframe_interval=keyframe_interval)
+    recorder.capture()
+    for _ in range(max_turns):
+        if game.check_winner() or not game.handle_ai_turn():
+            break
+        recorder.capture()
+    recorder.close()
+    return recorder.replay()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Record a headless PyUNO game as a replay")
+    parser.add_argument("path", help="Replay file to write")
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--strategies", default="", help="Comma-separated strategies, one per seat")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--keyframe-interval", type=int, default=KEYFRAME_INTERVAL)
+    args = parser.parse_args(argv)
+
+    from ..ai.strategies import get_strategy
+    names = args.strategies.split(",") if args.strategies else ["default"] * args.players
+    strategies = [None if name == "default" else get_strategy(name) for name in names]
+    replay = record_game(strategies, args.seed, keyframe_interval=args.keyframe_interval)
+    replay.save(args.path)
+    print(f"{len(replay)} turns, {len(replay.keyframes)} keyframes written to {args.path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,427 @@
+"""
+Asyncio game server hosting many PyUNO tables in one process
+Clients speak the JSON-lines protocol from protocol.py over TCP.
+
+Run a local server from the src directory with:
+    python -m pyuno.net.server --host 127.0.0.1 --port 8765
+"""
+
+import argparse
+import asyncio
+import base64
+import itertools
+import time
+from collections import deque
+from typing import Dict, List, Optional, Set
+
+from ..core.uno_classes import Game, SEAT_HUMAN, SEAT_AI, SEAT_REMOTE, SEAT_TYPES
+from .protocol import (ProtocolError, MAX_LINE_LENGTH, encode_message, decode_message,
+                       card_from_name, seat_view, diff_views)
+from .diff import GameDiffer, encode_ops, keyframe_ops
+
+
+class LatencyStats:
+    """Running latency figures with a bounded window of recent samples."""
+
+    def __init__(self, window: int = 256):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples = deque(maxlen=window)
+
+    def record(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.samples.append(seconds)
+
+    def summary(self) -> dict:
+        if not self.count:
+            return {"count": 0}
+        recent = sorted(self.samples)
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count * 1000, 3),
+            "p50_ms": round(recent[len(recent) // 2] * 1000, 3),
+            "p95_ms": round(recent[min(len(recent) - 1, int(len(recent) * 0.95))] * 1000, 3),
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+
+class Connection:
+    """One client connection, the seats it controls and the tables it watches."""
+
+    def __init__(self, writer: asyncio.StreamWriter):
+        self.writer = writer
+        self.seats: Set[tuple] = set()  # (table_id, seat) pairs
+        self.watching: Set[str] = set()  # Table ids
+        self.last_views: Dict[tuple, dict] = {}  # Last seat view the client has seen
+
+    def send(self, message: dict):
+        if not self.writer.is_closing():
+            self.writer.write(encode_message(message))
+
+
+class Table:
+    """A single game plus the connections seated at it."""
+
+    def __init__(self, table_id: str, seat_types: List[str], ai_delay: float, max_ai_turns: int):
+        self.table_id = table_id
+        self.game = Game.from_seat_types(seat_types)
+        self.game.start_game()
+        self.ai_delay = ai_delay
+        self.max_ai_turns = max_ai_turns
+        self.ai_turns = 0
+        self.seated: Dict[int, Connection] = {}
+        self.spectators: List[Connection] = []
+        self.differ: Optional[GameDiffer] = None  # Created when the first spectator arrives
+        self.finished = False
+        self.ai_task: Optional[asyncio.Task] = None
+        self.uno_task: Optional[asyncio.Task] = None
+        self.request_latency = LatencyStats()
+        self.ai_latency = LatencyStats()
+        self.timer_lag = LatencyStats()
+
+    def open_seats(self) -> List[int]:
+        return [i for i, p in enumerate(self.game.players)
+                if p.seat_type == SEAT_REMOTE and i not in self.seated]
+
+    def stats(self) -> dict:
+        return {
+            "finished": self.finished,
+            "ai_turns": self.ai_turns,
+            "requests": self.request_latency.summary(),
+            "ai_turn": self.ai_latency.summary(),
+            "timer_lag": self.timer_lag.summary(),
+        }
+
+
+class GameServer:
+    """
+    Hosts tables and drives their AI seats on the asyncio event loop
+    AI turns run as coroutines sleeping on asyncio timers, so thousands of
+    idle tables cost nothing until one of their timers fires.
+    """
+
+    def __init__(self, ai_delay: float = 1.0, max_ai_turns: int = 5000):
+        self.ai_delay = ai_delay
+        self.max_ai_turns = max_ai_turns
+        self.tables: Dict[str, Table] = {}
+        self._table_ids = itertools.count(1)
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0):
+        self._server = await asyncio.start_server(self._handle_client, host, port, limit=MAX_LINE_LENGTH)
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def serve_forever(self):
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        """Close every table, telling its clients, then stop accepting connections."""
+        connections = set()
+        for table in list(self.tables.values()):
+            connections.update(self._close_table(table))
+        for connection in connections:
+            try:
+                await connection.writer.drain()
+            except ConnectionError:
+                pass
+            connection.writer.close()
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+
+    def create_table(self, seat_types: List[str]) -> Table:
+        for seat_type in seat_types:
+            if seat_type not in SEAT_TYPES or seat_type == SEAT_HUMAN:
+                raise ProtocolError(f"Invalid seat type for a server table: {seat_type}")
+        if len(seat_types) < 2:
+            raise ProtocolError("Need at least 2 seats")
+        table = Table(f"t{next(self._table_ids)}", seat_types, self.ai_delay, self.max_ai_turns)
+        self.tables[table.table_id] = table
+        self._schedule(table)
+        return table
+
+    # ---- Connection handling ----
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        connection = Connection(writer)
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (asyncio.LimitOverrunError, ValueError):
+                    connection.send({"ok": False, "error": "Message too long"})
+                    break
+                if not line:
+                    break
+                received = loop.time()
+                request_id = None
+                table = None
+                try:
+                    request = decode_message(line)
+                    request_id = request.get("id")
+                    handler = getattr(self, f"_op_{request.get('op')}", None)
+                    if handler is None:
+                        raise ProtocolError(f"Unknown op: {request.get('op')}")
+                    table = self.tables.get(str(request.get("table")))
+                    reply = handler(connection, request)
+                    reply["ok"] = True
+                except ProtocolError as e:
+                    reply = {"ok": False, "error": str(e)}
+                except (TypeError, ValueError, IndexError) as e:
+                    # Wrongly typed fields, e.g. a list where a seat number belongs
+                    reply = {"ok": False, "error": f"Invalid request: {e}"}
+                if request_id is not None:
+                    reply["id"] = request_id
+                connection.send(reply)
+                await writer.drain()
+                if table is not None:
+                    table.request_latency.record(loop.time() - received)
+        except ConnectionError:
+            pass
+        finally:
+            self._disconnect(connection)
+            writer.close()
+
+    def _disconnect(self, connection: Connection):
+        for table_id, seat in connection.seats:
+            table = self.tables.get(table_id)
+            if table and table.seated.get(seat) is connection:
+                del table.seated[seat]
+        connection.last_views.clear()
+        for table_id in connection.watching:
+            table = self.tables.get(table_id)
+            if table:
+                table.spectators.remove(connection)
+                if not table.spectators:
+                    # Nobody flushes the ops any more; the next spectator starts a new stream
+                    table.differ.close()
+                    table.differ = None
+        connection.watching.clear()
+
+    def _get_table(self, request: dict) -> Table:
+        table = self.tables.get(str(request.get("table")))
+        if table is None:
+            raise ProtocolError(f"Unknown table: {request.get('table')}")
+        return table
+
+    def _get_seat(self, connection: Connection, request: dict):
+        table = self._get_table(request)
+        seat = request.get("seat")
+        if table.seated.get(seat) is not connection:
+            raise ProtocolError("Not seated at this seat")
+        if table.finished:
+            raise ProtocolError("Game is over")
+        return table, seat, table.game.players[seat]
+
+    def _require_turn(self, table: Table, seat: int):
+        if table.game.current_player_index != seat:
+            raise ProtocolError("Not your turn")
+
+    # ---- Protocol operations ----
+
+    def _op_create_table(self, connection: Connection, request: dict) -> dict:
+        seat_types = request.get("seats") or [SEAT_REMOTE, SEAT_AI, SEAT_AI, SEAT_AI]
+        table = self.create_table(list(seat_types))
+        return {"table": table.table_id, "open_seats": table.open_seats()}
+
+    def _op_list_tables(self, connection: Connection, request: dict) -> dict:
+        return {"tables": {table_id: {"open_seats": table.open_seats(), "finished": table.finished}
+                           for table_id, table in self.tables.items()}}
+
+    def _op_join(self, connection: Connection, request: dict) -> dict:
+        table = self._get_table(request)
+        open_seats = table.open_seats()
+        seat = request.get("seat", open_seats[0] if open_seats else None)
+        if seat not in open_seats:
+            raise ProtocolError("Seat is not available")
+        table.seated[seat] = connection
+        connection.seats.add((table.table_id, seat))
+        view = seat_view(table.game, seat)
+        connection.last_views[(table.table_id, seat)] = view
+        self._schedule(table)
+        return {"table": table.table_id, "seat": seat, "state": view}
+
+    def _op_state(self, connection: Connection, request: dict) -> dict:
+        table = self._get_table(request)
+        seat = request.get("seat")
+        if seat is not None and table.seated.get(seat) is not connection:
+            raise ProtocolError("Not seated at this seat")
+        view = seat_view(table.game, seat)
+        if seat is not None:
+            # Later deltas are relative to this full state
+            connection.last_views[(table.table_id, seat)] = view
+        return {"state": view}
+
+    def _op_watch(self, connection: Connection, request: dict) -> dict:
+        """Follow a table as a spectator; diffs arrive as base64 binary ops."""
+        table = self._get_table(request)
+        if table.differ is None:
+            table.differ = GameDiffer(table.game)
+            table.differ.flush()  # Start the shared stream from the current state
+        if table.table_id not in connection.watching:
+            table.spectators.append(connection)
+            connection.watching.add(table.table_id)
+        keyframe = encode_ops(keyframe_ops(table.game))
+        return {"table": table.table_id, "keyframe": base64.b64encode(keyframe).decode("ascii")}
+
+    def _op_play(self, connection: Connection, request: dict) -> dict:
+        table, seat, player = self._get_seat(connection, request)
+        self._require_turn(table, seat)
+        card = card_from_name(str(request.get("card")))
+        if card not in player.hand:
+            raise ProtocolError("Card not in hand")
+        if table.game.waiting_for_color or table.game.waiting_for_uno_call:
+            raise ProtocolError("Finish the current move first")
+        if not table.game.play_card(player, card):
+            raise ProtocolError("Card cannot be played")
+        self._after_move(table)
+        return {}
+
+    def _op_draw(self, connection: Connection, request: dict) -> dict:
+        table, seat, player = self._get_seat(connection, request)
+        self._require_turn(table, seat)
+        if table.game.waiting_for_color or table.game.waiting_for_uno_call:
+            raise ProtocolError("Finish the current move first")
+        if not table.game.can_draw_card(player):
+            raise ProtocolError("You have playable cards")
+        drawn_card = table.game.draw_card(player)
+        self._after_move(table)
+        # A returned card is playable and must be played next
+        return {"playable": str(drawn_card) if drawn_card else None}
+
+    def _op_select_color(self, connection: Connection, request: dict) -> dict:
+        table, seat, player = self._get_seat(connection, request)
+        self._require_turn(table, seat)
+        if not table.game.select_color(str(request.get("color"))):
+            raise ProtocolError("Cannot select color now")
+        self._after_move(table)
+        return {}
+
+    def _op_call_uno(self, connection: Connection, request: dict) -> dict:
+        table, seat, player = self._get_seat(connection, request)
+        if not table.game.call_uno(player):
+            raise ProtocolError("Invalid UNO call")
+        self._after_move(table)
+        return {}
+
+    def _op_stats(self, connection: Connection, request: dict) -> dict:
+        if request.get("table") is not None:
+            return {"stats": {request["table"]: self._get_table(request).stats()}}
+        return {"stats": {table_id: table.stats() for table_id, table in self.tables.items()}}
+
+    def _op_close_table(self, connection: Connection, request: dict) -> dict:
+        self._close_table(self._get_table(request))
+        return {}
+
+    def _close_table(self, table: Table) -> Set[Connection]:
+        """Remove a table and send a "table_closed" message to everyone seated at or watching it."""
+        self._cancel_tasks(table)
+        del self.tables[table.table_id]
+        if table.differ is not None:
+            table.differ.close()
+            table.differ = None
+        connections = set(table.seated.values()) | set(table.spectators)
+        for connection in connections:
+            connection.watching.discard(table.table_id)
+            connection.send({"type": "table_closed", "table": table.table_id})
+        return connections
+
+    # ---- Turn scheduling ----
+
+    def _after_move(self, table: Table):
+        if table.game.check_winner():
+            self._finish(table)
+        else:
+            self._schedule(table)
+        self._broadcast(table)
+
+    def _finish(self, table: Table):
+        table.finished = True
+        self._cancel_tasks(table)
+
+    def _cancel_tasks(self, table: Table):
+        for task in (table.ai_task, table.uno_task):
+            if task and not task.done() and task is not asyncio.current_task():
+                task.cancel()
+
+    def _schedule(self, table: Table):
+        """Start timers for whatever the table is waiting on."""
+        if table.finished or table.open_seats():
+            # Hold AI play until every remote seat has a client
+            return
+        game = table.game
+        if game.is_ai_turn and not game.waiting_for_color and (table.ai_task is None or table.ai_task.done()):
+            table.ai_task = asyncio.ensure_future(self._run_ai_turns(table))
+        current = game.get_current_player()
+        if (game.waiting_for_uno_call and current.seat_type == SEAT_REMOTE
+                and (table.uno_task is None or table.uno_task.done())):
+            table.uno_task = asyncio.ensure_future(self._uno_timeout(table))
+
+    async def _run_ai_turns(self, table: Table):
+        loop = asyncio.get_running_loop()
+        game = table.game
+        while game.is_ai_turn and not game.waiting_for_color and not table.finished:
+            wake_at = loop.time() + table.ai_delay
+            await asyncio.sleep(table.ai_delay)
+            started = loop.time()
+            table.timer_lag.record(max(0.0, started - wake_at))
+            game.handle_ai_turn()
+            table.ai_turns += 1
+            table.ai_latency.record(loop.time() - started)
+            if game.check_winner() or table.ai_turns >= table.max_ai_turns:
+                # The turn cap guards against tables stuck on an exhausted deck
+                self._finish(table)
+            self._broadcast(table)
+        self._schedule(table)
+
+    async def _uno_timeout(self, table: Table):
+        # handle_uno_timeout measures the window with time.time(), so wait it out fully
+        remaining = table.game.last_card_played_time + table.game.uno_call_window - time.time()
+        await asyncio.sleep(max(0.0, remaining) + 0.01)
+        if table.game.handle_uno_timeout():
+            self._after_move(table)
+
+    def _broadcast(self, table: Table):
+        for seat, connection in list(table.seated.items()):
+            key = (table.table_id, seat)
+            view = seat_view(table.game, seat)
+            changes = diff_views(connection.last_views.get(key, {}), view)
+            connection.last_views[key] = view
+            if changes:
+                connection.send({"type": "delta", "table": table.table_id, "seat": seat, "changes": changes})
+        if table.spectators:
+            # Encode once and send the same few bytes to every spectator
+            data = encode_ops(table.differ.flush())
+            if data:
+                message = {"type": "diff", "table": table.table_id, "data": base64.b64encode(data).decode("ascii")}
+                for connection in table.spectators:
+                    connection.send(message)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PyUNO multi-table game server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--ai-delay", type=float, default=1.0, help="Seconds an AI seat waits before playing")
+    args = parser.parse_args(argv)
+
+    async def run():
+        server = GameServer(ai_delay=args.ai_delay)
+        host, port = await server.start(args.host, args.port)
+        print(f"PyUNO server listening on {host}:{port}", flush=True)
+        await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
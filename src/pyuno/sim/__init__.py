@@ -0,0 +1,7 @@
+"""
+Headless simulations and AI tournaments for PyUNO
+"""
+
+from .headless import GameResult, play_headless_game
+
+__all__ = ['GameResult', 'play_headless_game']
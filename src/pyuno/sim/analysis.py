@@ -0,0 +1,316 @@
+"""
+Rule-balance statistics over large simulations
+Each game is summarised as one fixed-shape record (GAME_DTYPE): its
+winner, length and how many draw stacks of each length were paid off. BalanceStats folds chunks of records into running totals
+with NumPy reductions, so any number of games is analysed in constant
+memory, whether the chunks come straight from worker processes or from
+saved .npy files.
+
+Proportions (win rate by seat, games with a long draw stack) get Wilson
+score intervals and means get normal intervals. analyse() keeps
+simulating until every tracked interval is narrower than the target
+width, instead of playing a fixed number of games.
+
+Seat 0 always moves first, so its win rate against equal opponents is
+the first-player advantage. UNO penalties are not tracked: AI seats
+always call UNO, so they would always be zero here.
+
+    python -m pyuno.sim.analysis --seats 4 --target-width 0.01 --stack-threshold 8
+"""
+
+import argparse
+import glob
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from statistics import NormalDist
+from typing import Iterable, Iterator, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..ai.strategies import get_strategy
+from .headless import new_headless_game
+
+MAX_STACK = 32  # Longer draw stacks are counted as this long
+CHUNK_SIZE = 500
+
+GAME_DTYPE = np.dtype([
+    ("seed", np.int64),
+    ("seats", np.uint8),
+    ("winner", np.int8),  # -1 if the turn cap was hit
+    ("turns", np.int32),
+    ("stacks", np.uint16, (MAX_STACK + 1,)),  # stacks[n]: draw stacks of n cards paid off
+])
+
+
+def play_analysed_game(strategies: Sequence, seed: Optional[int] = None, max_turns: int = 2000) -> tuple:
+    """Play one headless game and return its GAME_DTYPE record as a tuple."""
+    game = new_headless_game(strategies, seed)
+    stacks = np.zeros(MAX_STACK + 1, dtype=np.uint16)
+    turns = 0
+    while turns < max_turns and not game.check_winner():
+        pending = game.draw_cards_pending if game.draw_stack_active else 0
+        if not game.handle_ai_turn():
+            break
+        turns += 1
+        # A stack ends within the turn that pays it; nobody can start a new one in that turn
+        if pending and not game.draw_stack_active:
+            stacks[min(pending, MAX_STACK)] += 1
+    winner = game.check_winner()
+    return (-1 if seed is None else seed, len(game.players), game.players.index(winner) if winner else -1, turns,
+            stacks)
+
+
+def _simulate(job) -> np.ndarray:
+    """Worker: play a block of seeds and return their records."""
+    strategy_names, first_seed, games, max_turns = job
+    records = np.zeros(games, dtype=GAME_DTYPE)
+    for i in range(games):
+        strategies = [get_strategy(name) for name in strategy_names]
+        records[i] = play_analysed_game(strategies, first_seed + i, max_turns)
+    return records
+
+
+def simulate_chunks(strategy_names: Sequence[str], games: int, seed: int = 0, chunk_size: int = CHUNK_SIZE,
+                    max_turns: int = 2000, workers: Optional[int] = None) -> Iterator[np.ndarray]:
+    """
+    Yield records for games seed, seed + 1, ... in chunks, in order
+    Only a couple of chunks per worker are queued ahead, so closing the
+    generator early leaves little simulation wasted. workers=0 plays
+    everything in this process.
+    """
+    for name in strategy_names:
+        get_strategy(name)  # Fail early on unknown names
+    jobs = ((list(strategy_names), first, min(chunk_size, seed + games - first), max_turns)
+            for first in range(seed, seed + games, chunk_size))
+    if workers == 0:
+        yield from map(_simulate, jobs)
+        return
+    workers = workers or os.cpu_count() or 1
+    executor = ProcessPoolExecutor(workers)
+    try:
+        queued = deque(executor.submit(_simulate, job) for job in islice(jobs, 2 * workers))
+        while queued:
+            records = queued.popleft().result()
+            queued.extend(executor.submit(_simulate, job) for job in islice(jobs, 1))
+            yield records
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def load_chunks(paths: Iterable[str], chunk_size: int = 100_000) -> Iterator[np.ndarray]:
+    """Yield saved records chunk by chunk from memory-mapped .npy files."""
+    for path in paths:
+        records = np.load(path, mmap_mode="r")
+        if records.dtype != GAME_DTYPE:
+            raise ValueError(f"{path} does not hold game records")
+        for start in range(0, len(records), chunk_size):
+            yield records[start:start + chunk_size]
+
+
+def wilson_interval(successes, trials, z: float = 1.96) -> Tuple[np.ndarray, np.ndarray]:
+    """Wilson score interval for successes out of trials; works elementwise on arrays."""
+    successes = np.asarray(successes, dtype=float)
+    trials = np.maximum(np.asarray(trials, dtype=float), 1.0)
+    p = successes / trials
+    denominator = 1 + z * z / trials
+    centre = (p + z * z / (2 * trials)) / denominator
+    spread = z * np.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denominator
+    return np.clip(centre - spread, 0.0, 1.0), np.clip(centre + spread, 0.0, 1.0)
+
+
+class BalanceStats:
+    """
+    Running totals over game records of one table size
+    Everything is kept as counts (wins per seat, histograms of game
+    length and stack length), so update() costs the same however many
+    games came before and any threshold can be asked about afterwards.
+    """
+
+    def __init__(self, seats: int, confidence: float = 0.95):
+        self.seats = seats
+        self.confidence = confidence
+        self.z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        self.games = 0
+        self.stalled = 0
+        self.wins = np.zeros(seats, dtype=np.int64)
+        self.length_counts = np.zeros(0, dtype=np.int64)  # length_counts[n]: games of n turns
+        self.stack_counts = np.zeros(MAX_STACK + 1, dtype=np.int64)  # Paid-off stacks by length
+        self.longest_stack_counts = np.zeros(MAX_STACK + 1, dtype=np.int64)  # Games by their longest stack
+
+    def update(self, records: np.ndarray):
+        if len(records) == 0:
+            return
+        if (records["seats"] != self.seats).any():
+            raise ValueError(f"Records are not all from {self.seats}-seat games")
+        self.games += len(records)
+        winners = records["winner"]
+        self.wins += np.bincount(winners[winners >= 0], minlength=self.seats)
+        self.stalled += int((winners < 0).sum())
+        self.length_counts = _add_counts(self.length_counts, np.bincount(records["turns"]))
+        stacks = records["stacks"]
+        self.stack_counts += stacks.sum(axis=0, dtype=np.int64)
+        longest = np.where(stacks > 0, np.arange(MAX_STACK + 1), 0).max(axis=1)
+        self.longest_stack_counts += np.bincount(longest, minlength=MAX_STACK + 1)
+
+    # ---- Win rates ----
+
+    def win_rates(self) -> np.ndarray:
+        return self.wins / max(self.games, 1)
+
+    def win_rate_intervals(self) -> Tuple[np.ndarray, np.ndarray]:
+        return wilson_interval(self.wins, self.games, self.z)
+
+    # ---- Game length ----
+
+    def length_mean(self) -> Tuple[float, float]:
+        """Mean game length in turns and the half-width of its interval."""
+        return _mean_interval(self.length_counts, self.z)
+
+    def length_quantiles(self, quantiles: Sequence[float] = (0.1, 0.5, 0.9)) -> np.ndarray:
+        cumulative = np.cumsum(self.length_counts)
+        if not self.games:
+            return np.zeros(len(quantiles), dtype=np.int64)
+        return np.searchsorted(cumulative, np.asarray(quantiles) * cumulative[-1])
+
+    # ---- Draw stacks ----
+
+    def stack_share_over(self, threshold: int) -> float:
+        """Share of paid-off draw stacks longer than threshold cards."""
+        total = self.stack_counts.sum()
+        return float(self.stack_counts[threshold + 1:].sum() / total) if total else 0.0
+
+    def games_with_stack_over(self, threshold: int) -> Tuple[float, float, float]:
+        """Share of games with a draw stack longer than threshold cards, and its interval."""
+        hits = self.longest_stack_counts[threshold + 1:].sum()
+        low, high = wilson_interval(hits, self.games, self.z)
+        return float(hits / max(self.games, 1)), float(low), float(high)
+
+    def widest_interval(self, stack_threshold: Optional[int] = None) -> float:
+        """Width of the widest tracked interval: every seat's win rate, plus long stacks if a threshold is given."""
+        low, high = self.win_rate_intervals()
+        widest = float((high - low).max())
+        if stack_threshold is not None:
+            _, low, high = self.games_with_stack_over(stack_threshold)
+            widest = max(widest, high - low)
+        return widest
+
+    def report(self, stack_threshold: int = 8) -> str:
+        percent = f"{self.confidence:.0%}"
+        lines = [f"{self.games:,} games, {self.seats} seats, {self.stalled:,} stalled"]
+        lines.append(f"{'Seat':<6} {'Win rate':>9} {percent + ' CI':>17}")
+        low, high = self.win_rate_intervals()
+        for seat, rate in enumerate(self.win_rates()):
+            lines.append(f"{seat:<6} {rate:>9.2%} {f'{low[seat]:.2%}-{high[seat]:.2%}':>17}")
+        mean, spread = self.length_mean()
+        p10, p50, p90 = self.length_quantiles()
+        lines.append(f"Game length: mean {mean:.1f} +/- {spread:.1f} turns, median {p50}, 10%-90% {p10}-{p90}")
+        stacks = self.stack_counts.sum()
+        if stacks:
+            lengths = np.flatnonzero(self.stack_counts)
+            histogram = ", ".join(f"{n}{'+' if n == MAX_STACK else ''}: {self.stack_counts[n]:,}" for n in lengths)
+            lines.append(f"Draw stacks paid: {stacks:,} ({histogram})")
+        rate, low, high = self.games_with_stack_over(stack_threshold)
+        lines.append(f"Stacks over {stack_threshold} cards: {self.stack_share_over(stack_threshold):.2%} of stacks, "
+                     f"in {rate:.2%} of games ({low:.2%}-{high:.2%})")
+        return "\n".join(lines)
+
+
+def _add_counts(totals: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    if len(counts) > len(totals):
+        totals = np.concatenate([totals, np.zeros(len(counts) - len(totals), dtype=totals.dtype)])
+    totals[:len(counts)] += counts
+    return totals
+
+
+def _mean_interval(counts: np.ndarray, z: float) -> Tuple[float, float]:
+    """Mean of a histogram's values and its normal interval half-width."""
+    total = counts.sum()
+    if not total:
+        return 0.0, 0.0
+    values = np.arange(len(counts))
+    mean = (values * counts).sum() / total
+    variance = ((values - mean) ** 2 * counts).sum() / max(total - 1, 1)
+    return float(mean), float(z * np.sqrt(variance / total))
+
+
+def analyse(chunks: Iterable[np.ndarray], seats: int, target_width: Optional[float] = None,
+            min_games: int = 1000, stack_threshold: Optional[int] = None, confidence: float = 0.95,
+            progress=None) -> BalanceStats:
+    """
+    Fold chunks of records into BalanceStats
+    With a target width, stops taking chunks (and closes a generator,
+    which stops its simulation) once min_games are in and every tracked
+    interval is narrower than target_width.
+    """
+    stats = BalanceStats(seats, confidence)
+    chunks = iter(chunks)
+    try:
+        for records in chunks:
+            stats.update(records)
+            if progress:
+                progress(stats)
+            if (target_width is not None and stats.games >= min_games
+                    and stats.widest_interval(stack_threshold) <= target_width):
+                break
+    finally:
+        close = getattr(chunks, "close", None)
+        if close:
+            close()
+    return stats
+
+
+def _saving(chunks: Iterator[np.ndarray], out_dir: str) -> Iterator[np.ndarray]:
+    try:
+        for i, records in enumerate(chunks):
+            np.save(os.path.join(out_dir, f"games_{i:05d}.npy"), records)
+            yield records
+    finally:
+        chunks.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure rule balance over simulated PyUNO games")
+    parser.add_argument("--seats", type=int, default=4)
+    parser.add_argument("--strategies", default="", help="Comma-separated strategies, one per seat (default: all default)")
+    parser.add_argument("--target-width", type=float, default=0.02,
+                        help="Stop once every confidence interval is narrower than this (0 = play --max-games)")
+    parser.add_argument("--confidence", type=float, default=0.95)
+    parser.add_argument("--stack-threshold", type=int, default=8, help="Report games with draw stacks longer than this")
+    parser.add_argument("--min-games", type=int, default=1000)
+    parser.add_argument("--max-games", type=int, default=1_000_000)
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (0 = run in this process)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save", metavar="DIR", default=None, help="Also write each chunk of records to DIR")
+    parser.add_argument("--input", metavar="DIR", default=None, help="Analyse records saved with --save instead")
+    args = parser.parse_args(argv)
+
+    if args.input:
+        paths = sorted(glob.glob(os.path.join(args.input, "*.npy")))
+        chunks = load_chunks(paths)
+        seats = int(np.load(paths[0], mmap_mode="r")["seats"][0]) if paths else args.seats
+    else:
+        names = args.strategies.split(",") if args.strategies else ["default"] * args.seats
+        seats = len(names)
+        chunks = simulate_chunks(names, args.max_games, args.seed, args.chunk_size, workers=args.workers)
+    if args.save:
+        os.makedirs(args.save, exist_ok=True)
+        chunks = _saving(chunks, args.save)
+
+    start = time.perf_counter()
+
+    def progress(stats):
+        elapsed = time.perf_counter() - start
+        print(f"{stats.games:,} games ({stats.games / elapsed:,.0f}/s), "
+              f"widest interval {stats.widest_interval(args.stack_threshold):.4f}", flush=True)
+
+    stats = analyse(chunks, seats, args.target_width or None, args.min_games, args.stack_threshold,
+                    args.confidence, progress)
+    print(stats.report(args.stack_threshold))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Many tables played in lockstep against a batched policy
+Every round, each table's other seats take their turns as usual until a
+policy seat has to decide; those decisions are queued in a PolicyBatcher
+and answered with one forward pass, so the per-decision cost of the
+network is spread over every table in play.
+
+    python -m pyuno.sim.batched --tables 2000 --weights policy.npz
+"""
+
+import argparse
+import time
+from typing import List, Optional, Sequence
+
+from ..ai.encoding import apply_action
+from ..ai.policy import MLPPolicy, PolicyBatcher, PolicyStrategy
+from ..ai.strategies import get_strategy
+from .headless import GameResult, new_headless_game, play_headless_game, run_until_seat
+
+
+def play_policy_tables(policy: MLPPolicy, tables: int, opponents: Sequence[Optional[str]] = (None, None, None),
+                       policy_seat: int = 0, seed: int = 0, max_turns: int = 2000,
+                       batcher: Optional[PolicyBatcher] = None) -> List[GameResult]:
+    """
+    Play tables games with the policy in policy_seat, one result per table
+    opponents names the strategies of the other seats in order (None for
+    the built-in AI); table i uses seed + i.
+    """
+    if batcher is None:
+        batcher = PolicyBatcher(policy, capacity=tables)
+    strategies = [get_strategy(name) if name else None for name in opponents]
+    strategies.insert(policy_seat, None)
+    games = [new_headless_game(strategies, seed + i) for i in range(tables)]
+    turns = [0] * tables
+    active = list(range(tables))
+    while active:
+        waiting = []
+        for i in active:
+            turns[i] = run_until_seat(games[i], policy_seat, turns[i], max_turns)
+            if turns[i] < max_turns and not games[i].check_winner():
+                waiting.append(i)
+        for i in waiting:
+            batcher.submit(games[i], policy_seat)
+        for i, action in zip(waiting, batcher.evaluate()):
+            game = games[i]
+            apply_action(game, int(action))
+            if not game.waiting_for_color:
+                turns[i] += 1
+        active = waiting
+
+    results = []
+    for i, game in enumerate(games):
+        winner = game.check_winner()
+        results.append(GameResult(
+            winner=game.players.index(winner) if winner else None,
+            turns=turns[i],
+            hand_sizes=tuple(len(player.hand) for player in game.players),
+            seed=seed + i,
+        ))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Play many tables against a batched NumPy policy")
+    parser.add_argument("--weights", help="Policy .npz (default: an untrained random policy)")
+    parser.add_argument("--tables", type=int, default=1000)
+    parser.add_argument("--opponents", default="default,default,default",
+                        help="Comma-separated strategies for the other seats")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--compare", action="store_true", help="Also time the same games one decision at a time")
+    args = parser.parse_args(argv)
+
+    policy = MLPPolicy.load(args.weights) if args.weights else MLPPolicy.random(seed=args.seed)
+    opponents = [None if name == "default" else name for name in args.opponents.split(",")]
+    batcher = PolicyBatcher(policy, capacity=args.tables)
+
+    start = time.perf_counter()
+    results = play_policy_tables(policy, args.tables, opponents, seed=args.seed, batcher=batcher)
+    elapsed = time.perf_counter() - start
+    wins = sum(result.winner == 0 for result in results)
+    print(f"{args.tables} tables in {elapsed:.2f}s, policy won {wins / args.tables:.1%}")
+    print(f"{batcher.decisions:,} decisions in {batcher.batches} batches "
+          f"({batcher.decisions / elapsed:,.0f} decisions/s)")
+
+    if args.compare:
+        strategy = PolicyStrategy(policy)
+        strategies = [strategy] + [get_strategy(name) if name else None for name in opponents]
+        start = time.perf_counter()
+        for i in range(args.tables):
+            play_headless_game(strategies, args.seed + i)
+        print(f"Unbatched: {args.tables} tables in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
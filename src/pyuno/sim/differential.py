@@ -0,0 +1,287 @@
+"""
+Differential fuzzing of game engines against the reference rules
+A seeded random walker generates move sequences; the reference Game and
+an alternative engine are driven in lockstep from the same seed, and the
+full state and every move's result are compared after each move. A
+diverging sequence is shrunk to a minimal one before it is reported.
+
+An engine is any class with Game's from_seat_types(seat_types, rng=...)
+constructor and its play_card, draw_card, select_color, call_uno,
+handle_ai_turn and next_player methods, consuming the rng the same way.
+
+    python -m pyuno.sim.differential --engine mypackage.fast_engine:FastGame --games 50000
+"""
+
+import argparse
+import importlib
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from operator import attrgetter
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+from ..core.uno_classes import Game, SEAT_HUMAN, SEAT_AI
+
+COLORS = ("red", "yellow", "green", "blue")
+MAX_MOVES = 300
+
+_name = attrgetter("name")
+
+# Order of the values in snapshot(); used to name the fields that differ
+STATE_FIELDS = ("deck", "discard_pile", "hands", "uno_flags", "current_player", "direction",
+                "draw_cards_pending", "draw_stack_active", "selected_color", "waiting_for_color",
+                "waiting_for_uno_call", "skip_next_turn", "is_ai_turn", "last_played_card",
+                "game_started", "reshuffle_count")
+
+
+def snapshot(game) -> tuple:
+    """Everything about a game that the rules decide, as a comparable tuple."""
+    return (
+        tuple(map(_name, game.deck.cards)),
+        tuple(map(_name, game.deck.discard_pile)),
+        tuple(tuple(map(_name, player.hand)) for player in game.players),
+        tuple((player.has_called_uno, player.uno_penalties) for player in game.players),
+        game.current_player_index,
+        game.direction,
+        game.draw_cards_pending,
+        game.draw_stack_active,
+        game.selected_color,
+        game.waiting_for_color,
+        game.waiting_for_uno_call,
+        game.skip_next_turn,
+        game.is_ai_turn,
+        game.last_played_card.name if game.last_played_card else None,
+        game.game_started,
+        game.deck.reshuffle_count,
+    )
+
+
+def seat_types_for(seed: int) -> List[str]:
+    """2 to 6 seats with a seed-dependent mix of human and AI seats."""
+    rng = random.Random(seed)
+    return [rng.choice((SEAT_HUMAN, SEAT_AI)) for _ in range(rng.randint(2, 6))]
+
+
+def new_game(engine, seed: int):
+    game = engine.from_seat_types(seat_types_for(seed), rng=random.Random(seed))
+    game.start_game()
+    return game
+
+
+def apply_move(game, move: tuple):
+    """
+    Play one move and return its result in engine-neutral form
+    Hand indices wrap around the hand, so a move stays meaningful (if not
+    identical) when shrinking removes the moves before it.
+    """
+    kind = move[0]
+    try:
+        if kind == "ai":
+            return game.handle_ai_turn()
+        if kind == "color":
+            return game.select_color(move[1])
+        if kind == "next":
+            game.next_player()
+            return None
+        player = game.players[move[1] % len(game.players)]
+        if kind == "uno":
+            return game.call_uno(player)
+        if kind == "draw":
+            card = game.draw_card(player)
+            return card.name if card else None
+        if not player.hand:
+            return "empty hand"
+        return game.play_card(player, player.hand[move[2] % len(player.hand)])
+    except Exception as e:
+        return f"raised {type(e).__name__}"
+
+
+def next_move(game, rng: random.Random) -> tuple:
+    """
+    Pick a move for the walker, mostly legal ones so games run to the end
+    with the odd out-of-turn, unplayable or invalid move mixed in.
+    """
+    current = game.current_player_index
+    roll = rng.random()
+    if roll < 0.03:
+        return "next",
+    if roll < 0.08:
+        # Someone acting out of turn
+        return rng.choice(("play", "draw", "uno")), rng.randrange(len(game.players)), rng.randrange(8)
+    if game.waiting_for_color:
+        return "color", rng.choice(COLORS) if roll < 0.95 else "purple"
+    if game.waiting_for_uno_call and roll < 0.7:
+        return "uno", current
+    if game.is_ai_turn and roll < 0.5:
+        return "ai",
+    player = game.players[current]
+    top_card = game.deck.get_top_card()
+    playable = [i for i, card in enumerate(player.hand) if top_card and card.can_play_on(top_card, game.selected_color)]
+    if playable and roll < 0.8:
+        return "play", current, rng.choice(playable)
+    if roll < 0.9:
+        return "draw", current
+    return "play", current, rng.randrange(max(1, len(player.hand)))
+
+
+class Divergence(NamedTuple):
+    seed: int
+    moves: Tuple[tuple, ...]  # The moves up to and including the one where the engines disagreed
+    fields: Tuple[str, ...]  # State fields that differ, or ("result",) if only the return value did
+    expected: tuple
+    actual: tuple
+
+
+def compare(reference, candidate) -> Tuple[str, ...]:
+    expected, actual = snapshot(reference), snapshot(candidate)
+    if expected == actual:
+        return ()
+    return tuple(name for name, a, b in zip(STATE_FIELDS, expected, actual) if a != b)
+
+
+def replay(engine, seed: int, moves: Sequence[tuple], reference=Game) -> Optional[Divergence]:
+    """Replay moves on both engines; the first divergence, or None if they agree throughout."""
+    expected, actual = new_game(reference, seed), new_game(engine, seed)
+    fields = compare(expected, actual)
+    if fields:
+        return Divergence(seed, (), fields, snapshot(expected), snapshot(actual))
+    for i, move in enumerate(moves):
+        expected_result, actual_result = apply_move(expected, move), apply_move(actual, move)
+        fields = compare(expected, actual)
+        if fields or expected_result != actual_result:
+            return Divergence(seed, tuple(moves[:i + 1]), fields or ("result",),
+                              (expected_result, snapshot(expected)), (actual_result, snapshot(actual)))
+    return None
+
+
+def walk(engine, seed: int, max_moves: int = MAX_MOVES, reference=Game) -> Optional[Divergence]:
+    """Play one random game on both engines in lockstep; the first divergence, or None."""
+    expected, actual = new_game(reference, seed), new_game(engine, seed)
+    fields = compare(expected, actual)
+    if fields:
+        return Divergence(seed, (), fields, snapshot(expected), snapshot(actual))
+    rng = random.Random(~seed)
+    moves = []
+    for _ in range(max_moves):
+        if expected.check_winner():
+            break
+        move = next_move(expected, rng)
+        moves.append(move)
+        expected_result, actual_result = apply_move(expected, move), apply_move(actual, move)
+        fields = compare(expected, actual)
+        if fields or expected_result != actual_result:
+            return Divergence(seed, tuple(moves), fields or ("result",),
+                              (expected_result, snapshot(expected)), (actual_result, snapshot(actual)))
+    return None
+
+
+def shrink(engine, divergence: Divergence, reference=Game) -> Divergence:
+    """
+    Delta-debug a divergence down to a short move sequence that still diverges
+    Removes ever smaller chunks of moves while the engines keep disagreeing,
+    then returns the first divergence of the smallest sequence found.
+    """
+    moves = list(divergence.moves)
+    chunk = max(1, len(moves) // 2)
+    while moves:
+        i = 0
+        removed = False
+        while i < len(moves):
+            candidate = moves[:i] + moves[i + chunk:]
+            if replay(engine, divergence.seed, candidate, reference):
+                moves = candidate
+                removed = True
+            else:
+                i += chunk
+        if chunk == 1 and not removed:
+            break
+        chunk = max(1, chunk // 2)
+    return replay(engine, divergence.seed, moves, reference) or divergence
+
+
+def _fuzz_seeds(job) -> Tuple[int, Optional[Divergence]]:
+    """Worker: walk a range of seeds; returns games played and the first divergence."""
+    engine_spec, first_seed, count, max_moves = job
+    engine = load_engine(engine_spec)
+    for seed in range(first_seed, first_seed + count):
+        divergence = walk(engine, seed, max_moves)
+        if divergence:
+            return seed - first_seed + 1, divergence
+    return count, None
+
+
+def load_engine(spec: str):
+    """Resolve 'package.module:ClassName' to the engine class."""
+    module_name, _, attr = spec.partition(":")
+    return getattr(importlib.import_module(module_name), attr or "Game")
+
+
+def fuzz(engine_spec: str, games: int, seed: int = 0, workers: Optional[int] = None,
+         max_moves: int = MAX_MOVES, chunk_size: int = 500) -> Tuple[int, Optional[Divergence]]:
+    """
+    Walk games with consecutive seeds until one diverges
+    Returns the number of games played and the shrunk divergence, or None.
+    workers=0 runs in this process; engines are passed by spec so workers can import them.
+    """
+    jobs = [(engine_spec, first, min(chunk_size, seed + games - first), max_moves)
+            for first in range(seed, seed + games, chunk_size)]
+    played = 0
+    found = None
+    if workers == 0:
+        results = map(_fuzz_seeds, jobs)
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        results = executor.map(_fuzz_seeds, jobs)
+    try:
+        for count, divergence in results:
+            played += count
+            if divergence:
+                found = divergence
+                break
+    finally:
+        if workers != 0:
+            executor.shutdown(cancel_futures=True)
+    if found:
+        found = shrink(load_engine(engine_spec), found)
+    return played, found
+
+
+def format_divergence(divergence: Divergence) -> str:
+    lines = [f"Engines diverge on seed {divergence.seed} after {len(divergence.moves)} moves "
+             f"(seats {', '.join(seat_types_for(divergence.seed))}):"]
+    lines += [f"  {i + 1:3}. {move}" for i, move in enumerate(divergence.moves)]
+    lines.append(f"Differing: {', '.join(divergence.fields)}")
+    if divergence.fields == ("result",):
+        lines.append(f"  reference returned {divergence.expected[0]!r}, engine returned {divergence.actual[0]!r}")
+    else:
+        expected, actual = divergence.expected[-1], divergence.actual[-1]
+        for name in divergence.fields:
+            index = STATE_FIELDS.index(name)
+            lines.append(f"  {name}: reference {expected[index]!r}")
+            lines.append(f"  {' ' * len(name)}  engine    {actual[index]!r}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fuzz a PyUNO engine against the reference rules")
+    parser.add_argument("--engine", default="pyuno.core.uno_classes:Game",
+                        help="Engine to check, as module:Class (default: the reference engine itself)")
+    parser.add_argument("--games", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0, help="First seed; games use consecutive seeds")
+    parser.add_argument("--max-moves", type=int, default=MAX_MOVES)
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (0 = run in this process)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    played, divergence = fuzz(args.engine, args.games, args.seed, args.workers, args.max_moves)
+    elapsed = time.perf_counter() - start
+    print(f"{played} games in {elapsed:.1f}s ({played / elapsed * 60:,.0f} games/min)")
+    if divergence:
+        print(format_divergence(divergence))
+        return 1
+    print("No divergence found")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
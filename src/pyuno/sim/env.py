@@ -0,0 +1,298 @@
+"""
+Reinforcement-learning environments over Game
+UnoEnv follows the Gymnasium API (reset/step returning terminated and
+truncated flags) without depending on it. The agent plays one seat and
+the other seats are AI strategies played between its decisions.
+Observations and legal-action masks come from ai/encoding.py; the reward
+is 1 for a win, -1 for a loss and 0 otherwise.
+
+Observations are written into preallocated arrays and the same arrays
+are returned on every call, so copy them to keep them. SyncVectorEnv
+steps N games in this process and AsyncVectorEnv spreads them over
+worker processes writing into shared memory; both reset finished games
+in the same step, so the returned observation is then the new game's.
+
+    python -m pyuno.sim.env --envs 64 --steps 2000 --workers 4
+"""
+
+import argparse
+import multiprocessing
+import os
+import time
+from typing import Optional, Sequence
+
+import numpy as np
+
+from ..ai.encoding import OBS_SIZE, NUM_ACTIONS, apply_action, encode_observation, legal_mask, new_mask, new_observation
+from ..ai.strategies import get_strategy
+from .headless import new_headless_game, run_until_seat
+
+
+class UnoEnv:
+    observation_shape = (OBS_SIZE,)
+    num_actions = NUM_ACTIONS
+
+    def __init__(self, opponents: Sequence[Optional[str]] = (None, None, None), seat: int = 0,
+                 max_turns: int = 2000, obs: Optional[np.ndarray] = None, mask: Optional[np.ndarray] = None,
+                 seed_stride: int = 1):
+        """
+        opponents names the strategies of the other seats in order (None for
+        the built-in AI). obs and mask may be rows of a caller's batch arrays.
+        A reset without a seed continues from the last one by seed_stride.
+        """
+        self.strategies = [get_strategy(name) if name else None for name in opponents]
+        self.strategies.insert(seat, None)
+        self.seat = seat
+        self.max_turns = max_turns
+        self.obs = new_observation() if obs is None else obs
+        self.mask = new_mask() if mask is None else mask
+        self.info = {"action_mask": self.mask}
+        self.seed_stride = seed_stride
+        self.seed: Optional[int] = None
+        self.game = None
+        self.turns = 0
+
+    def reset(self, seed: Optional[int] = None):
+        if seed is None and self.seed is not None:
+            seed = self.seed + self.seed_stride
+        self.seed = seed
+        self.game = new_headless_game(self.strategies, seed)
+        self.turns = run_until_seat(self.game, self.seat, 0, self.max_turns)
+        self._observe()
+        return self.obs, self.info
+
+    def step(self, action: int):
+        if not self.mask[action]:
+            raise ValueError(f"Illegal action {action}")
+        game = self.game
+        apply_action(game, int(action))
+        if not game.waiting_for_color:
+            self.turns += 1
+        self.turns = run_until_seat(game, self.seat, self.turns, self.max_turns)
+        self._observe()
+        winner = game.check_winner()
+        if winner is not None:
+            return self.obs, 1.0 if game.players.index(winner) == self.seat else -1.0, True, False, self.info
+        return self.obs, 0.0, False, self.turns >= self.max_turns, self.info
+
+    def _observe(self):
+        encode_observation(self.game, self.seat, self.obs)
+        legal_mask(self.game, self.seat, self.mask)
+
+
+def _step_envs(envs, actions, rewards, terminated, truncated):
+    """Step each env with its action into the given rows, resetting the ones that finish."""
+    for i, env in enumerate(envs):
+        _, rewards[i], terminated[i], truncated[i], _ = env.step(actions[i])
+        if terminated[i] or truncated[i]:
+            env.reset()
+
+
+def _reset_envs(envs, seed: Optional[int], first: int):
+    for i, env in enumerate(envs):
+        env.reset(None if seed is None else seed + first + i)
+
+
+class SyncVectorEnv:
+    """Steps num_envs games in turn in this process."""
+
+    def __init__(self, num_envs: int, opponents: Sequence[Optional[str]] = (None, None, None), seat: int = 0,
+                 max_turns: int = 2000):
+        self.num_envs = num_envs
+        self.obs = new_observation(num_envs)
+        self.masks = new_mask(num_envs)
+        self.rewards = np.zeros(num_envs, dtype=np.float32)
+        self.terminated = np.zeros(num_envs, dtype=bool)
+        self.truncated = np.zeros(num_envs, dtype=bool)
+        self.info = {"action_mask": self.masks}
+        self.envs = [UnoEnv(opponents, seat, max_turns, self.obs[i], self.masks[i], seed_stride=num_envs)
+                     for i in range(num_envs)]
+
+    def reset(self, seed: Optional[int] = None):
+        """Env i starts from seed + i and its later games from seed + i + k * num_envs."""
+        _reset_envs(self.envs, seed, 0)
+        return self.obs, self.info
+
+    def step(self, actions: Sequence[int]):
+        _step_envs(self.envs, actions, self.rewards, self.terminated, self.truncated)
+        return self.obs, self.rewards, self.terminated, self.truncated, self.info
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+_SHARED_FIELDS = (
+    ("obs", np.uint8, (OBS_SIZE,)),
+    ("masks", np.bool_, (NUM_ACTIONS,)),
+    ("rewards", np.float32, ()),
+    ("terminated", np.bool_, ()),
+    ("truncated", np.bool_, ()),
+    ("actions", np.int64, ()),
+)
+
+
+def _shared_arrays(buffers, num_envs: int) -> dict:
+    return {name: np.frombuffer(buffer, dtype=dtype).reshape((num_envs, *shape))
+            for (name, dtype, shape), buffer in zip(_SHARED_FIELDS, buffers)}
+
+
+def _worker(conn, buffers, num_envs: int, first: int, last: int, opponents, seat: int, max_turns: int):
+    """Host envs first..last-1, reading actions from and writing results to the shared arrays."""
+    arrays = _shared_arrays(buffers, num_envs)
+    rows = slice(first, last)
+    envs = [UnoEnv(opponents, seat, max_turns, arrays["obs"][i], arrays["masks"][i], seed_stride=num_envs)
+            for i in range(first, last)]
+    try:
+        while True:
+            command, data = conn.recv()
+            if command == "close":
+                break
+            try:
+                if command == "step":
+                    _step_envs(envs, arrays["actions"][rows], arrays["rewards"][rows], arrays["terminated"][rows],
+                               arrays["truncated"][rows])
+                else:
+                    _reset_envs(envs, data, first)
+            except Exception as e:
+                conn.send(f"{type(e).__name__}: {e}")
+            else:
+                conn.send(None)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        conn.close()
+
+
+class AsyncVectorEnv:
+    """
+    Steps num_envs games split over worker processes
+    Results land in shared memory, so a step only sends one short message
+    to each worker and back. step_async() and step_wait() let the caller
+    work while the games are played.
+    """
+
+    def __init__(self, num_envs: int, opponents: Sequence[Optional[str]] = (None, None, None), seat: int = 0,
+                 max_turns: int = 2000, workers: Optional[int] = None):
+        workers = max(1, min(workers or os.cpu_count() or 1, num_envs))
+        self.num_envs = num_envs
+        ctx = multiprocessing.get_context()
+        buffers = [ctx.RawArray("b", num_envs * int(np.prod(shape, dtype=int)) * np.dtype(dtype).itemsize)
+                   for _, dtype, shape in _SHARED_FIELDS]
+        arrays = _shared_arrays(buffers, num_envs)
+        self.obs = arrays["obs"]
+        self.masks = arrays["masks"]
+        self.rewards = arrays["rewards"]
+        self.terminated = arrays["terminated"]
+        self.truncated = arrays["truncated"]
+        self._actions = arrays["actions"]
+        self.info = {"action_mask": self.masks}
+        self._conns = []
+        self._processes = []
+        bounds = np.linspace(0, num_envs, workers + 1).astype(int).tolist()
+        for first, last in zip(bounds, bounds[1:]):
+            parent, child = ctx.Pipe()
+            process = ctx.Process(target=_worker, daemon=True,
+                                  args=(child, buffers, num_envs, first, last, list(opponents), seat, max_turns))
+            process.start()
+            child.close()
+            self._conns.append(parent)
+            self._processes.append(process)
+
+    def _call(self, command, data=None):
+        for conn in self._conns:
+            conn.send((command, data))
+
+    def _wait(self):
+        errors = [error for error in (conn.recv() for conn in self._conns) if error]
+        if errors:
+            raise RuntimeError(f"Env worker failed: {errors[0]}")
+
+    def reset(self, seed: Optional[int] = None):
+        """Env i starts from seed + i and its later games from seed + i + k * num_envs."""
+        self._call("reset", seed)
+        self._wait()
+        return self.obs, self.info
+
+    def step_async(self, actions: Sequence[int]):
+        self._actions[:] = actions
+        self._call("step")
+
+    def step_wait(self):
+        self._wait()
+        return self.obs, self.rewards, self.terminated, self.truncated, self.info
+
+    def step(self, actions: Sequence[int]):
+        self.step_async(actions)
+        return self.step_wait()
+
+    def close(self):
+        if not self._processes:
+            return
+        for conn in self._conns:
+            try:
+                conn.send(("close", None))
+            except (BrokenPipeError, OSError):
+                pass
+            conn.close()
+        for process in self._processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        self._conns, self._processes = [], []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+
+def random_actions(masks: np.ndarray, rng: np.random.Generator, scratch: Optional[np.ndarray] = None) -> np.ndarray:
+    """A uniformly random legal action per row of masks."""
+    if scratch is None:
+        scratch = np.empty(masks.shape)
+    rng.random(out=scratch)
+    scratch *= masks
+    return scratch.argmax(axis=1)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure PyUNO environment steps per second")
+    parser.add_argument("--envs", type=int, default=64)
+    parser.add_argument("--steps", type=int, default=1000, help="Vector steps to take")
+    parser.add_argument("--workers", type=int, default=0, help="Worker processes (0 = SyncVectorEnv)")
+    parser.add_argument("--opponents", default="default,default,default",
+                        help="Comma-separated strategies for the other seats")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    opponents = [None if name == "default" else name for name in args.opponents.split(",")]
+    if args.workers:
+        env = AsyncVectorEnv(args.envs, opponents, workers=args.workers)
+    else:
+        env = SyncVectorEnv(args.envs, opponents)
+    rng = np.random.default_rng(args.seed)
+    scratch = np.empty((args.envs, NUM_ACTIONS))
+    episodes = 0
+    with env:
+        _, info = env.reset(args.seed)
+        start = time.perf_counter()
+        for _ in range(args.steps):
+            _, _, terminated, truncated, info = env.step(random_actions(info["action_mask"], rng, scratch))
+            episodes += int(terminated.sum() + truncated.sum())
+        elapsed = time.perf_counter() - start
+    steps = args.steps * args.envs
+    print(f"{steps:,} steps, {episodes:,} games in {elapsed:.2f}s ({steps / elapsed:,.0f} steps/s)")
+
+
+if __name__ == "__main__":
+    main()
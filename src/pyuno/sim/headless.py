@@ -0,0 +1,75 @@
+"""
+Headless game runner for simulations
+Plays complete all-AI games without pygame.
+"""
+
+import random
+from typing import NamedTuple, Optional, Sequence, Tuple
+
+from ..core.uno_classes import Game, SEAT_AI
+
+
+class GameResult(NamedTuple):
+    winner: Optional[int]  # Seat index of the winner, None if the turn cap was hit
+    turns: int
+    hand_sizes: Tuple[int, ...]
+    seed: Optional[int]
+
+
+def new_headless_game(strategies: Sequence, seed: Optional[int] = None) -> Game:
+    """Create and start an all-AI game; None strategies use the built-in AI."""
+    game = Game.from_seat_types([SEAT_AI] * len(strategies), rng=random.Random(seed))
+    for player, strategy in zip(game.players, strategies):
+        player.strategy = strategy
+    game.start_game()
+    return game
+
+
+def run_to_completion(game: Game, max_turns: int = 2000) -> int:
+    """Take AI turns until someone wins or max_turns is reached; returns turns taken."""
+    turns = 0
+    while turns < max_turns and not game.check_winner():
+        if not game.handle_ai_turn():
+            break
+        turns += 1
+    return turns
+
+
+def run_until_seat(game: Game, seat: int, turns: int = 0, max_turns: int = 2000) -> int:
+    """
+    Take the other seats' AI turns until seat has a decision to make
+    Returns the updated turn count, which is max_turns if the game stalls;
+    check_winner() tells whether the game is over. A color still to be
+    chosen is always seat's: the others pick theirs within their own turn,
+    even when calling UNO on the wild has already passed the turn on.
+    """
+    while turns < max_turns and not game.check_winner():
+        if game.current_player_index == seat or game.waiting_for_color:
+            break
+        if not game.handle_ai_turn():
+            return max_turns
+        turns += 1
+    return turns
+
+
+def play_headless_game(strategies: Sequence, seed: Optional[int] = None, max_turns: int = 2000,
+                       stats=None) -> GameResult:
+    """
+    Play one game between AI strategies
+    The cap on turns ends games that stall, e.g. when every card is in
+    someone's hand and nobody can play or draw. A GameStats passed as
+    stats totals the engine counters over every game it is given.
+    """
+    game = new_headless_game(strategies, seed)
+    if stats is not None:
+        game.enable_stats(stats)
+    turns = run_to_completion(game, max_turns)
+    if stats is not None:
+        game.disable_stats()
+    winner = game.check_winner()
+    return GameResult(
+        winner=game.players.index(winner) if winner else None,
+        turns=turns,
+        hand_sizes=tuple(len(player.hand) for player in game.players),
+        seed=seed,
+    )
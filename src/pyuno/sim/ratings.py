@@ -0,0 +1,59 @@
+"""
+Glicko ratings for head-to-head AI matches
+Each rating carries a deviation (RD) that shrinks as games are played,
+giving a confidence interval of rating +/- z * RD. Ratings are updated
+after every single game, so results can stream in from worker processes.
+"""
+
+import math
+from typing import List, Tuple
+
+Q = math.log(10) / 400
+START_RATING = 1500.0
+START_RD = 350.0
+MIN_RD = 10.0  # Keep ratings able to move after many games
+
+
+class Rating:
+    def __init__(self, rating: float = START_RATING, rd: float = START_RD):
+        self.rating = rating
+        self.rd = rd
+        self.games = 0
+        self.score = 0.0
+
+    def interval(self, z: float = 1.96) -> Tuple[float, float]:
+        return self.rating - z * self.rd, self.rating + z * self.rd
+
+    def __repr__(self):
+        return f"Rating({self.rating:.0f} +/- {self.rd:.0f}, games={self.games})"
+
+
+def _g(rd: float) -> float:
+    return 1 / math.sqrt(1 + 3 * Q * Q * rd * rd / (math.pi ** 2))
+
+
+def expected_score(a: Rating, b: Rating) -> float:
+    return 1 / (1 + 10 ** (-_g(b.rd) * (a.rating - b.rating) / 400))
+
+
+def update(a: Rating, b: Rating, score_a: float):
+    """Update both ratings after one game; score_a is 1 for a win, 0.5 for a draw, 0 for a loss."""
+    new = []
+    for player, opponent, score in ((a, b, score_a), (b, a, 1 - score_a)):
+        g = _g(opponent.rd)
+        expected = expected_score(player, opponent)
+        d_squared = 1 / (Q * Q * g * g * expected * (1 - expected))
+        denominator = 1 / (player.rd * player.rd) + 1 / d_squared
+        new.append((player.rating + Q / denominator * g * (score - expected),
+                    max(MIN_RD, math.sqrt(1 / denominator))))
+    for player, (rating, rd), score in zip((a, b), new, (score_a, 1 - score_a)):
+        player.rating = rating
+        player.rd = rd
+        player.games += 1
+        player.score += score
+
+
+def ranking_settled(ratings: List[Rating], z: float = 1.96) -> bool:
+    """True when neighbours in the ranking have non-overlapping confidence intervals."""
+    ordered = sorted(ratings, key=lambda r: r.rating, reverse=True)
+    return all(upper.interval(z)[0] > lower.interval(z)[1] for upper, lower in zip(ordered, ordered[1:]))
@@ -0,0 +1,200 @@
+"""
+Self-play dataset generator for training learned policies
+Plays all-AI games through handle_ai_turn and records every real
+decision (more than one legal action) as a fixed-shape record: the
+observation and legal-move mask from ai/encoding.py, the action taken
+and the game's final outcome for the deciding seat (1 win, -1 loss,
+0 if the turn cap ended the game).
+
+Each worker fills a preallocated shard buffer and writes it out as one
+.npy file of structured records whenever it is full, so memory stays at
+one shard per worker however many samples are produced. Shards load
+with np.load(path, mmap_mode='r'); manifest.json lists them.
+
+    python -m pyuno.sim.selfplay out/ --games 100000 --strategies counting,features,default
+"""
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..ai.encoding import (OBS_SIZE, NUM_ACTIONS, ACTION_DRAW, card_action, color_action,
+                           encode_observation, legal_mask, new_mask, new_observation)
+from ..ai.strategies import Strategy, get_strategy
+from .headless import new_headless_game, run_to_completion
+
+RECORD_DTYPE = np.dtype([
+    ("obs", np.uint8, (OBS_SIZE,)),
+    ("mask", np.bool_, (NUM_ACTIONS,)),
+    ("action", np.uint8),
+    ("outcome", np.int8),
+    ("seat", np.uint8),
+])
+SHARD_SIZE = 1 << 16  # Records per shard, about 12 MB
+
+
+class RecordingStrategy(Strategy):
+    """Wraps a strategy and logs each of its decisions for one seat."""
+
+    def __init__(self, inner: Strategy, seat: int, log: list):
+        self.inner = inner
+        self.name = inner.name
+        self.seat = seat
+        self.log = log
+        self._obs = new_observation()
+        self._mask = new_mask()
+
+    def _record(self, game, action: int):
+        mask = legal_mask(game, self.seat, self._mask)
+        if not mask[action]:
+            action = ACTION_DRAW  # An illegal stack play is turned into a draw by the game
+        if mask.sum() > 1:
+            self.log.append((encode_observation(game, self.seat, self._obs).copy(), mask.copy(), action, self.seat))
+
+    def choose_card(self, game, player, playable_cards):
+        card = self.inner.choose_card(game, player, playable_cards)
+        self._record(game, card_action(card))
+        return card
+
+    def choose_color(self, game, player):
+        color = self.inner.choose_color(game, player)
+        self._record(game, color_action(color))
+        return color
+
+
+def play_recorded_game(strategy_names: Sequence[str], seed: int, max_turns: int = 2000) -> list:
+    """Play one game and return its decisions as (obs, mask, action, outcome, seat) tuples."""
+    log: list = []
+    strategies = [RecordingStrategy(get_strategy(name), seat, log) for seat, name in enumerate(strategy_names)]
+    game = new_headless_game(strategies, seed)
+    run_to_completion(game, max_turns)
+    winner = game.check_winner()
+    winner_seat = game.players.index(winner) if winner else None
+    return [(obs, mask, action, 0 if winner_seat is None else 1 if seat == winner_seat else -1, seat)
+            for obs, mask, action, seat in log]
+
+
+class ShardWriter:
+    """Collects records in one preallocated shard buffer and writes it out when full."""
+
+    def __init__(self, out_dir: str, prefix: str, shard_size: int = SHARD_SIZE):
+        self.out_dir = out_dir
+        self.prefix = prefix
+        self.buffer = np.zeros(shard_size, dtype=RECORD_DTYPE)
+        self.count = 0
+        self.shards: List[Tuple[str, int]] = []
+
+    def add(self, obs, mask, action, outcome, seat):
+        row = self.buffer[self.count]
+        row["obs"] = obs
+        row["mask"] = mask
+        row["action"] = action
+        row["outcome"] = outcome
+        row["seat"] = seat
+        self.count += 1
+        if self.count == len(self.buffer):
+            self.flush()
+
+    def flush(self):
+        if not self.count:
+            return
+        name = f"{self.prefix}_{len(self.shards):04d}.npy"
+        path = os.path.join(self.out_dir, name)
+        with open(path + ".tmp", "wb") as f:
+            np.save(f, self.buffer[:self.count])
+        os.replace(path + ".tmp", path)
+        self.shards.append((name, self.count))
+        self.count = 0
+
+
+def _generate(job) -> List[Tuple[str, int]]:
+    """Worker: play a block of seeds, rotating strategies through the seats; returns the shards written."""
+    job_index, first_seed, games, strategy_names, seats, out_dir, shard_size, max_turns = job
+    writer = ShardWriter(out_dir, f"shard_{job_index:05d}", shard_size)
+    for seed in range(first_seed, first_seed + games):
+        names = [strategy_names[(seed + seat) % len(strategy_names)] for seat in range(seats)]
+        for record in play_recorded_game(names, seed, max_turns):
+            writer.add(*record)
+    writer.flush()
+    return writer.shards
+
+
+def generate(out_dir: str, games: int, strategy_names: Sequence[str] = ("counting", "features", "default"),
+             seats: int = 4, seed: int = 0, workers: Optional[int] = None, shard_size: int = SHARD_SIZE,
+             games_per_job: int = 1000, max_turns: int = 2000, progress=None) -> dict:
+    """
+    Generate a dataset of self-play games into out_dir and return its manifest
+    workers=0 plays everything in this process.
+    """
+    for name in strategy_names:
+        get_strategy(name)  # Fail early on unknown names
+    os.makedirs(out_dir, exist_ok=True)
+    jobs = [(i, first, min(games_per_job, seed + games - first), list(strategy_names), seats,
+             out_dir, shard_size, max_turns)
+            for i, first in enumerate(range(seed, seed + games, games_per_job))]
+    shards: List[Tuple[str, int]] = []
+    if workers == 0:
+        results = map(_generate, jobs)
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        results = executor.map(_generate, jobs)
+    try:
+        for job_shards in results:
+            shards.extend(job_shards)
+            if progress:
+                progress(sum(rows for _, rows in shards))
+    finally:
+        if workers != 0:
+            executor.shutdown()
+    manifest = {
+        "obs_size": OBS_SIZE,
+        "num_actions": NUM_ACTIONS,
+        "games": games,
+        "strategies": list(strategy_names),
+        "seats": seats,
+        "records": sum(rows for _, rows in shards),
+        "shards": [{"file": name, "records": rows} for name, rows in shards],
+    }
+    with open(os.path.join(out_dir, "manifest.json"), "w") as f:
+        json.dump(manifest, f, indent=1)
+    return manifest
+
+
+def open_shards(out_dir: str) -> Iterator[np.ndarray]:
+    """Memory-map each shard of a dataset in turn."""
+    with open(os.path.join(out_dir, "manifest.json")) as f:
+        manifest = json.load(f)
+    for shard in manifest["shards"]:
+        yield np.load(os.path.join(out_dir, shard["file"]), mmap_mode="r")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a PyUNO self-play dataset")
+    parser.add_argument("out_dir")
+    parser.add_argument("--games", type=int, default=10000)
+    parser.add_argument("--strategies", default="counting,features,default",
+                        help="Comma-separated strategies, rotated through the seats")
+    parser.add_argument("--seats", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (0 = run in this process)")
+    parser.add_argument("--shard-size", type=int, default=SHARD_SIZE, help="Records per shard file")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+
+    def progress(records):
+        elapsed = time.perf_counter() - start
+        print(f"{records:,} records ({records / elapsed:,.0f}/s)", flush=True)
+
+    manifest = generate(args.out_dir, args.games, args.strategies.split(","), args.seats, args.seed,
+                        args.workers, args.shard_size, progress=progress)
+    print(f"Wrote {manifest['records']:,} records in {len(manifest['shards'])} shards to {args.out_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""
+Tournament runner for AI strategies
+Plays heads-up matches between registered strategies across a process
+pool, updates Glicko ratings as results come in and stops early once
+the ranking is settled.
+
+    python -m pyuno.sim.tournament default random hoarder --pairing swiss
+"""
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ..ai.strategies import STRATEGIES, get_strategy
+from .headless import play_headless_game
+from .ratings import Rating, update, ranking_settled
+
+PAIRINGS = ("round_robin", "swiss")
+
+
+def _play_pairing(job: Tuple[str, str, int, int, int]) -> List[float]:
+    """
+    Worker: play a series of games between two strategies
+    Seats are swapped every game so neither side keeps the first move.
+    Returns the first strategy's score for each game (1 win, 0.5 stalled, 0 loss).
+    """
+    name_a, name_b, seed, games, max_turns = job
+    scores = []
+    for i in range(games):
+        swapped = i % 2 == 1
+        names = (name_b, name_a) if swapped else (name_a, name_b)
+        result = play_headless_game([get_strategy(name) for name in names], seed + i, max_turns)
+        if result.winner is None:
+            scores.append(0.5)
+        else:
+            scores.append(1.0 if (result.winner == 0) != swapped else 0.0)
+    return scores
+
+
+class Tournament:
+    def __init__(self, strategy_names: Sequence[str], pairing: str = "round_robin", games_per_match: int = 2,
+                 min_rounds: int = 3, max_rounds: int = 50, workers: Optional[int] = None, seed: int = 0,
+                 max_turns: int = 2000, z: float = 1.96):
+        """
+        workers=None uses one process per CPU; workers=0 plays everything
+        in this process, which is handy for tests and debugging.
+        """
+        if len(set(strategy_names)) < 2:
+            raise ValueError("A tournament needs at least two different strategies")
+        for name in strategy_names:
+            if name not in STRATEGIES:
+                raise ValueError(f"Unknown strategy: {name}")
+        if pairing not in PAIRINGS:
+            raise ValueError(f"Unknown pairing: {pairing}")
+        self.names = list(dict.fromkeys(strategy_names))
+        self.pairing = pairing
+        self.games_per_match = games_per_match
+        self.min_rounds = min_rounds
+        self.max_rounds = max_rounds
+        self.workers = workers
+        self.seed = seed
+        self.max_turns = max_turns
+        self.z = z
+        self.ratings: Dict[str, Rating] = {name: Rating() for name in self.names}
+        self.rounds_played = 0
+        self.games_played = 0
+        self._last_opponent: Dict[str, str] = {}
+        self._next_seed = seed * 1_000_003
+
+    def pairings(self) -> List[Tuple[str, str]]:
+        """Matches for the next round."""
+        if self.pairing == "round_robin":
+            return list(combinations(self.names, 2))
+        # Swiss: pair neighbours in the current ranking, avoiding immediate rematches
+        ranked = sorted(self.names, key=lambda name: self.ratings[name].rating, reverse=True)
+        if len(ranked) % 2:
+            # The bye rotates through the field
+            ranked.pop(len(ranked) - 1 - self.rounds_played % len(ranked))
+        matches = []
+        while ranked:
+            first = ranked.pop(0)
+            opponent = next((name for name in ranked if self._last_opponent.get(first) != name), ranked[0])
+            ranked.remove(opponent)
+            matches.append((first, opponent))
+        return matches
+
+    def settled(self) -> bool:
+        return ranking_settled(list(self.ratings.values()), self.z)
+
+    def _jobs(self, matches: List[Tuple[str, str]]) -> list:
+        jobs = []
+        for name_a, name_b in matches:
+            jobs.append((name_a, name_b, self._next_seed, self.games_per_match, self.max_turns))
+            self._next_seed += self.games_per_match
+        return jobs
+
+    def _record(self, match: Tuple[str, str], scores: List[float]):
+        name_a, name_b = match
+        for score in scores:
+            update(self.ratings[name_a], self.ratings[name_b], score)
+        self.games_played += len(scores)
+        self._last_opponent[name_a] = name_b
+        self._last_opponent[name_b] = name_a
+
+    def run(self, progress=None) -> List[Tuple[str, Rating]]:
+        """
+        Play rounds until the ranking is settled or max_rounds is reached
+        progress, if given, is called with the tournament after every round.
+        """
+        executor = ProcessPoolExecutor(self.workers) if self.workers != 0 else None
+        try:
+            while self.rounds_played < self.max_rounds:
+                matches = self.pairings()
+                jobs = self._jobs(matches)
+                # map() yields results in order, so ratings update as each match finishes
+                results = executor.map(_play_pairing, jobs) if executor else map(_play_pairing, jobs)
+                for match, scores in zip(matches, results):
+                    self._record(match, scores)
+                self.rounds_played += 1
+                if progress:
+                    progress(self)
+                if self.rounds_played >= self.min_rounds and self.settled():
+                    break
+        finally:
+            if executor:
+                executor.shutdown()
+        return self.standings()
+
+    def standings(self) -> List[Tuple[str, Rating]]:
+        return sorted(self.ratings.items(), key=lambda item: item[1].rating, reverse=True)
+
+
+def format_standings(standings: List[Tuple[str, Rating]], z: float = 1.96) -> str:
+    lines = [f"{'Strategy':<12} {'Rating':>7} {'95% CI':>15} {'Games':>6} {'Score':>6}"]
+    for name, rating in standings:
+        low, high = rating.interval(z)
+        lines.append(f"{name:<12} {rating.rating:>7.0f} {f'{low:.0f}-{high:.0f}':>15} "
+                     f"{rating.games:>6} {rating.score:>6.1f}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rate PyUNO AI strategies against each other")
+    parser.add_argument("strategies", nargs="*", default=list(STRATEGIES),
+                        help=f"Strategies to enter (default: all of {', '.join(STRATEGIES)})")
+    parser.add_argument("--pairing", choices=PAIRINGS, default="round_robin")
+    parser.add_argument("--games", type=int, default=10, help="Games per match, seats alternating")
+    parser.add_argument("--min-rounds", type=int, default=3)
+    parser.add_argument("--max-rounds", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (0 = run in this process)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    tournament = Tournament(args.strategies, pairing=args.pairing, games_per_match=args.games,
+                            min_rounds=args.min_rounds, max_rounds=args.max_rounds,
+                            workers=args.workers, seed=args.seed)
+
+    def progress(t):
+        print(f"Round {t.rounds_played}: {t.games_played} games", flush=True)
+
+    standings = tournament.run(progress)
+    print(format_standings(standings, tournament.z))
+    status = "settled" if tournament.settled() else "not settled"
+    print(f"Ranking {status} after {tournament.rounds_played} rounds ({tournament.games_played} games)")
+
+
+if __name__ == "__main__":
+    main()
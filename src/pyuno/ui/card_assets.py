@@ -0,0 +1,142 @@
+"""
+Card image cache for the UI
+Card images come from the card atlas (one file), are scaled once per card
+size and rotated once per angle, so drawing a frame only blits ready-made
+surfaces. Scaled atlases are also kept on disk, so a size seen before
+loads without decoding or scaling anything.
+Opponent hands are precomposed into fanned strips that are rebuilt only
+when the hand's card count (or the layout) changes.
+"""
+
+import pygame
+
+from ..utils.card_atlas import CARD_NAMES, default_asset_dir, find_atlas, scaled_atlas_size, atlas_subsurfaces
+from ..utils.scaled_cache import ScaledSurfaceCache
+from ..utils.resource_path import get_asset_manifest
+
+ANGLES = (0, 90, 180, 270)
+# Counter-clockwise rotation of the card back for each opponent edge
+SIDE_ANGLES = {'left': 270, 'top': 0, 'right': 90}
+HIGHLIGHT_PAD = 5  # Highlight outlines reach this far outside a card
+
+
+class CardAssets:
+    def __init__(self, asset_dir=None, disk_cache=None):
+        self.asset_dir = asset_dir or default_asset_dir()
+        self.disk_cache = disk_cache or ScaledSurfaceCache()
+        self.size = None
+        self._atlas_found = None
+        self._atlas = None
+        self._originals = None
+        self._scaled = {}
+        self._rotated = {}
+        self._strips = {}
+
+    def _find_atlas(self):
+        if self._atlas_found is None:
+            self._atlas_found = find_atlas(self.asset_dir) or False
+        return self._atlas_found
+
+    def prepare(self, card_width, card_height):
+        """
+        The atlas scaled for this card size, from the disk cache if possible
+        Makes no display calls, so it can run on a loader thread; pass the
+        result to adopt() on the main thread. Returns None without an atlas.
+        """
+        found = self._find_atlas()
+        if not found:
+            return None
+        image_path, index = found
+        size = scaled_atlas_size(index, card_width, card_height)
+        key = index.get("hash")
+        scaled = self.disk_cache.load(key, size, convert=False) if key else None
+        if scaled is None:
+            if self._atlas is None:
+                try:
+                    self._atlas = pygame.image.load(image_path)
+                except pygame.error:
+                    self._atlas_found = False
+                    return None
+            scaled = pygame.transform.smoothscale(self._atlas, size)
+            if key:
+                self.disk_cache.store(key, scaled)
+        return scaled
+
+    def adopt(self, card_width, card_height, scaled_atlas):
+        """Use an atlas from prepare() for this card size; main thread only."""
+        if scaled_atlas is None:
+            if self._originals is None:
+                self._originals = self._load_originals()
+            self._scaled = {name: pygame.transform.scale(image, (card_width, card_height))
+                            for name, image in self._originals.items()}
+        else:
+            self._scaled = atlas_subsurfaces(scaled_atlas.convert_alpha(), self._atlas_found[1],
+                                             card_width, card_height)
+        self.size = (card_width, card_height)
+        self._rotated = {}
+        self._strips = {}
+        if "card_back" in self._scaled:
+            for angle in ANGLES:
+                self.rotated("card_back", angle)
+
+    def _load_originals(self):
+        # Fallback when no atlas is available: one file per card
+        manifest = get_asset_manifest(self.asset_dir)
+        originals = {}
+        for card_name in CARD_NAMES:
+            path = manifest.path(f"{card_name}.png")
+            if path is None:
+                continue
+            try:
+                originals[card_name] = pygame.image.load(path).convert_alpha()
+            except pygame.error:
+                pass
+        return originals
+
+    def images(self, card_width, card_height):
+        """Card surfaces scaled to the given size, keyed by card name."""
+        if self.size != (card_width, card_height):
+            self.adopt(card_width, card_height, self.prepare(card_width, card_height))
+        return self._scaled
+
+    def rotated(self, card_name, angle):
+        """A card at the current size rotated counter-clockwise by a multiple of 90 degrees."""
+        key = (card_name, angle % 360)
+        surface = self._rotated.get(key)
+        if surface is None:
+            image = self._scaled[card_name]
+            surface = image if key[1] == 0 else pygame.transform.rotate(image, key[1])
+            self._rotated[key] = surface
+        return surface
+
+    def hand_strip(self, seat, side, hand_size, spacing, highlight=False):
+        """
+        A face-down fanned hand for one opponent seat
+        The strip has HIGHLIGHT_PAD pixels of transparent margin on every
+        side; with highlight each card gets the current-player outline.
+        Each seat keeps one strip per highlight state, rebuilt when the
+        hand size, edge or spacing changes.
+        """
+        signature = (side, hand_size, spacing)
+        cached = self._strips.get((seat, highlight))
+        if cached and cached[0] == signature:
+            return cached[1]
+
+        card = self.rotated("card_back", SIDE_ANGLES[side])
+        width, height = card.get_size()
+        vertical = side != 'top'
+        length = (hand_size - 1) * spacing + (height if vertical else width) if hand_size else 0
+        if vertical:
+            size = (width + 2 * HIGHLIGHT_PAD, int(length) + 2 * HIGHLIGHT_PAD)
+        else:
+            size = (int(length) + 2 * HIGHLIGHT_PAD, height + 2 * HIGHLIGHT_PAD)
+        strip = pygame.Surface(size, pygame.SRCALPHA)
+        for j in range(hand_size):
+            offset = HIGHLIGHT_PAD + j * spacing
+            pos = (HIGHLIGHT_PAD, offset) if vertical else (offset, HIGHLIGHT_PAD)
+            strip.blit(card, pos)
+            if highlight:
+                highlight_rect = pygame.Rect(pos[0] - 5, pos[1] - 5, width + 10, height + 10)
+                pygame.draw.rect(strip, (255, 255, 255), highlight_rect, 2, border_radius=5)
+        self._strips[(seat, highlight)] = (signature, strip)
+        return strip
@@ -0,0 +1,45 @@
+"""
+Layout of the player's hand
+HandLayout computes the card rects of the fanned hand at the bottom of the
+screen once per (hand size, window size) and answers both drawing and
+click/hover hit-testing from that one list.
+"""
+
+from bisect import bisect_right
+
+import pygame
+
+CARD_STEP = 0.6  # Horizontal distance between cards, in card widths
+BOTTOM_MARGIN = 20
+
+
+class HandLayout:
+    def __init__(self):
+        self._key = None
+        self.rects = []
+        self._lefts = []
+
+    def update(self, hand_size, window_size, card_size):
+        """Card rects left to right (later cards drawn on top); recomputed only when an input changes."""
+        key = (hand_size, window_size, card_size)
+        if key != self._key:
+            self._key = key
+            width, height = window_size
+            card_width, card_height = card_size
+            step = card_width * CARD_STEP
+            start_x = width / 2 - (hand_size * step) / 2
+            y = height - card_height - BOTTOM_MARGIN
+            self.rects = [pygame.Rect(start_x + j * step, y, card_width, card_height) for j in range(hand_size)]
+            self._lefts = [rect.x for rect in self.rects]
+        return self.rects
+
+    def card_at(self, pos):
+        """
+        Index of the topmost card under pos, or -1
+        Cards overlap left to right, so the topmost card at x is the last
+        one starting at or before x; a bisect over the left edges finds it.
+        """
+        j = bisect_right(self._lefts, pos[0]) - 1
+        if j >= 0 and self.rects[j].collidepoint(pos):
+            return j
+        return -1
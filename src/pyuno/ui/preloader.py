@@ -0,0 +1,69 @@
+"""
+Background asset loading for the start menu
+While the title screen is up, a loader thread reads the font files and
+decodes and scales the card atlas. Surfaces can only be converted to the
+display format on the main thread, so finished work is queued and picked
+up by poll() once per menu frame.
+"""
+
+import queue
+import threading
+
+from ..config.font_config import FONT_CONFIG
+from ..utils.resource_path import get_font_path
+
+
+class AssetPreloader:
+    def __init__(self, card_assets, card_size, font_bytes=None, font_files=None):
+        """font_bytes, if given, is the dict that receives each font file's contents."""
+        self.card_assets = card_assets
+        self.card_size = card_size
+        if font_files is None:
+            font_files = sorted({config['file'] for config in FONT_CONFIG.values()})
+        self.font_files = font_files
+        self.font_bytes = font_bytes if font_bytes is not None else {}
+        self.total = len(font_files) + 1  # Each font file, then the card atlas
+        self.completed = 0
+        self._done = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="asset-preloader", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def _run(self):
+        for font_file in self.font_files:
+            try:
+                with open(get_font_path(font_file), 'rb') as f:
+                    self._done.put(('font', font_file, f.read()))
+            except OSError:
+                # load_font_safe reports the missing file and falls back
+                self._done.put(('font', font_file, None))
+        try:
+            scaled = self.card_assets.prepare(*self.card_size)
+        except Exception as e:
+            print(f"Warning: Card preloading failed: {e}")
+            scaled = None
+        self._done.put(('cards', self.card_size, scaled))
+
+    def poll(self):
+        """Hand finished work to the main thread; call once per frame."""
+        while True:
+            try:
+                kind, name, data = self._done.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'font':
+                if data is not None:
+                    self.font_bytes[name] = data
+            else:
+                self.card_assets.adopt(*name, data)
+            self.completed += 1
+
+    @property
+    def progress(self):
+        return self.completed / self.total
+
+    @property
+    def done(self):
+        return self.completed == self.total
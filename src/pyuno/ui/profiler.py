@@ -0,0 +1,137 @@
+"""
+Frame-time instrumentation for the game UI
+Records how long each frame and its named sections (events, AI turn,
+asset loading, hand rendering, flip) take, keeps the last N frames in a
+ring buffer, draws an FPS/percentile overlay and dumps the buffer as a
+Chrome trace (open it in chrome://tracing or https://ui.perfetto.dev).
+
+    PYUNO_PROFILE=1              record and show the overlay from the start
+    PYUNO_PROFILE_TRACE=out.json also write the trace when the game exits
+    F3                           toggle recording and the overlay
+    F4                           write the trace to PYUNO_PROFILE_TRACE (default pyuno_trace.json)
+
+When disabled, begin() and end() return immediately.
+"""
+
+import json
+import os
+import time
+from collections import deque
+
+import pygame
+
+DEFAULT_TRACE_PATH = "pyuno_trace.json"
+OVERLAY_REFRESH = 0.25  # Seconds between overlay text updates
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+class FrameProfiler:
+    def __init__(self, capacity=600, enabled=False, trace_path=None):
+        self.enabled = enabled
+        self.trace_path = trace_path
+        self.frames = deque(maxlen=capacity)  # (start_ns, duration_ns, [(name, start_ns, duration_ns)])
+        self._origin = time.perf_counter_ns()
+        self._frame_start = None
+        self._sections = []
+        self._overlay_lines = []
+        self._overlay_time = 0.0
+        self._font = None
+
+    @classmethod
+    def from_env(cls):
+        trace_path = os.environ.get('PYUNO_PROFILE_TRACE')
+        return cls(enabled=bool(os.environ.get('PYUNO_PROFILE') or trace_path), trace_path=trace_path)
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self._frame_start = None
+
+    def begin_frame(self):
+        if self.enabled:
+            self._frame_start = time.perf_counter_ns()
+            self._sections = []
+
+    def end_frame(self):
+        if self.enabled and self._frame_start is not None:
+            self.frames.append((self._frame_start, time.perf_counter_ns() - self._frame_start, self._sections))
+            self._frame_start = None
+
+    def begin(self, name):
+        """Start timing a section; pass the result to end()."""
+        if not self.enabled:
+            return None
+        return name, time.perf_counter_ns()
+
+    def end(self, token):
+        if token is not None and self._frame_start is not None:
+            name, start = token
+            self._sections.append((name, start, time.perf_counter_ns() - start))
+
+    def summary(self):
+        """FPS, frame-time percentiles (ms) and mean ms per section over the buffered frames."""
+        if not self.frames:
+            return {'frames': 0, 'fps': 0.0, 'p50': 0.0, 'p95': 0.0, 'p99': 0.0, 'max': 0.0, 'sections': {}}
+        durations = sorted(duration / 1e6 for _, duration, _ in self.frames)
+        first, last = self.frames[0], self.frames[-1]
+        elapsed = (last[0] + last[1] - first[0]) / 1e9
+        totals = {}
+        for _, _, sections in self.frames:
+            for name, _, duration in sections:
+                totals[name] = totals.get(name, 0) + duration
+        return {
+            'frames': len(self.frames),
+            'fps': len(self.frames) / elapsed if elapsed > 0 else 0.0,
+            'p50': percentile(durations, 0.50),
+            'p95': percentile(durations, 0.95),
+            'p99': percentile(durations, 0.99),
+            'max': durations[-1],
+            'sections': {name: total / 1e6 / len(self.frames) for name, total in totals.items()},
+        }
+
+    def draw_overlay(self, surface):
+        """Draw the stats panel in the top-left corner; the text refreshes a few times a second."""
+        if not self.enabled:
+            return
+        now = time.time()
+        if self.frames and now - self._overlay_time >= OVERLAY_REFRESH:
+            self._overlay_time = now
+            stats = self.summary()
+            lines = [f"{stats['fps']:.0f} FPS  frame p50 {stats['p50']:.1f}  p95 {stats['p95']:.1f}  "
+                     f"p99 {stats['p99']:.1f}  max {stats['max']:.1f} ms"]
+            lines += [f"{name:<8} {ms:6.2f} ms" for name, ms in sorted(stats['sections'].items())]
+            if self._font is None:
+                self._font = pygame.font.Font(None, 20)
+            self._overlay_lines = [self._font.render(line, True, (255, 255, 255)) for line in lines]
+        if not self._overlay_lines:
+            return
+        width = max(line.get_width() for line in self._overlay_lines) + 16
+        height = sum(line.get_height() for line in self._overlay_lines) + 12
+        panel = pygame.Rect(8, 8, width, height)
+        pygame.draw.rect(surface, (0, 0, 0), panel)
+        y = panel.y + 6
+        for line in self._overlay_lines:
+            surface.blit(line, (panel.x + 8, y))
+            y += line.get_height()
+
+    def chrome_trace(self):
+        """The buffered frames as Chrome trace events (complete events, microseconds)."""
+        events = []
+        for index, (start, duration, sections) in enumerate(self.frames):
+            events.append({'name': 'frame', 'ph': 'X', 'pid': 1, 'tid': 1,
+                           'ts': (start - self._origin) / 1000, 'dur': duration / 1000, 'args': {'frame': index}})
+            for name, section_start, section_duration in sections:
+                events.append({'name': name, 'ph': 'X', 'pid': 1, 'tid': 1,
+                               'ts': (section_start - self._origin) / 1000, 'dur': section_duration / 1000})
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def dump(self, path=None):
+        """Write the Chrome trace and return its path."""
+        path = path or self.trace_path or DEFAULT_TRACE_PATH
+        with open(path, 'w') as f:
+            json.dump(self.chrome_trace(), f)
+        return path
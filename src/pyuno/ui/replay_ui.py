@@ -0,0 +1,137 @@
+"""
+Replay viewer: plays back a recorded game with the table renderer
+Space plays or pauses, Left/Right step one turn, Page Up/Page Down jump
+ten, Home/End go to the start or end, +/- change the playback speed and
+clicking or dragging on the bar at the bottom seeks. The hand shown face
+up is the seat on turn unless a seat is given.
+"""
+
+import time
+
+import pygame
+
+from ..net.replay import Replay, ReplayGame
+from . import uno_ui
+from .layout import HandLayout
+from .uno_ui import WHITE, BLACK, draw_game_frame, init_display, load_font_by_type, profiler, text_cache
+
+JUMP_TURNS = 10
+MIN_DELAY, MAX_DELAY = 0.05, 4.0
+BAR_HEIGHT = 8
+BAR_COLOR = (255, 255, 0)
+
+
+def scrub_bar_rect(current_width, current_height):
+    return pygame.Rect(20, current_height - BAR_HEIGHT - 6, current_width - 40, BAR_HEIGHT)
+
+
+def turn_at(bar_rect, x, turns):
+    """The turn under x on the scrub bar."""
+    fraction = min(max((x - bar_rect.x) / max(bar_rect.width, 1), 0.0), 1.0)
+    return round(fraction * (turns - 1))
+
+
+def draw_replay_controls(surface, game, playing, turn_delay):
+    current_width, current_height = surface.get_width(), surface.get_height()
+    turns = len(game.replay)
+    bar_rect = scrub_bar_rect(current_width, current_height)
+    pygame.draw.rect(surface, BLACK, bar_rect, border_radius=4)
+    progress = bar_rect.copy()
+    progress.width = int(bar_rect.width * game.turn / max(turns - 1, 1))
+    if progress.width > 0:
+        pygame.draw.rect(surface, BAR_COLOR, progress, border_radius=4)
+    # Keyframe ticks
+    for turn, _ in game.replay.keyframes:
+        x = bar_rect.x + bar_rect.width * turn / max(turns - 1, 1)
+        pygame.draw.line(surface, WHITE, (x, bar_rect.y), (x, bar_rect.bottom - 1))
+
+    font = load_font_by_type('status', int(current_height * 0.03))
+    state = f"playing {1 / turn_delay:.1f} turns/s" if playing else "paused"
+    label = text_cache.render(font, f"Turn {game.turn} of {turns - 1}  {state}", True, WHITE)
+    surface.blit(label, label.get_rect(topright=(current_width - 20, 20)))
+
+
+def replay_ui(replay: Replay, seat=None, turn_delay=1.0):
+    """Show replay until the window is closed; seat fixes whose hand is face up."""
+    screen = init_display()
+    game = ReplayGame(replay)
+    hand_layout = HandLayout()
+    playing = True
+    scrubbing = False
+    last_step_time = time.time()
+    running = True
+
+    while running:
+        profiler.begin_frame()
+        current_time = time.time()
+        current_width, current_height = screen.get_width(), screen.get_height()
+        bar_rect = scrub_bar_rect(current_width, current_height)
+        target = game.turn
+
+        section = profiler.begin('events')
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.VIDEORESIZE:
+                screen = uno_ui.screen = pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    running = False
+                elif event.key == pygame.K_SPACE:
+                    playing = not playing
+                    if playing and target == len(replay) - 1:
+                        target = 0
+                elif event.key == pygame.K_RIGHT:
+                    target, playing = target + 1, False
+                elif event.key == pygame.K_LEFT:
+                    target, playing = target - 1, False
+                elif event.key == pygame.K_PAGEDOWN:
+                    target += JUMP_TURNS
+                elif event.key == pygame.K_PAGEUP:
+                    target -= JUMP_TURNS
+                elif event.key == pygame.K_HOME:
+                    target = 0
+                elif event.key == pygame.K_END:
+                    target = len(replay) - 1
+                elif event.key in (pygame.K_PLUS, pygame.K_EQUALS, pygame.K_KP_PLUS):
+                    turn_delay = max(MIN_DELAY, turn_delay / 2)
+                elif event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+                    turn_delay = min(MAX_DELAY, turn_delay * 2)
+                elif event.key == pygame.K_F3:
+                    profiler.toggle()
+                elif event.key == pygame.K_F4 and profiler.frames:
+                    profiler.dump()
+            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                if bar_rect.inflate(0, 16).collidepoint(event.pos):
+                    scrubbing = True
+                    target = turn_at(bar_rect, event.pos[0], len(replay))
+            elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+                scrubbing = False
+            elif event.type == pygame.MOUSEMOTION and scrubbing:
+                target = turn_at(bar_rect, event.pos[0], len(replay))
+        profiler.end(section)
+
+        if playing and not scrubbing and current_time - last_step_time >= turn_delay:
+            target += 1
+        if target != game.turn:
+            last_step_time = current_time
+            section = profiler.begin('seek')
+            game.seek(target)
+            profiler.end(section)
+        if game.turn == len(replay) - 1:
+            playing = False
+
+        viewer = game.players[seat] if seat is not None else game.get_current_player()
+        # No mouse position: hovering would lift cards as if they could be played
+        draw_game_frame(screen, game, viewer, hand_layout, (-1, -1))
+        draw_replay_controls(screen, game, playing, turn_delay)
+
+        profiler.draw_overlay(screen)
+        section = profiler.begin('flip')
+        pygame.display.flip()
+        profiler.end(section)
+        profiler.end_frame()
+
+    if profiler.trace_path and profiler.frames:
+        profiler.dump()
+    pygame.quit()
@@ -0,0 +1,57 @@
+"""
+Reusable surfaces for the UI
+SurfacePool hands out filled surfaces keyed by size, flags and fill
+color, and TextCache keeps rendered text, so frames that show the same
+thing as the previous frame allocate no new surfaces.
+Callers must treat the returned surfaces as read-only.
+"""
+
+from collections import OrderedDict
+import pygame
+
+
+class _LRU:
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.allocations = 0  # Surfaces created so far, for checking steady-state frames
+
+    def _get(self, key, create):
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+            return surface
+        surface = self.entries[key] = create()
+        self.allocations += 1
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self.entries.clear()
+
+
+class SurfacePool(_LRU):
+    def __init__(self, max_entries=64):
+        super().__init__(max_entries)
+
+    def filled(self, size, color, flags=pygame.SRCALPHA):
+        """A surface of the given size and flags filled with color."""
+        size = (int(size[0]), int(size[1]))
+
+        def create():
+            surface = pygame.Surface(size, flags)
+            surface.fill(color)
+            return surface
+
+        return self._get((size, flags, tuple(color)), create)
+
+
+class TextCache(_LRU):
+    def __init__(self, max_entries=256):
+        super().__init__(max_entries)
+
+    def render(self, font, text, antialias, color):
+        """Same as font.render, reusing the surface for unchanged text."""
+        return self._get((font, text, bool(antialias), tuple(color)),
+                         lambda: font.render(text, antialias, color))
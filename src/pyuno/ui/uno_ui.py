@@ -1,22 +1,24 @@
 import pygame
 import sys
 import os
+import io
 import time
-from ..core.uno_classes import Game, Player, Card
+from ..core.uno_classes import Game, Player, Card, SEAT_HUMAN
 from ..config.font_config import get_font_config
-
-pygame.init()
+from ..utils.resource_path import get_asset_path, get_asset_manifest
+from .card_assets import CardAssets, HIGHLIGHT_PAD
+from .surface_cache import SurfacePool, TextCache
+from .preloader import AssetPreloader
+from .layout import HandLayout
+from .profiler import FrameProfiler
 
 SCREEN_WIDTH, SCREEN_HEIGHT = 1280, 720
 
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.RESIZABLE)
-pygame.display.set_caption("PyUNO by Group 19")
+logo_path = get_asset_path('uno_logo.png')
 
-# Get the path to assets directory relative to the project root
-project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-logo_path = os.path.join(project_root, 'assets', 'uno_logo.png')
-uno_logo_original = pygame.image.load(logo_path).convert_alpha()
-pygame.display.set_icon(uno_logo_original)
+# Created by init_display() on first use, so importing this module opens no window
+screen = None
+uno_logo_original = None
 
 GREEN = (0, 100, 0)
 WHITE = (255, 255, 255)
@@ -24,14 +26,39 @@ BLACK = (0, 0, 0)
 RED = (200, 0, 0)
 BRIGHT_RED = (255, 0, 0)
 
+card_assets = CardAssets()
+surface_pool = SurfacePool()
+text_cache = TextCache()
+_font_cache = {}
+_font_bytes = {}  # Font file contents read ahead by the preloader, keyed by file name
+profiler = FrameProfiler.from_env()  # Frame timings; F3 toggles, F4 writes a Chrome trace
+
+def init_display():
+    """Open the game window (once) and return the screen surface."""
+    global screen, uno_logo_original
+    if screen is None:
+        # Only the modules the game uses; pygame.init() would also start audio
+        pygame.display.init()
+        pygame.font.init()
+        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.RESIZABLE)
+        pygame.display.set_caption("PyUNO by Group 19")
+        uno_logo_original = pygame.image.load(logo_path).convert_alpha()
+        pygame.display.set_icon(uno_logo_original)
+    return screen
+
 def get_font_path(font_filename):
     """
     Get the absolute path to a font file in the assets directory
     """
-    # Get the project root directory
-    project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-    # Join with assets directory and filename
-    return os.path.join(project_root, 'assets', font_filename)
+    # Looked up in the asset manifest; a missing font still gets its would-be path for the warning
+    return get_asset_manifest().path(font_filename) or get_asset_path(font_filename)
+
+def font_file_exists(font_path):
+    manifest = get_asset_manifest()
+    if os.path.dirname(font_path) == manifest.asset_dir:
+        # Asset fonts are checked against the manifest instead of the filesystem
+        return os.path.basename(font_path) in manifest
+    return os.path.exists(font_path)
 
 def load_font_safe(font_path, size, fallback_font=None):
     """
@@ -49,8 +76,11 @@ def load_font_safe(font_path, size, fallback_font=None):
         font_path = get_font_path(font_filename)
     
     try:
-        # Try to load the custom font
-        if os.path.exists(font_path):
+        # Try to load the custom font, from memory if it was preloaded
+        font_data = _font_bytes.get(os.path.basename(font_path))
+        if font_data is not None:
+            return pygame.font.Font(io.BytesIO(font_data), size)
+        if font_file_exists(font_path):
             return pygame.font.Font(font_path, size)
         else:
             print(f"Warning: Font file '{font_path}' not found. Using fallback.")
@@ -85,20 +115,38 @@ def load_font_by_type(font_type, size):
     Returns:
         pygame.font.Font object
     """
-    config = get_font_config(font_type)
-    font_path = get_font_path(config['file'])
-    return load_font_safe(font_path, size, config['fallback'])
+    key = (font_type, size)
+    if key not in _font_cache:
+        config = get_font_config(font_type)
+        font_path = get_font_path(config['file'])
+        _font_cache[key] = load_font_safe(font_path, size, config['fallback'])
+    return _font_cache[key]
 
 def draw_text(text, font, color, surface, x, y):
-    textobj = font.render(text, 1, color)
+    textobj = text_cache.render(font, text, 1, color)
     textrect = textobj.get_rect()
     textrect.center = (x, y)
     surface.blit(textobj, textrect)
 
+def get_card_size(current_width):
+    card_width = int(current_width * 0.06)
+    return card_width, int(card_width * 1.45)
+
 def start_menu():
     global screen
+    init_display()
+
+    # Load cards and fonts in the background while the title screen is up
+    preloader = AssetPreloader(card_assets, get_card_size(screen.get_width()), _font_bytes).start()
+    start_requested = False
+    # Set by benchmarks/bench_startup.py: report the first frame and quit
+    startup_probe = bool(os.environ.get('PYUNO_STARTUP_PROBE'))
 
     while True:
+        preloader.poll()
+        if start_requested and preloader.done:
+            return True
+
         current_width = screen.get_width()
         current_height = screen.get_height()
 
@@ -132,6 +180,13 @@ def start_menu():
         
         draw_text("START", start_font, WHITE, screen, start_button.centerx, start_button.centery)
 
+        if not preloader.done:
+            progress_rect = pygame.Rect(button_x, start_button.bottom + current_height * 0.03, button_width, 6)
+            pygame.draw.rect(screen, (60, 60, 60), progress_rect, border_radius=3)
+            progress_rect.width = int(button_width * preloader.progress)
+            if progress_rect.width > 0:
+                pygame.draw.rect(screen, WHITE, progress_rect, border_radius=3)
+
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 return False
@@ -141,7 +196,8 @@ def start_menu():
            
             if event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1 and start_button.collidepoint((mouse_x, mouse_y)):
-                    return True
+                    # Starts as soon as loading has finished
+                    start_requested = True
             
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
@@ -149,42 +205,14 @@ def start_menu():
 
         pygame.display.update()
 
-def load_card_images(card_width, card_height):
-    card_images = {}
-    # Get the project root directory
-    project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-    card_path = os.path.join(project_root, 'assets')
-
-    COLORS = ["red", "yellow", "green", "blue"]
-    VALUES = ["0", "1", "2", "3", "4", "5", "6", "7", "8", "9", "skip", "reverse", "drawtwo"]
-    SPECIAL_CARDS = ["wild_standard", "wild_drawfour"]
-
-    for color in COLORS:
-        for value in VALUES:
-            card_name = f"{color}_{value}"
-            file_path = os.path.join(card_path, f"{card_name}.png")
-            try:
-                image = pygame.image.load(file_path).convert_alpha()
-                card_images[card_name] = pygame.transform.scale(image, (card_width, card_height))
-            except pygame.error:
-                pass
-
-    for card_name in SPECIAL_CARDS:
-        file_path = os.path.join(card_path, f"{card_name}.png")
-        try:
-            image = pygame.image.load(file_path).convert_alpha()
-            card_images[card_name] = pygame.transform.scale(image, (card_width, card_height))
-        except pygame.error:
-            pass
-            
-    file_path = os.path.join(card_path, "card_back.png")
-    try:
-        image = pygame.image.load(file_path).convert_alpha()
-        card_images["card_back"] = pygame.transform.scale(image, (card_width, card_height))
-    except pygame.error:
-        pass
+        if startup_probe:
+            if sys.stdout:  # Windowed Windows builds have no stdout; exiting marks the frame
+                print("PYUNO_FIRST_FRAME", flush=True)
+            return False
 
-    return card_images
+def load_card_images(card_width, card_height):
+    # Scaled once per card size; later calls at the same size reuse the surfaces
+    return card_assets.images(card_width, card_height)
 
 def draw_color_selection_menu(screen, current_width, current_height, button_font):
     COLORS = {
@@ -194,8 +222,7 @@ def draw_color_selection_menu(screen, current_width, current_height, button_font
         "blue": (0, 0, 255)
     }
     
-    overlay = pygame.Surface((current_width, current_height), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 128))
+    overlay = surface_pool.filled((current_width, current_height), (0, 0, 0, 128))
     screen.blit(overlay, (0, 0))
     
     title_font = load_font_by_type('title', int(current_height * 0.05))
@@ -216,8 +243,245 @@ def draw_color_selection_menu(screen, current_width, current_height, button_font
     
     return color_buttons
 
-def main_game_ui(game):
+def get_opponent_seats(num_opponents, current_width, current_height, card_width, card_height):
+    """
+    Lay out opponent seats around the table in clockwise order
+    Seats are spread over the left, top and right edges; each seat gets
+    an equal slice of its edge to fan its hand in.
+    Returns:
+        list of (side, center_x, center_y, span) tuples, one per opponent
+    """
+    if num_opponents <= 0:
+        return []
+    if num_opponents == 1:
+        side_counts = {'left': 0, 'top': 1, 'right': 0}
+    else:
+        per_side = (num_opponents + 1) // 3 or 1
+        side_counts = {'left': per_side, 'top': num_opponents - 2 * per_side, 'right': per_side}
+
+    # Keep the side columns clear of the top row and the player's hand
+    side_start = 20 + card_height + 20
+    side_length = current_height - 2 * side_start
+    top_start = 20 + card_height + 20
+    top_length = current_width - 2 * top_start
+
+    seats = []
+    # Left edge runs bottom to top, top edge left to right, right edge top to bottom
+    for k in range(side_counts['left']):
+        span = side_length / side_counts['left']
+        seats.append(('left', 20 + card_height / 2, side_start + side_length - span * (k + 0.5), span))
+    for k in range(side_counts['top']):
+        span = top_length / side_counts['top']
+        seats.append(('top', top_start + span * (k + 0.5), 20 + card_height / 2, span))
+    for k in range(side_counts['right']):
+        span = side_length / side_counts['right']
+        seats.append(('right', current_width - 20 - card_height / 2, side_start + span * (k + 0.5), span))
+    return seats
+
+def draw_game_frame(surface, game, viewer, hand_layout, mouse_pos, thinking=False,
+                    draw_message="", uno_qte_remaining=None, uno_qte_duration=3.0, uno_button_rect=None):
+    """
+    Draw one frame of the table, everything except the flip
+    Returns the winner, with the winner banner drawn on top, once someone has won.
+    """
+    current_width, current_height = surface.get_width(), surface.get_height()
+    section = profiler.begin('assets')
+    card_width, card_height = get_card_size(current_width)
+    CARD_IMAGES = load_card_images(card_width, card_height)
+    status_font = load_font_by_type('status', int(current_height * 0.03))
+    button_font = load_font_by_type('button', int(current_height * 0.035))
+    uno_button_font = load_font_by_type('button', int(current_height * 0.04))
+    winner_font = load_font_by_type('winner', int(current_height * 0.05))
+    profiler.end(section)
+
+    surface.fill(RED)
+
+    current_player = game.get_current_player()
+    status_text = f"{current_player.name}'s Turn"
+    if thinking:
+        status_text += " (Thinking...)"
+    text_surface = text_cache.render(status_font, status_text, True, (255, 255, 255))
+    text_rect = text_surface.get_rect(center=(current_width / 2, current_height * 0.35))
+    bg_rect = text_rect.copy().inflate(20, 10)
+    bg_surface = surface_pool.filled(bg_rect.size, (0, 0, 0, 150))
+    surface.blit(bg_surface, bg_rect)
+    surface.blit(text_surface, text_rect)
+
+    if draw_message:
+        draw_text_surface = text_cache.render(status_font, draw_message, True, (255, 255, 255))
+        draw_text_rect = draw_text_surface.get_rect(center=(current_width / 2, current_height * 0.35))
+        draw_bg_rect = draw_text_rect.copy().inflate(20, 10)
+        draw_bg_surface = surface_pool.filled(draw_bg_rect.size, (0, 0, 0, 150))
+        surface.blit(draw_bg_surface, draw_bg_rect)
+        surface.blit(draw_text_surface, draw_text_rect)
+
+    discard_pile_pos = (current_width / 2 - card_width * 1.2, current_height / 2 - card_height / 2)
+    draw_pile_pos = (current_width / 2 + card_width * 0.2, current_height / 2 - card_height / 2)
+    
+    # Check if draw pile should be clickable
+    draw_pile_clickable = game.can_draw_card(current_player) and current_player == viewer
+    
+    # Draw draw pile with visual feedback
+    if draw_pile_clickable:
+        # Highlight draw pile when clickable
+        highlight_rect = pygame.Rect(draw_pile_pos[0] - 5, draw_pile_pos[1] - 5, card_width + 10, card_height + 10)
+        pygame.draw.rect(surface, (255, 255, 0), highlight_rect, 2, border_radius=5)
+    
+    surface.blit(CARD_IMAGES['card_back'], draw_pile_pos)
+    draw_text("DRAW", button_font, (255, 255, 255), surface, draw_pile_pos[0] + card_width/2, draw_pile_pos[1] + card_height + 20)
+    
+    top_card = game.deck.get_top_card()
+    if top_card:
+        COLOR_MAP = {
+            "red": (255, 0, 0),
+            "yellow": (255, 255, 0),
+            "green": (0, 255, 0),
+            "blue": (0, 0, 255)
+        }
+        surface.blit(CARD_IMAGES[str(top_card)], discard_pile_pos)
+        if top_card.color == "wild" and game.selected_color:
+            color_indicator_size = int(card_width * 0.3)
+            color_pos = (discard_pile_pos[0] + card_width - color_indicator_size/2,
+                       discard_pile_pos[1] + card_height - color_indicator_size/2)
+            color_rect = pygame.Rect(0, 0, color_indicator_size, color_indicator_size)
+            color_rect.center = (int(color_pos[0]), int(color_pos[1]))
+            pygame.draw.rect(surface, COLOR_MAP[game.selected_color], color_rect, border_radius=int(color_indicator_size/2))
+            pygame.draw.rect(surface, WHITE, color_rect, 2, border_radius=int(color_indicator_size/2))
+
+    section = profiler.begin('hands')
+    viewer_index = game.players.index(viewer)
+    viewer_is_current = viewer == current_player
+    card_rects = hand_layout.update(len(viewer.hand), (current_width, current_height), (card_width, card_height))
+    hovered_card_index = hand_layout.card_at(mouse_pos) if viewer_is_current else -1
+
+    # Get playable cards for the human player
+    playable_cards = []
+    if viewer_is_current:
+        top_card = game.deck.get_top_card()
+        if top_card:
+            playable_cards = viewer.get_playable_cards(top_card, game.selected_color)
+
+    for j, card in enumerate(viewer.hand):
+        card_rect = card_rects[j]
+        card_draw_y = card_rect.y
+        
+        if viewer_is_current:
+            card_draw_y -= 20
+
+        if j == hovered_card_index:
+            card_draw_y -= 20
+ 
+        surface.blit(CARD_IMAGES[str(card)], (card_rect.x, card_draw_y))
+        
+        if viewer_is_current:
+            highlight_rect = pygame.Rect(card_rect.x - 5, card_draw_y - 5, card_width + 10, card_height + 10)
+            
+            # Check if this card is playable and highlight with yellow if so
+            if card in playable_cards:
+                pygame.draw.rect(surface, (255, 255, 0), highlight_rect, 3, border_radius=5)  # Yellow for eligible cards
+            else:
+                pygame.draw.rect(surface, WHITE, highlight_rect, 2, border_radius=5)  # White for non-eligible
+
+    # Opponents in turn order starting from the seat after the viewer
+    num_players = len(game.players)
+    opponents = [(viewer_index + k) % num_players for k in range(1, num_players)]
+    seats = get_opponent_seats(len(opponents), current_width, current_height, card_width, card_height)
+
+    for player_index, (side, center_x, center_y, span) in zip(opponents, seats):
+        player = game.players[player_index]
+        is_current_player = player == current_player
+        hand_size = len(player.hand)
+        if not hand_size:
+            continue
+        # Squeeze the fan when a hand would overflow its slice of the edge
+        spacing = card_width * 0.6
+        if hand_size > 1:
+            spacing = min(spacing, max(1, (span - card_width) / (hand_size - 1)))
+        fan_length = (hand_size - 1) * spacing + card_width
+
+        current_player_shift_x = 0
+        current_player_shift_y = 0
+
+        if is_current_player:
+            if side == 'left': # Left AI Player: move right (towards center)
+                current_player_shift_x = 20
+            elif side == 'top': # Top AI Player: move down (towards center)
+                current_player_shift_y = 20
+            else: # Right AI Player: move left (towards center)
+                current_player_shift_x = -20 
+
+        # The whole fanned hand is one precomposed strip, rebuilt only when it changes
+        strip = card_assets.hand_strip(player_index, side, hand_size, spacing, is_current_player)
+        if side == 'top':
+            pos = (center_x - fan_length / 2, center_y - card_height / 2)
+        else:
+            pos = (center_x - card_height / 2, center_y - fan_length / 2)
+        surface.blit(strip, (pos[0] + current_player_shift_x - HIGHLIGHT_PAD,
+                            pos[1] + current_player_shift_y - HIGHLIGHT_PAD))
+    profiler.end(section)
+
+    winner = game.check_winner()
+    if winner:
+        winner_text = f"{winner.name} wins!"
+        winner_surface = text_cache.render(winner_font, winner_text, True, (255, 255, 255))
+        winner_rect = winner_surface.get_rect(center=(current_width / 2, current_height * 0.25))
+        winner_bg_rect = winner_rect.copy().inflate(20, 10)
+        winner_bg_surface = surface_pool.filled(winner_bg_rect.size, (0, 0, 0, 150))
+        surface.blit(winner_bg_surface, winner_bg_rect)
+        surface.blit(winner_surface, winner_rect)
+        return winner
+
+    # UNO QTE Visual Elements
+    if uno_qte_remaining is not None:
+        # Draw UNO button with timer
+        remaining_time = uno_qte_remaining
+        uno_button_width = uno_button_rect.width
+        time_percentage = remaining_time / uno_qte_duration
+        
+        # Button color changes based on remaining time
+        if time_percentage > 0.6:
+            button_color = (0, 255, 0)  # Green - plenty of time
+        elif time_percentage > 0.3:
+            button_color = (255, 255, 0)  # Yellow - warning
+        else:
+            button_color = (255, 0, 0)  # Red - almost out of time
+        
+        # Draw button with color
+        pygame.draw.rect(surface, button_color, uno_button_rect, border_radius=10)
+        pygame.draw.rect(surface, WHITE, uno_button_rect, 3, border_radius=10)  # White border
+        
+        # Draw UNO text
+        draw_text("UNO!", uno_button_font, WHITE, surface, uno_button_rect.centerx, uno_button_rect.centery)
+        
+        # Draw timer bar
+        timer_bar_width = int(uno_button_width * 0.8)
+        timer_bar_height = 8
+        timer_bar_x = uno_button_rect.centerx - timer_bar_width // 2
+        timer_bar_y = uno_button_rect.bottom + 10
+        
+        # Background bar
+        pygame.draw.rect(surface, (100, 100, 100), (timer_bar_x, timer_bar_y, timer_bar_width, timer_bar_height), border_radius=4)
+        # Progress bar
+        progress_width = int(timer_bar_width * time_percentage)
+        if progress_width > 0:
+            pygame.draw.rect(surface, button_color, (timer_bar_x, timer_bar_y, progress_width, timer_bar_height), border_radius=4)
+        
+        # Draw warning message
+        warning_text = f"CALL UNO! {remaining_time:.1f}s"
+        warning_surface = text_cache.render(status_font, warning_text, True, button_color)
+        warning_rect = warning_surface.get_rect(center=(current_width / 2, current_height / 2 + card_height + 100))
+        surface.blit(warning_surface, warning_rect)
+
+    if game.waiting_for_color:
+        draw_color_selection_menu(surface, current_width, current_height, button_font)
+    return None
+
+def main_game_ui(game, recorder=None):
+    """Run the game window; a ReplayRecorder passed as recorder gets every change to the table."""
     global screen
+    init_display()
+    # Networking is only needed once a game is running
+    from ..net.client import RemoteGame
 
     running = True
     last_turn_time = 0
@@ -233,18 +497,26 @@ def main_game_ui(game):
     uno_qte_duration = 3.0  # 3 seconds to call UNO
     uno_qte_button_rect = None
 
+    # The viewer is the human seat whose hand is shown face up at the bottom.
+    # With several local humans (hot seat) it follows whoever is on turn.
+    viewer = next((p for p in game.players if p.seat_type == SEAT_HUMAN), game.players[0])
+    hand_layout = HandLayout()
+
     while running:
+        profiler.begin_frame()
+        if isinstance(game, RemoteGame):
+            # Apply state deltas received from the game host
+            game.poll()
+            if game.error_message:
+                draw_message = game.error_message
+                draw_message_time = time.time()
+                game.error_message = ""
+
         current_width, current_height = screen.get_width(), screen.get_height()
 
-        card_width = int(current_width * 0.06)
-        card_height = int(card_width * 1.45)
-        CARD_IMAGES = load_card_images(card_width, card_height)
-        
-        status_font = load_font_by_type('status', int(current_height * 0.03))
+        # Cards and fonts are loaded (and timed) by draw_game_frame; these are cache hits after the first frame
+        card_width, card_height = get_card_size(current_width)
         button_font = load_font_by_type('button', int(current_height * 0.035))
-        uno_font_size = int(current_height * 0.04)
-        uno_button_font = load_font_by_type('button', uno_font_size)
-        winner_font = load_font_by_type('winner', int(current_height * 0.05))
 
         mouse_pos = pygame.mouse.get_pos()
         current_time = time.time()
@@ -253,7 +525,9 @@ def main_game_ui(game):
             if current_time - last_turn_time >= turn_delay:
                 waiting_for_turn = False
                 if game.is_ai_turn and not game.waiting_for_color:
+                    section = profiler.begin('ai_turn')
                     game.handle_ai_turn()
+                    profiler.end(section)
                     last_turn_time = current_time
                     waiting_for_turn = True
         elif game.is_ai_turn and not game.waiting_for_color:
@@ -262,7 +536,9 @@ def main_game_ui(game):
 
         # UNO QTE Logic - Use the new waiting_for_uno_call flag
         current_player = game.get_current_player()
-        if current_player == game.players[0] and game.waiting_for_uno_call:  # Human player needs to call UNO
+        if current_player.seat_type == SEAT_HUMAN:
+            viewer = current_player
+        if current_player == viewer and game.waiting_for_uno_call:  # Human player needs to call UNO
             if not uno_qte_active:
                 # Start UNO QTE
                 uno_qte_active = True
@@ -287,6 +563,7 @@ def main_game_ui(game):
         player_hand_y_start = current_height - card_height - 20
         uno_button_rect.center = (int(current_width / 2), int(player_hand_y_start - uno_button_height / 2 - 50))
 
+        section = profiler.begin('events')
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
@@ -295,6 +572,11 @@ def main_game_ui(game):
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     running = False
+                elif event.key == pygame.K_F3:
+                    profiler.toggle()
+                elif event.key == pygame.K_F4 and profiler.frames:
+                    draw_message = f"Trace written to {profiler.dump()}"
+                    draw_message_time = current_time
             if event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1 and (not waiting_for_turn or not game.is_ai_turn):
                     if game.waiting_for_color:
@@ -308,7 +590,7 @@ def main_game_ui(game):
                                 break
                     else:
                         current_player = game.get_current_player()
-                        if current_player == game.players[0]:
+                        if current_player == viewer:
                             # Define draw pile position and rect for click detection
                             draw_pile_pos = (current_width / 2 + card_width * 0.2, current_height / 2 - card_height / 2)
                             draw_pile_rect = pygame.Rect(draw_pile_pos[0], draw_pile_pos[1], card_width, card_height)
@@ -355,19 +637,9 @@ def main_game_ui(game):
                                     draw_message_time = current_time
                             else:
                                 # Handle card selection for current player
-                                hovered_card_to_play_index = -1
-                                base_y_for_human_click_detection = current_height - card_height - 20
-
-                                for j in range(len(current_player.hand) - 1, -1, -1):
-                                    card_rect_for_click = pygame.Rect(
-                                        current_width/2 - (len(current_player.hand) * card_width * 0.6)/2 + j * card_width * 0.6,
-                                        base_y_for_human_click_detection,
-                                        card_width,
-                                        card_height
-                                    )
-                                    if card_rect_for_click.collidepoint(mouse_pos):
-                                        hovered_card_to_play_index = j
-                                        break
+                                hand_layout.update(len(current_player.hand), (current_width, current_height),
+                                                   (card_width, card_height))
+                                hovered_card_to_play_index = hand_layout.card_at(mouse_pos)
                                 
                                 if hovered_card_to_play_index != -1:
                                     card_to_play = current_player.hand[hovered_card_to_play_index]
@@ -376,210 +648,31 @@ def main_game_ui(game):
                                         if game.is_ai_turn:  # Only add delay if next player is AI
                                             last_turn_time = current_time
                                             waiting_for_turn = True
+        profiler.end(section)
 
-        screen.fill(RED)
+        if recorder is not None:
+            recorder.capture()
 
-        current_player = game.get_current_player()
-        status_text = f"{current_player.name}'s Turn"
-        if waiting_for_turn and game.is_ai_turn:
-            status_text += " (Thinking...)"
-        text_surface = status_font.render(status_text, True, (255, 255, 255))
-        text_rect = text_surface.get_rect(center=(current_width / 2, current_height * 0.35))
-        bg_rect = text_rect.copy().inflate(20, 10)
-        bg_surface = pygame.Surface(bg_rect.size, pygame.SRCALPHA)
-        bg_surface.fill((0, 0, 0, 150))
-        screen.blit(bg_surface, bg_rect)
-        screen.blit(text_surface, text_rect)
-
-        if draw_message:
-            draw_text_surface = status_font.render(draw_message, True, (255, 255, 255))
-            draw_text_rect = draw_text_surface.get_rect(center=(current_width / 2, current_height * 0.35))
-            draw_bg_rect = draw_text_rect.copy().inflate(20, 10)
-            draw_bg_surface = pygame.Surface(draw_bg_rect.size, pygame.SRCALPHA)
-            draw_bg_surface.fill((0, 0, 0, 150))
-            screen.blit(draw_bg_surface, draw_bg_rect)
-            screen.blit(draw_text_surface, draw_text_rect)
-
-        discard_pile_pos = (current_width / 2 - card_width * 1.2, current_height / 2 - card_height / 2)
-        draw_pile_pos = (current_width / 2 + card_width * 0.2, current_height / 2 - card_height / 2)
-        
-        # Check if draw pile should be clickable
-        draw_pile_clickable = game.can_draw_card(current_player) and current_player == game.players[0]
-        
-        # Draw draw pile with visual feedback
-        if draw_pile_clickable:
-            # Highlight draw pile when clickable
-            highlight_rect = pygame.Rect(draw_pile_pos[0] - 5, draw_pile_pos[1] - 5, card_width + 10, card_height + 10)
-            pygame.draw.rect(screen, (255, 255, 0), highlight_rect, 2, border_radius=5)
-        
-        screen.blit(CARD_IMAGES['card_back'], draw_pile_pos)
-        draw_text("DRAW", button_font, (255, 255, 255), screen, draw_pile_pos[0] + card_width/2, draw_pile_pos[1] + card_height + 20)
-        
-        top_card = game.deck.get_top_card()
-        if top_card:
-            COLOR_MAP = {
-                "red": (255, 0, 0),
-                "yellow": (255, 255, 0),
-                "green": (0, 255, 0),
-                "blue": (0, 0, 255)
-            }
-            screen.blit(CARD_IMAGES[str(top_card)], discard_pile_pos)
-            if top_card.color == "wild" and game.selected_color:
-                color_indicator_size = int(card_width * 0.3)
-                color_pos = (discard_pile_pos[0] + card_width - color_indicator_size/2,
-                           discard_pile_pos[1] + card_height - color_indicator_size/2)
-                color_rect = pygame.Rect(0, 0, color_indicator_size, color_indicator_size)
-                color_rect.center = (int(color_pos[0]), int(color_pos[1]))
-                pygame.draw.rect(screen, COLOR_MAP[game.selected_color], color_rect, border_radius=int(color_indicator_size/2))
-                pygame.draw.rect(screen, WHITE, color_rect, 2, border_radius=int(color_indicator_size/2))
-
-        for i, player in enumerate(game.players):
-            is_current_player = player == current_player
-            
-            if i == 0:
-                hovered_card_index = -1 
-                base_y_for_card_row = current_height - card_height - 20 
-
-                for j in range(len(player.hand) - 1, -1, -1):
-                    card_rect_for_hover = pygame.Rect(
-                        current_width/2 - (len(player.hand) * card_width * 0.6)/2 + j * card_width * 0.6,
-                        base_y_for_card_row,
-                        card_width,
-                        card_height
-                    )
-                    if card_rect_for_hover.collidepoint(mouse_pos) and is_current_player:
-                        hovered_card_index = j 
-                        break 
-
-                # Get playable cards for the human player
-                playable_cards = []
-                if is_current_player:
-                    top_card = game.deck.get_top_card()
-                    if top_card:
-                        playable_cards = player.get_playable_cards(top_card, game.selected_color)
-
-                for j, card in enumerate(player.hand):
-                    card_draw_y = base_y_for_card_row
-                    
-                    if is_current_player:
-                        card_draw_y -= 20
-
-                    if j == hovered_card_index:
-                        card_draw_y -= 20
-     
-                    screen.blit(CARD_IMAGES[str(card)], (
-                        current_width/2 - (len(player.hand) * card_width * 0.6)/2 + j * card_width * 0.6,
-                        card_draw_y 
-                    ))
-                    
-                    if is_current_player:
-                        highlight_rect = pygame.Rect(
-                            current_width/2 - (len(player.hand) * card_width * 0.6)/2 + j * card_width * 0.6 - 5,
-                            card_draw_y - 5, 
-                            card_width + 10,
-                            card_height + 10
-                        )
-                        
-                        # Check if this card is playable and highlight with yellow if so
-                        if card in playable_cards:
-                            pygame.draw.rect(screen, (255, 255, 0), highlight_rect, 3, border_radius=5)  # Yellow for eligible cards
-                        else:
-                            pygame.draw.rect(screen, WHITE, highlight_rect, 2, border_radius=5)  # White for non-eligible
-            else:  
-                current_player_shift_x = 0
-                current_player_shift_y = 0
-
-                if is_current_player:
-                    if i == 1: # Left AI Player: move right (towards center)
-                        current_player_shift_x = 20
-                    elif i == 2: # Top AI Player: move down (towards center)
-                        current_player_shift_y = 20
-                    else: # i == 3, Right AI Player: move left (towards center)
-                        current_player_shift_x = -20 
-
-                for j in range(len(player.hand)):
-                    if i == 1: # Left
-                        rotated_card = pygame.transform.rotate(CARD_IMAGES['card_back'], -90)
-                        pos = (20 + current_player_shift_x, current_height/2 - (len(player.hand) * card_width * 0.6)/2 + j * card_width * 0.6 + current_player_shift_y)
-                        screen.blit(rotated_card, pos)
-                        if is_current_player:
-                            highlight_rect = pygame.Rect(pos[0] - 5, pos[1] - 5, card_height + 10, card_width + 10)
-                            pygame.draw.rect(screen, WHITE, highlight_rect, 2, border_radius=5)
-                    elif i == 2: # Top
-                        pos = (current_width/2 - (len(player.hand) * card_width * 0.6)/2 + j * card_width * 0.6 + current_player_shift_x,
-                               20 + current_player_shift_y)
-                        screen.blit(CARD_IMAGES['card_back'], pos)
-                        if is_current_player:
-                            highlight_rect = pygame.Rect(pos[0] - 5, pos[1] - 5, card_width + 10, card_height + 10)
-                            pygame.draw.rect(screen, WHITE, highlight_rect, 2, border_radius=5)
-                    else: # Right
-                        rotated_card = pygame.transform.rotate(CARD_IMAGES['card_back'], 90)
-                        pos = (current_width - card_height - 20 + current_player_shift_x,
-                              current_height/2 - (len(player.hand) * card_width * 0.6)/2 + j * card_width * 0.6 + current_player_shift_y)
-                        screen.blit(rotated_card, pos)
-                        if is_current_player:
-                            highlight_rect = pygame.Rect(pos[0] - 5, pos[1] - 5, card_height + 10, card_width + 10)
-                            pygame.draw.rect(screen, WHITE, highlight_rect, 2, border_radius=5)
-
-        winner = game.check_winner()
+        winner = draw_game_frame(screen, game, viewer, hand_layout, mouse_pos,
+                                 thinking=waiting_for_turn and game.is_ai_turn, draw_message=draw_message,
+                                 uno_qte_remaining=max(0, uno_qte_duration - (current_time - uno_qte_start_time))
+                                 if uno_qte_active else None,
+                                 uno_qte_duration=uno_qte_duration, uno_button_rect=uno_button_rect)
         if winner:
-            winner_text = f"{winner.name} wins!"
-            winner_surface = winner_font.render(winner_text, True, (255, 255, 255))
-            winner_rect = winner_surface.get_rect(center=(current_width / 2, current_height * 0.25))
-            winner_bg_rect = winner_rect.copy().inflate(20, 10)
-            winner_bg_surface = pygame.Surface(winner_bg_rect.size, pygame.SRCALPHA)
-            winner_bg_surface.fill((0, 0, 0, 150))
-            screen.blit(winner_bg_surface, winner_bg_rect)
-            screen.blit(winner_surface, winner_rect)
             pygame.display.flip()
             pygame.time.wait(5000)
             running = False
 
-        # UNO QTE Visual Elements
-        if uno_qte_active:
-            # Draw UNO button with timer
-            remaining_time = max(0, uno_qte_duration - (current_time - uno_qte_start_time))
-            time_percentage = remaining_time / uno_qte_duration
-            
-            # Button color changes based on remaining time
-            if time_percentage > 0.6:
-                button_color = (0, 255, 0)  # Green - plenty of time
-            elif time_percentage > 0.3:
-                button_color = (255, 255, 0)  # Yellow - warning
-            else:
-                button_color = (255, 0, 0)  # Red - almost out of time
-            
-            # Draw button with color
-            pygame.draw.rect(screen, button_color, uno_button_rect, border_radius=10)
-            pygame.draw.rect(screen, WHITE, uno_button_rect, 3, border_radius=10)  # White border
-            
-            # Draw UNO text
-            draw_text("UNO!", uno_button_font, WHITE, screen, uno_button_rect.centerx, uno_button_rect.centery)
-            
-            # Draw timer bar
-            timer_bar_width = int(uno_button_width * 0.8)
-            timer_bar_height = 8
-            timer_bar_x = uno_button_rect.centerx - timer_bar_width // 2
-            timer_bar_y = uno_button_rect.bottom + 10
-            
-            # Background bar
-            pygame.draw.rect(screen, (100, 100, 100), (timer_bar_x, timer_bar_y, timer_bar_width, timer_bar_height), border_radius=4)
-            # Progress bar
-            progress_width = int(timer_bar_width * time_percentage)
-            if progress_width > 0:
-                pygame.draw.rect(screen, button_color, (timer_bar_x, timer_bar_y, progress_width, timer_bar_height), border_radius=4)
-            
-            # Draw warning message
-            warning_text = f"CALL UNO! {remaining_time:.1f}s"
-            warning_surface = status_font.render(warning_text, True, button_color)
-            warning_rect = warning_surface.get_rect(center=(current_width / 2, current_height / 2 + card_height + 100))
-            screen.blit(warning_surface, warning_rect)
-
-        if game.waiting_for_color:
-            draw_color_selection_menu(screen, current_width, current_height, button_font)
-
+        profiler.draw_overlay(screen)
+        section = profiler.begin('flip')
         pygame.display.flip()
-        
+        profiler.end(section)
+        profiler.end_frame()
+
+    if recorder is not None:
+        recorder.close()
+    if profiler.trace_path and profiler.frames:
+        profiler.dump()
     pygame.quit()
     sys.exit()
 
@@ -0,0 +1,161 @@
+"""
+Card texture atlas
+All card images are packed into one PNG on a uniform grid, with a JSON
+index of each card's rectangle. The UI opens one file instead of 55 and
+scales the whole atlas once per card size, cutting cards out as
+subsurfaces. build_final.py bundles a prebuilt atlas with the assets;
+when running from source it is built on first run into the cache dir.
+"""
+
+import hashlib
+import json
+import math
+import os
+
+import pygame
+
+from .resource_path import get_resource_path, get_cache_dir, get_asset_manifest
+
+COLORS = ["red", "yellow", "green", "blue"]
+VALUES = ["0", "1", "2", "3", "4", "5", "6", "7", "8", "9", "skip", "reverse", "drawtwo"]
+SPECIAL_CARDS = ["wild_standard", "wild_drawfour"]
+CARD_NAMES = [f"{color}_{value}" for color in COLORS for value in VALUES] + SPECIAL_CARDS + ["card_back"]
+
+ATLAS_IMAGE = "cards_atlas.png"
+ATLAS_INDEX = "cards_atlas.json"
+ATLAS_VERSION = 2
+CELL_SIZE = (300, 400)  # Source card size; odd-sized images are scaled to fit, as the UI always did
+
+
+def default_asset_dir():
+    return get_resource_path('assets')
+
+
+def source_fingerprint(asset_dir):
+    """Size and mtime of each card image, used to spot a stale cached atlas."""
+    manifest = get_asset_manifest(asset_dir)
+    fingerprint = {}
+    for card_name in CARD_NAMES:
+        entry = manifest.get(f"{card_name}.png")
+        if entry:
+            fingerprint[card_name] = [entry.size, entry.mtime_ns]
+    return fingerprint
+
+
+def build_atlas(asset_dir, out_dir):
+    """
+    Pack the card images in asset_dir into out_dir/cards_atlas.png and its index
+    Works without a display, so it can run at build time.
+    Returns:
+        dict: The atlas index
+    """
+    cell_width, cell_height = CELL_SIZE
+    manifest = get_asset_manifest(asset_dir)
+    images = {}
+    for card_name in CARD_NAMES:
+        path = manifest.path(f"{card_name}.png")
+        if path is None:
+            continue
+        try:
+            image = pygame.image.load(path)
+        except pygame.error:
+            continue
+        # Copy to 32-bit first, smoothscale needs it
+        copy = pygame.Surface(image.get_size(), pygame.SRCALPHA, 32)
+        copy.blit(image, (0, 0))
+        images[card_name] = copy if copy.get_size() == CELL_SIZE else pygame.transform.smoothscale(copy, CELL_SIZE)
+    if not images:
+        raise FileNotFoundError(f"No card images found in {asset_dir}")
+
+    columns = math.ceil(math.sqrt(len(images)))
+    rows = math.ceil(len(images) / columns)
+    atlas = pygame.Surface((columns * cell_width, rows * cell_height), pygame.SRCALPHA, 32)
+    cards = {}
+    for i, (card_name, image) in enumerate(images.items()):
+        x, y = (i % columns) * cell_width, (i // columns) * cell_height
+        atlas.blit(image, (x, y))
+        cards[card_name] = [x, y, cell_width, cell_height]
+
+    index = {
+        "version": ATLAS_VERSION,
+        "image": ATLAS_IMAGE,
+        "cell": list(CELL_SIZE),
+        "columns": columns,
+        "rows": rows,
+        "cards": cards,
+        "sources": source_fingerprint(asset_dir),
+    }
+    os.makedirs(out_dir, exist_ok=True)
+    # Write to temporary names first so a crash never leaves a half-written atlas
+    image_path = os.path.join(out_dir, ATLAS_IMAGE)
+    pygame.image.save(atlas, image_path + ".tmp.png")
+    os.replace(image_path + ".tmp.png", image_path)
+    with open(image_path, "rb") as f:
+        # Content hash, the key for scaled copies in the surface cache
+        index["hash"] = hashlib.sha1(f.read()).hexdigest()
+    index_path = os.path.join(out_dir, ATLAS_INDEX)
+    with open(index_path + ".tmp", "w") as f:
+        json.dump(index, f)
+    os.replace(index_path + ".tmp", index_path)
+    return index
+
+
+def _read_index(directory):
+    try:
+        with open(os.path.join(directory, ATLAS_INDEX)) as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if index.get("version") != ATLAS_VERSION or not os.path.exists(os.path.join(directory, index["image"])):
+        return None
+    return index
+
+
+def find_atlas(asset_dir=None, cache_dir=None):
+    """
+    Locate an up-to-date atlas, building one in the cache dir if needed
+    An atlas shipped next to the assets (see build_final.py) is used as is.
+    Returns:
+        (image_path, index) or None if no atlas could be found or built
+    """
+    asset_dir = asset_dir or default_asset_dir()
+    index = _read_index(asset_dir)
+    if index:
+        return os.path.join(asset_dir, index["image"]), index
+
+    try:
+        cache_dir = cache_dir or get_cache_dir()
+        index = _read_index(cache_dir)
+        if not index or index.get("sources") != source_fingerprint(asset_dir):
+            index = build_atlas(asset_dir, cache_dir)
+    except (OSError, pygame.error) as e:
+        print(f"Warning: Could not build card atlas: {e}. Loading cards one by one.")
+        return None
+    return os.path.join(cache_dir, index["image"]), index
+
+
+def scaled_atlas_size(index, card_width, card_height):
+    """
+    Atlas size at which every card is exactly card_width x card_height
+    Cells sit on a uniform grid, so scaling the whole atlas to columns x
+    card_width by rows x card_height scales every card to that size.
+    """
+    return index["columns"] * card_width, index["rows"] * card_height
+
+
+def atlas_subsurfaces(scaled, index, card_width, card_height):
+    """Cut an atlas already scaled with scaled_atlas_size into card subsurfaces."""
+    cell_width, cell_height = index["cell"]
+    return {card_name: scaled.subsurface((x // cell_width * card_width, y // cell_height * card_height,
+                                          card_width, card_height))
+            for card_name, (x, y, _, _) in index["cards"].items()}
+
+
+def atlas_card_surfaces(atlas, index, card_width, card_height):
+    """
+    Scale the atlas once and cut it into card subsurfaces
+    Returns:
+        dict: Card name to subsurface of the scaled atlas
+    """
+    scaled = pygame.transform.smoothscale(atlas, scaled_atlas_size(index, card_width, card_height))
+    return atlas_subsurfaces(scaled, index, card_width, card_height)
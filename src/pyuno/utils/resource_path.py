@@ -7,6 +7,27 @@ import os
 import sys
 from pathlib import Path
 
+_base_path = None
+_manifests = {}
+
+def get_base_path():
+    """
+    Get the directory resources are resolved against, computed once
+    
+    Returns:
+        Absolute path to the project root, or the PyInstaller bundle directory
+    """
+    global _base_path
+    if _base_path is None:
+        try:
+            # PyInstaller creates a temp folder and stores path in _MEIPASS
+            _base_path = getattr(sys, '_MEIPASS')
+        except AttributeError:
+            # Running in development mode
+            # Go up from src/pyuno/utils to project root
+            _base_path = str(Path(__file__).parent.parent.parent.parent)
+    return _base_path
+
 def get_resource_path(relative_path):
     """
     Get absolute path to resource, works for dev and for PyInstaller
@@ -17,15 +38,69 @@ def get_resource_path(relative_path):
     Returns:
         Absolute path to the resource
     """
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = getattr(sys, '_MEIPASS')
-    except AttributeError:
-        # Running in development mode
-        # Go up from src/pyuno/utils to project root
-        base_path = Path(__file__).parent.parent.parent.parent
+    return os.path.join(get_base_path(), relative_path)
+
+class AssetEntry:
+    __slots__ = ('path', 'size', 'mtime_ns')
+
+    def __init__(self, path, size, mtime_ns):
+        self.path = path
+        self.size = size
+        self.mtime_ns = mtime_ns
+
+class AssetManifest:
+    """
+    Every file in an asset directory: name -> absolute path, size and mtime
+    Built with one directory scan on first use, so loaders can look files
+    up without probing the filesystem. Call refresh() if the files change.
+    """
+
+    def __init__(self, asset_dir):
+        self.asset_dir = asset_dir
+        self._entries = None
+
+    @property
+    def entries(self):
+        if self._entries is None:
+            self.refresh()
+        return self._entries
+
+    def refresh(self):
+        entries = {}
+        try:
+            with os.scandir(self.asset_dir) as it:
+                for entry in it:
+                    if entry.is_file():
+                        stat = entry.stat()
+                        entries[entry.name] = AssetEntry(entry.path, stat.st_size, stat.st_mtime_ns)
+        except OSError:
+            pass  # Missing asset directory: every lookup misses
+        self._entries = entries
+
+    def get(self, name):
+        """The entry for an asset file name, or None if there is no such file."""
+        return self.entries.get(name)
+
+    def path(self, name):
+        """Absolute path of an asset, or None if it doesn't exist."""
+        entry = self.entries.get(name)
+        return entry.path if entry else None
+
+    def __contains__(self, name):
+        return name in self.entries
+
+def get_asset_manifest(asset_dir=None):
+    """
+    Get the shared manifest for an asset directory (default: the game's assets)
     
-    return os.path.join(base_path, relative_path)
+    Returns:
+        AssetManifest, scanned on first use
+    """
+    asset_dir = asset_dir or get_resource_path('assets')
+    manifest = _manifests.get(asset_dir)
+    if manifest is None:
+        manifest = _manifests[asset_dir] = AssetManifest(asset_dir)
+    return manifest
 
 def get_asset_path(asset_name):
     """
@@ -61,4 +136,26 @@ def resource_exists(relative_path):
     Returns:
         True if the resource exists, False otherwise
     """
-    return os.path.exists(get_resource_path(relative_path)) 
\ No newline at end of file
+    return os.path.exists(get_resource_path(relative_path))
+
+def get_cache_dir():
+    """
+    Get the per-user cache directory for generated assets, creating it if needed
+    
+    PYUNO_CACHE_DIR overrides the platform default.
+    
+    Returns:
+        Absolute path to the cache directory
+    """
+    cache_dir = os.environ.get('PYUNO_CACHE_DIR')
+    if not cache_dir:
+        if sys.platform == 'win32':
+            base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+            cache_dir = os.path.join(base, 'PyUNO', 'cache')
+        elif sys.platform == 'darwin':
+            cache_dir = os.path.expanduser('~/Library/Caches/PyUNO')
+        else:
+            base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+            cache_dir = os.path.join(base, 'pyuno')
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir 
\ No newline at end of file
@@ -0,0 +1,74 @@
+"""
+On-disk cache of scaled surfaces
+Scaled images are stored as raw RGBA pixels keyed by the source's
+content hash and the target size. A cache hit memory-maps the file and
+wraps it with pygame.image.frombuffer, skipping PNG decoding and scaling,
+so a known resolution (e.g. a kiosk) starts without redoing that work.
+"""
+
+import mmap
+import os
+
+import pygame
+
+from .resource_path import get_cache_dir
+
+MAX_FILES = 8  # Scaled sets kept on disk; window resizes would otherwise pile them up
+
+
+class ScaledSurfaceCache:
+    def __init__(self, cache_dir=None, max_files=MAX_FILES):
+        self.cache_dir = cache_dir
+        self.max_files = max_files
+
+    def path(self, key, size):
+        if self.cache_dir is None:
+            self.cache_dir = os.path.join(get_cache_dir(), 'scaled')
+        return os.path.join(self.cache_dir, f"{key}_{size[0]}x{size[1]}.rgba")
+
+    def load(self, key, size, convert=True):
+        """
+        Load a cached surface, or None on a miss
+        With convert the result is in the display's pixel format for fast
+        blitting, which needs a display mode and the main thread; without
+        it the pixels are copied into a plain RGBA surface.
+        """
+        try:
+            path = self.path(key, size)
+            with open(path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size != size[0] * size[1] * 4:
+                    return None
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        raw = pygame.image.frombuffer(buffer, size, 'RGBA')
+        surface = raw.convert_alpha() if convert else raw.copy()
+        del raw
+        try:
+            buffer.close()
+        except BufferError:
+            pass  # Still referenced somewhere; closed when collected
+        os.utime(path)  # Mark as recently used for pruning
+        return surface
+
+    def store(self, key, surface):
+        """Save a surface's pixels; failures only cost the cache hit next time."""
+        try:
+            path = self.path(key, surface.get_size())
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(path + '.tmp', 'wb') as f:
+                f.write(pygame.image.tobytes(surface, 'RGBA'))
+            os.replace(path + '.tmp', path)
+            self.prune()
+        except OSError as e:
+            print(f"Warning: Could not cache scaled surface: {e}")
+
+    def prune(self):
+        """Remove the least recently used files beyond max_files."""
+        files = [os.path.join(self.cache_dir, name) for name in os.listdir(self.cache_dir) if name.endswith('.rgba')]
+        files.sort(key=os.path.getmtime, reverse=True)
+        for path in files[self.max_files:]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
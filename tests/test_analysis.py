@@ -0,0 +1,101 @@
+import unittest
+import os
+import sys
+import tempfile
+
+# Add the src directory to Python path for imports
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+src_path = os.path.join(project_root, 'src')
+sys.path.insert(0, src_path)
+import numpy as np
+
+from pyuno.core.stats import GameStats
+from pyuno.sim.analysis import (GAME_DTYPE, BalanceStats, analyse, load_chunks, play_analysed_game,
+                                simulate_chunks, wilson_interval)
+from pyuno.sim.headless import play_headless_game
+
+
+def make_records(winners, turns, longest_stacks):
+    records = np.zeros(len(winners), dtype=GAME_DTYPE)
+    records["seats"] = 2
+    records["winner"] = winners
+    records["turns"] = turns
+    for record, length in zip(records, longest_stacks):
+        if length:
+            record["stacks"][2] += 1
+            record["stacks"][length] += 1
+    return records
+
+
+class TestBalanceStats(unittest.TestCase):
+    """Test cases for the streaming aggregates."""
+
+    def test_wilson_interval(self):
+        """Test the interval matches the textbook value and stays inside 0-1."""
+        low, high = wilson_interval(50, 100)
+        self.assertAlmostEqual(float(low), 0.4038, places=3)
+        self.assertAlmostEqual(float(high), 0.5962, places=3)
+        low, high = wilson_interval(np.array([0, 10]), 10)
+        self.assertGreaterEqual(low.min(), 0.0)
+        self.assertLessEqual(high.max(), 1.0)
+
+    def test_counts(self):
+        """Test wins, lengths and stacks are totalled the same in chunks as all at once."""
+        records = make_records([0, 1, 0, -1, 0, 1], [10, 20, 30, 2000, 40, 50], [0, 4, 10, 0, 12, 2])
+        whole = BalanceStats(2)
+        whole.update(records)
+        chunked = BalanceStats(2)
+        for start in range(0, len(records), 4):
+            chunked.update(records[start:start + 4])
+        for stats in (whole, chunked):
+            np.testing.assert_array_equal(stats.wins, [3, 2])
+            self.assertEqual(stats.stalled, 1)
+            self.assertEqual(stats.stack_counts.sum(), 8)
+            self.assertEqual(stats.games_with_stack_over(8)[0], 2 / 6)
+            self.assertAlmostEqual(stats.stack_share_over(8), 2 / 8)
+            self.assertAlmostEqual(stats.length_mean()[0], 2150 / 6)
+        self.assertEqual(list(whole.length_quantiles((0.5,))), [30])
+        with self.assertRaises(ValueError):
+            BalanceStats(4).update(records)
+
+
+class TestAnalysis(unittest.TestCase):
+    """Test cases for simulating and analysing games."""
+
+    def test_matches_engine_counters(self):
+        """Test a game's record agrees with the headless runner and the engine's stack counters."""
+        for seed in range(10):
+            record = np.array(play_analysed_game([None] * 3, seed), dtype=GAME_DTYPE)
+            stats = GameStats()
+            result = play_headless_game([None] * 3, seed, stats=stats)
+            self.assertEqual(record["winner"], result.winner)
+            self.assertEqual(record["turns"], result.turns)
+            stacks = record["stacks"]
+            self.assertEqual(stacks.sum(), sum(stats.draw_stack_counts))
+            self.assertEqual((stacks * np.arange(len(stacks))).sum(), stats.draw_stack_total)
+
+    def test_early_stop(self):
+        """Test simulation stops once the intervals are narrow enough, and saved chunks replay the same totals."""
+        chunks = simulate_chunks(["default", "default"], games=10_000, chunk_size=50, workers=0)
+        saved = []
+
+        def keep(chunks):
+            for records in chunks:
+                saved.append(records)
+                yield records
+
+        stats = analyse(keep(chunks), 2, target_width=0.25, min_games=100)
+        self.assertGreaterEqual(stats.games, 100)
+        self.assertLess(stats.games, 10_000)
+        self.assertLessEqual(stats.widest_interval(), 0.25)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "games.npy")
+            np.save(path, np.concatenate(saved))
+            reloaded = analyse(load_chunks([path], chunk_size=30), 2)
+        np.testing.assert_array_equal(reloaded.wins, stats.wins)
+        np.testing.assert_array_equal(reloaded.length_counts, stats.length_counts)
+        self.assertIn("Win rate", stats.report())
+
+
+if __name__ == '__main__':
+    unittest.main()
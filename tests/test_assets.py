@@ -0,0 +1,145 @@
+import unittest
+import tempfile
+import time
+import shutil
+import sys
+import os
+
+# Add the src directory to Python path for imports
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+src_path = os.path.join(project_root, 'src')
+sys.path.insert(0, src_path)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+from pyuno.utils.card_atlas import build_atlas, find_atlas, atlas_card_surfaces, CARD_NAMES, ATLAS_INDEX
+from pyuno.utils.scaled_cache import ScaledSurfaceCache
+from pyuno.utils.resource_path import get_asset_manifest, get_asset_path
+from pyuno.ui.card_assets import CardAssets
+from pyuno.ui.preloader import AssetPreloader
+
+ASSET_DIR = os.path.join(project_root, 'assets')
+
+
+class TestCardAtlas(unittest.TestCase):
+    """Test cases for the card texture atlas."""
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def test_build_and_find(self):
+        """Test the atlas holds every card and is reused until the sources change."""
+        image_path, index = find_atlas(ASSET_DIR, self.cache_dir)
+        self.assertEqual(sorted(index["cards"]), sorted(CARD_NAMES))
+        self.assertTrue(os.path.exists(image_path))
+        mtime = os.stat(os.path.join(self.cache_dir, ATLAS_INDEX)).st_mtime_ns
+        find_atlas(ASSET_DIR, self.cache_dir)
+        self.assertEqual(os.stat(os.path.join(self.cache_dir, ATLAS_INDEX)).st_mtime_ns, mtime)
+
+    def test_stale_atlas_rebuilt(self):
+        """Test a changed card image triggers a rebuild."""
+        assets = os.path.join(self.cache_dir, "assets")
+        shutil.copytree(ASSET_DIR, assets, ignore=shutil.ignore_patterns("*.ttf", "*.otf"))
+        cache = os.path.join(self.cache_dir, "cache")
+        find_atlas(assets, cache)
+        os.remove(os.path.join(assets, "red_5.png"))
+        # The manifest is scanned once; a running game doesn't expect assets to change
+        get_asset_manifest(assets).refresh()
+        _, index = find_atlas(assets, cache)
+        self.assertNotIn("red_5", index["cards"])
+
+    def test_card_surfaces(self):
+        """Test scaling the atlas yields every card at exactly the requested size."""
+        index = build_atlas(ASSET_DIR, self.cache_dir)
+        atlas = pygame.image.load(os.path.join(self.cache_dir, index["image"]))
+        cards = atlas_card_surfaces(atlas, index, 77, 111)
+        self.assertEqual(len(cards), len(CARD_NAMES))
+        self.assertTrue(all(card.get_size() == (77, 111) for card in cards.values()))
+        self.assertEqual(len(index["hash"]), 40)
+
+
+class TestAssetManifest(unittest.TestCase):
+    """Test cases for the asset manifest."""
+
+    def test_entries(self):
+        """Test the manifest lists asset files with their size and mtime."""
+        manifest = get_asset_manifest()
+        self.assertIs(get_asset_manifest(ASSET_DIR), manifest)
+        entry = manifest.get("red_5.png")
+        self.assertEqual(entry.path, get_asset_path("red_5.png"))
+        stat = os.stat(entry.path)
+        self.assertEqual((entry.size, entry.mtime_ns), (stat.st_size, stat.st_mtime_ns))
+        self.assertIn("Fishcrispy.otf", manifest)
+        self.assertIsNone(manifest.path("missing.png"))
+
+    def test_missing_directory(self):
+        """Test a missing asset directory gives an empty manifest."""
+        self.assertEqual(get_asset_manifest(os.path.join(ASSET_DIR, "missing")).entries, {})
+
+
+class TestScaledSurfaceCache(unittest.TestCase):
+    """Test cases for the on-disk cache of scaled surfaces."""
+
+    def setUp(self):
+        pygame.display.init()
+        pygame.display.set_mode((10, 10))
+        self.cache_dir = tempfile.mkdtemp()
+        self.cache = ScaledSurfaceCache(self.cache_dir, max_files=2)
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def test_round_trip(self):
+        """Test a stored surface loads back pixel for pixel."""
+        surface = pygame.Surface((5, 4), pygame.SRCALPHA)
+        surface.fill((10, 20, 30, 128))
+        surface.set_at((2, 3), (200, 100, 50, 255))
+        self.assertIsNone(self.cache.load("abc", (5, 4)))
+        self.cache.store("abc", surface)
+        loaded = self.cache.load("abc", (5, 4))
+        self.assertEqual(loaded.get_size(), (5, 4))
+        self.assertEqual(pygame.image.tobytes(loaded, "RGBA"), pygame.image.tobytes(surface, "RGBA"))
+        # Different size or key is a miss
+        self.assertIsNone(self.cache.load("abc", (4, 5)))
+        self.assertIsNone(self.cache.load("abd", (5, 4)))
+
+    def test_prune(self):
+        """Test only the most recent files are kept."""
+        for i, key in enumerate(("a", "b", "c")):
+            self.cache.store(key, pygame.Surface((2, 2), pygame.SRCALPHA))
+            os.utime(self.cache.path(key, (2, 2)), (i, i))
+        self.cache.prune()
+        self.assertIsNone(self.cache.load("a", (2, 2)))
+        self.assertIsNotNone(self.cache.load("c", (2, 2)))
+
+
+
+class TestAssetPreloader(unittest.TestCase):
+    """Test cases for background asset loading."""
+
+    def test_preload(self):
+        """Test fonts and cards arrive on the main thread through poll()."""
+        pygame.display.init()
+        pygame.display.set_mode((10, 10))
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        # Keep the atlas this builds out of the user's cache directory
+        self.addCleanup(os.environ.pop, "PYUNO_CACHE_DIR", None)
+        os.environ["PYUNO_CACHE_DIR"] = cache_dir
+        assets = CardAssets(ASSET_DIR, ScaledSurfaceCache(cache_dir))
+        preloader = AssetPreloader(assets, (50, 72)).start()
+        deadline = time.time() + 30
+        while not preloader.done and time.time() < deadline:
+            preloader.poll()
+            time.sleep(0.01)
+        self.assertTrue(preloader.done)
+        self.assertEqual(preloader.progress, 1)
+        self.assertIn("Fishcrispy.otf", preloader.font_bytes)
+        self.assertEqual(assets.size, (50, 72))
+        self.assertEqual(assets.images(50, 72)["card_back"].get_size(), (50, 72))
+
+
+if __name__ == '__main__':
+    unittest.main()
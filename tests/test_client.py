@@ -0,0 +1,150 @@
+import unittest
+import subprocess
+import time
+import sys
+import os
+
+# Add the src directory to Python path for imports
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+src_path = os.path.join(project_root, 'src')
+sys.path.insert(0, src_path)
+from pyuno.net.client import GameClient, RemoteGame
+from pyuno.net.protocol import diff_views, apply_delta, seat_view
+from pyuno.core.uno_classes import Game, SEAT_HUMAN, SEAT_AI
+
+
+class TestStateDeltas(unittest.TestCase):
+    """Test cases for seat view deltas."""
+
+    def test_delta_round_trip(self):
+        """Test deltas rebuild the new view from the old one over a whole game."""
+        game = Game.from_seat_types([SEAT_AI] * 4)
+        game.start_game()
+        old = seat_view(game, 0)
+        client_view = seat_view(game, 0)
+        for _ in range(300):
+            if game.check_winner():
+                break
+            game.handle_ai_turn()
+            new = seat_view(game, 0)
+            changes = diff_views(old, new)
+            apply_delta(client_view, changes)
+            self.assertEqual(client_view, new)
+            old = new
+
+    def test_delta_is_small(self):
+        """Test an unchanged hand and unchanged players are left out."""
+        game = Game.from_seat_types([SEAT_HUMAN, SEAT_AI])
+        game.start_game()
+        old = seat_view(game, 0)
+        game.next_player()
+        changes = diff_views(old, seat_view(game, 0))
+        self.assertEqual(changes, {"current": 1})
+
+    def test_hand_order_preserved(self):
+        """Test hands whose order can't be expressed as remove/append are sent whole."""
+        old = {"hand": ["red_1", "blue_2", "red_1"]}
+        new = {"hand": ["blue_2", "red_1", "green_3"]}
+        changes = diff_views(old, new)
+        self.assertEqual(changes["hand"], {"remove": ["red_1"], "add": ["green_3"]})
+        self.assertEqual(apply_delta(old, changes), new)
+
+        old = {"hand": ["red_1", "blue_2"]}
+        new = {"hand": ["blue_2", "red_1"]}
+        self.assertEqual(diff_views(old, new)["hand"], {"set": ["blue_2", "red_1"]})
+
+
+class TestRemoteGame(unittest.TestCase):
+    """Test cases for the thin client against a loopback server process."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = subprocess.Popen(
+            [sys.executable, "-m", "pyuno.net.server", "--port", "0", "--ai-delay", "0"],
+            cwd=src_path, stdout=subprocess.PIPE, text=True)
+        line = cls.server.stdout.readline()
+        cls.port = int(line.rsplit(":", 1)[1])
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.terminate()
+        cls.server.wait()
+        cls.server.stdout.close()
+
+    def setUp(self):
+        self.client = GameClient("127.0.0.1", self.port)
+
+    def tearDown(self):
+        self.client.close()
+
+    def wait_for(self, game, condition, timeout=5.0):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            game.poll()
+            if condition():
+                return True
+            time.sleep(0.01)
+        return False
+
+    def test_join_mirrors_state(self):
+        """Test joining builds a mirror the UI can read."""
+        game = RemoteGame.join(self.client, seat_types=["remote", "ai", "ai"])
+        self.assertEqual(len(game.players), 3)
+        self.assertEqual(game.players[0].seat_type, SEAT_HUMAN)
+        self.assertEqual(len(game.players[0].hand), 7)
+        self.assertEqual(len(game.players[1].hand), 7)
+        self.assertIsNotNone(game.deck.get_top_card())
+        self.assertFalse(game.is_ai_turn)
+
+    def test_predicted_move_is_confirmed(self):
+        """Test a move updates the mirror at once and the server confirms it."""
+        game = RemoteGame.join(self.client, seat_types=["remote", "ai"])
+        me = game.players[0]
+        top_card = game.deck.get_top_card()
+        # Prefer a colored card; a wild also needs a color choice
+        playable = sorted(me.get_playable_cards(top_card, game.selected_color), key=lambda card: card.color == "wild")
+        hand_size = len(me.hand)
+
+        if playable:
+            self.assertTrue(game.play_card(me, playable[0]))
+            # Prediction: the card left the hand before any reply arrived
+            self.assertEqual(len(me.hand), hand_size - 1)
+            self.assertEqual(game.deck.get_top_card(), playable[0])
+            if game.waiting_for_color:
+                game.select_color("red")
+        else:
+            self.assertTrue(game.can_draw_card(me))
+            game.draw_card(me)
+        self.assertTrue(game.is_ai_turn or game.waiting_for_uno_call)
+
+        # The AI seat answers and the turn comes back to us
+        self.assertTrue(self.wait_for(game, lambda: game.current_player_index == 0 or game.check_winner()))
+        self.assertNotEqual(len(me.hand), 0)
+
+    def test_rejected_move_resyncs(self):
+        """Test a move the server rejects is rolled back to server state."""
+        game = RemoteGame.join(self.client, seat_types=["remote", "ai"])
+        me = game.players[0]
+        hand = [str(card) for card in me.hand]
+        # Bypass local validation to force a server-side rejection
+        missing = next(name for name in ("red_5", "blue_5", "green_5", "yellow_5") if name not in hand)
+        game._send("play", card=missing)
+        me.hand.pop()
+        self.assertTrue(self.wait_for(game, lambda: game.error_message != ""))
+        self.assertEqual([str(card) for card in me.hand], hand)
+
+    def test_resync_keeps_players(self):
+        """Test a full state reply updates the players the UI already holds."""
+        game = RemoteGame.join(self.client, seat_types=["remote", "ai", "ai"])
+        players = list(game.players)
+        game._send("state")
+        self.assertTrue(self.wait_for(game, lambda: not game._pending_requests))
+        for player, same in zip(players, game.players):
+            self.assertIs(player, same)
+        self.assertEqual(players[0].seat_type, SEAT_HUMAN)
+        self.assertEqual(players[1].seat_type, SEAT_AI)
+        self.assertEqual(game.players.index(players[0]), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+import unittest
+import asyncio
+import base64
+import random
+import sys
+import os
+
+# Add the src directory to Python path for imports
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+src_path = os.path.join(project_root, 'src')
+sys.path.insert(0, src_path)
+from pyuno.core.cards import card_id, card_from_id, CARD_NAMES
+from pyuno.net.diff import GameDiffer, StateMirror, encode_ops, decode_ops, game_snapshot, OP_KEYFRAME, OP_RESHUFFLE
+from pyuno.net.server import GameServer
+from pyuno.net.protocol import encode_message, decode_message
+from pyuno.core.uno_classes import Card, Game, SEAT_AI
+
+
+class TestGameDiffer(unittest.TestCase):
+    """Test cases for per-move diffs and their binary encoding."""
+
+    def test_card_ids(self):
+        """Test every card face has a one-byte id that round-trips."""
+        self.assertEqual(len(CARD_NAMES), 54)
+        for name in CARD_NAMES:
+            card = Card(*name.split("_", 1))
+            self.assertEqual(card_from_id(card_id(card)), card)
+
+    def test_mirror_tracks_games(self):
+        """Test a mirror fed only encoded diffs matches the game after every move."""
+        random.seed(1234)
+        reshuffles = 0
+        total_bytes = 0
+        moves = 0
+        for players in (2, 4, 10):
+            for _ in range(10):
+                game = Game.from_seat_types([SEAT_AI] * players)
+                game.start_game()
+                differ = GameDiffer(game, keyframe_interval=25)
+                mirror = StateMirror()
+                for _ in range(500):
+                    if game.check_winner():
+                        break
+                    game.handle_ai_turn()
+                    ops = differ.flush()
+                    data = encode_ops(ops)
+                    decoded = decode_ops(data)
+                    mirror.apply(decoded)
+                    self.assertEqual(mirror.snapshot(), game_snapshot(game))
+                    if decoded and decoded[0][0] != OP_KEYFRAME:
+                        total_bytes += len(data)
+                        moves += 1
+                    reshuffles += sum(1 for op in decoded if op[0] == OP_RESHUFFLE)
+        self.assertGreater(reshuffles, 0)
+        # A handful of bytes per move instead of the whole table
+        self.assertLess(total_bytes / moves, 24)
+
+    def test_keyframe_interval(self):
+        """Test keyframes are sent first, periodically and on request."""
+        game = Game.from_seat_types([SEAT_AI] * 3)
+        game.start_game()
+        differ = GameDiffer(game, keyframe_interval=3)
+        self.assertEqual(differ.flush()[0][0], OP_KEYFRAME)
+        game.handle_ai_turn()
+        self.assertNotEqual(differ.flush()[0][0], OP_KEYFRAME)
+        game.handle_ai_turn()
+        self.assertEqual(differ.flush()[0][0], OP_KEYFRAME)
+        differ.request_keyframe()
+        self.assertEqual(differ.flush()[0][0], OP_KEYFRAME)
+        differ.close()
+        self.assertEqual(game.listeners, [])
+
+
+class TestSpectators(unittest.IsolatedAsyncioTestCase):
+    """Test cases for watching a server table."""
+
+    async def test_watch_table(self):
+        """Test a spectator rebuilds a running table from the keyframe and diffs."""
+        server = GameServer(ai_delay=0.001)
+        host, port = await server.start("127.0.0.1", 0)
+        table = server.create_table([SEAT_AI] * 4)
+        reader, writer = await asyncio.open_connection(host, port)
+        writer.write(encode_message({"id": 1, "op": "watch", "table": table.table_id}))
+
+        mirror = StateMirror()
+        while True:
+            message = decode_message(await asyncio.wait_for(reader.readline(), 5))
+            if message.get("id") == 1:
+                mirror.apply(decode_ops(base64.b64decode(message["keyframe"])))
+            elif message.get("type") == "diff":
+                mirror.apply(decode_ops(base64.b64decode(message["data"])))
+            if table.finished:
+                break
+        # Drain anything still buffered, then compare with the final state
+        await asyncio.sleep(0.05)
+        while True:
+            try:
+                line = await asyncio.wait_for(reader.readline(), 0.05)
+            except asyncio.TimeoutError:
+                break
+            message = decode_message(line)
+            if message.get("type") == "diff":
+                mirror.apply(decode_ops(base64.b64decode(message["data"])))
+        self.assertEqual(mirror.snapshot(), game_snapshot(table.game))
+
+        writer.close()
+        await server.close()
+
+    async def test_watch_again_after_leaving(self):
+        """Test a spectator arriving after the last one left gets no ops from before its keyframe."""
+        server = GameServer(ai_delay=60)  # Moves are made by the test
+        host, port = await server.start("127.0.0.1", 0)
+        table = server.create_table([SEAT_AI] * 2)
+
+        async def watch():
+            reader, writer = await asyncio.open_connection(host, port)
+            writer.write(encode_message({"id": 1, "op": "watch", "table": table.table_id}))
+            message = decode_message(await asyncio.wait_for(reader.readline(), 5))
+            mirror = StateMirror()
+            mirror.apply(decode_ops(base64.b64decode(message["keyframe"])))
+            return reader, writer, mirror
+
+        def move():
+            table.game.handle_ai_turn()
+            server._broadcast(table)
+
+        _, writer, _ = await watch()
+        writer.close()
+        for _ in range(50):
+            if not table.spectators:
+                break
+            await asyncio.sleep(0.01)
+        self.assertIsNone(table.differ)
+        for _ in range(4):
+            move()
+
+        reader, writer, mirror = await watch()
+        for _ in range(4):
+            move()
+            message = decode_message(await asyncio.wait_for(reader.readline(), 5))
+            mirror.apply(decode_ops(base64.b64decode(message["data"])))
+            self.assertEqual(mirror.snapshot(), game_snapshot(table.game))
+
+        writer.close()
+        await server.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+import os
+import sys
+
+# Add the src directory to Python path for imports
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+src_path = os.path.join(project_root, 'src')
+sys.path.insert(0, src_path)
+from pyuno.core.uno_classes import Game
+from pyuno.sim.differential import fuzz, walk, replay, shrink, snapshot, new_game, format_divergence
+
+
+class NoTwoPlayerSkipGame(Game):
+    """An engine that forgets that reverse acts as a skip with two players."""
+
+    def reverse_direction(self):
+        self.turn_order.reverse()
+
+
+class TestDifferentialFuzzer(unittest.TestCase):
+    """Test cases for lockstep engine comparison and shrinking."""
+
+    def test_reference_agrees_with_itself(self):
+        """Test the reference engine shows no divergence against itself."""
+        played, divergence = fuzz("pyuno.core.uno_classes:Game", 60, seed=7, workers=0)
+        self.assertEqual(played, 60)
+        self.assertIsNone(divergence)
+
+    def test_games_are_reproducible(self):
+        """Test the same seed deals the same game."""
+        self.assertEqual(snapshot(new_game(Game, 11)), snapshot(new_game(Game, 11)))
+        self.assertNotEqual(snapshot(new_game(Game, 11)), snapshot(new_game(Game, 12)))
+
+    def test_finds_and_shrinks_a_rules_difference(self):
+        """Test a broken engine is caught and its failing sequence shrunk to one that still fails."""
+        divergence = next(d for d in (walk(NoTwoPlayerSkipGame, seed) for seed in range(200)) if d)
+        shrunk = shrink(NoTwoPlayerSkipGame, divergence)
+        self.assertLessEqual(len(shrunk.moves), len(divergence.moves))
+        self.assertIsNotNone(replay(NoTwoPlayerSkipGame, shrunk.seed, shrunk.moves))
+        self.assertIsNone(replay(NoTwoPlayerSkipGame, shrunk.seed, shrunk.moves[:-1]))
+        self.assertIn("current_player", shrunk.fields)
+        self.assertIn(f"seed {shrunk.seed}", format_divergence(shrunk))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import unittest
+import os
+import sys
+import time
+
+# Add the src directory to Python path for imports
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+src_path = os.path.join(project_root, 'src')
+sys.path.insert(0, src_path)
+from pyuno.ai.endgame import EndgameSolver, SPARE_VALUES, after_play, draw_chances, position_of
+from pyuno.core.cards import CARD_IDS
+from pyuno.ai.features import FACE_COLOR, WILD
+from pyuno.ai.strategies import EndgameStrategy, get_strategy
+from pyuno.sim.headless import new_headless_game, play_headless_game
+
+
+def hands(*names_per_seat):
+    return tuple(tuple(sorted(CARD_IDS[name] for name in names)) for names in names_per_seat)
+
+
+class TestEndgameRules(unittest.TestCase):
+    """Test cases for the solver's model of the rules."""
+
+    def test_plays_match_engine(self):
+        """Test a card played in a real game leads where the solver says it does."""
+        checked = 0
+        for seats in (2, 3, 4):
+            for seed in range(20):
+                game = new_headless_game([None] * seats, seed)
+                for _ in range(2000):
+                    if game.check_winner():
+                        break
+                    before = position_of(game)
+                    seat = before[2]
+                    game.handle_ai_turn()
+                    hand = sorted(CARD_IDS[card.name] for card in game.players[seat].hand)
+                    played = list(before[0][seat])
+                    if len(hand) != len(played) - 1 or not set(hand) <= set(played):
+                        continue  # Drew cards
+                    for face in hand:
+                        played.remove(face)
+                    face = played[0]
+                    winner = game.check_winner()
+                    color = None
+                    if FACE_COLOR[face] == WILD:
+                        color = 0 if winner else FACE_COLOR[position_of(game)[1]]
+                    position, sizes = after_play(before, face, color)
+                    if winner:
+                        self.assertEqual(position[0][seat], ())
+                    elif position is None:
+                        self.assertEqual(sizes, [len(player.hand) for player in game.players])
+                    else:
+                        self.assertEqual(position, position_of(game))
+                    checked += 1
+        self.assertGreater(checked, 1000)
+
+    def test_draw_chances(self):
+        """Test spare values are merged into one face without changing the total chance."""
+        self.assertEqual(len(draw_chances(())), 54)
+        merged = draw_chances(SPARE_VALUES[2:])
+        self.assertEqual(len(merged), 54 - 4 * 6)
+        self.assertAlmostEqual(sum(chance for _, chance in merged), 1.0)
+
+
+class TestEndgameSolver(unittest.TestCase):
+    """Test cases for the endgame search."""
+
+    def test_finds_forced_win(self):
+        """Test the solver sees that calling UNO heads-up gives another turn."""
+        solver = EndgameSolver()
+        position = (hands(["blue_8", "blue_skip"], ["red_1", "green_2"]), CARD_IDS["blue_reverse"], 0, 1, 0)
+        values = dict(solver.solve(position, time_budget=1.0))
+        self.assertEqual(values[(CARD_IDS["blue_8"], None)], (1.0, 0.0))
+        self.assertLess(values[(CARD_IDS["blue_skip"], None)][0], 1.0)
+
+    def test_budget_and_cache_bounded(self):
+        """Test a large position returns within its time budget and the cache stays bounded."""
+        solver = EndgameSolver(cache_size=100)
+        position = (hands(["red_1", "red_2", "blue_3", "green_4", "wild_standard"],
+                          ["yellow_5", "yellow_6", "blue_7", "red_8", "green_9"]), CARD_IDS["red_5"], 0, 1, 0)
+        start = time.perf_counter()
+        moves = solver.solve(position, time_budget=0.05)
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertEqual(len(moves), 2 + 4)
+        self.assertLessEqual(len(solver.cache), 100)
+        for _, values in moves:
+            self.assertAlmostEqual(sum(values), 1.0)
+
+    def test_strategy_plays_games(self):
+        """Test the endgame strategy finishes games against the other strategies."""
+        solver = EndgameSolver(time_budget=0.01, samples=2, seed=0)
+        for seed in range(4):
+            result = play_headless_game([EndgameStrategy(solver), get_strategy("counting")], seed)
+            self.assertIsNotNone(result.winner)
+        self.assertGreater(len(solver.cache), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import unittest
+import os
+import sys
+
+# Add the src directory to Python path for imports
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+src_path = os.path.join(project_root, 'src')
+sys.path.insert(0, src_path)
+import numpy as np
+
+from pyuno.ai.encoding import OBS_SIZE, ACTION_DRAW
+from pyuno.sim.env import UnoEnv, SyncVectorEnv, AsyncVectorEnv, random_actions
+
+
+class TestUnoEnv(unittest.TestCase):
+    """Test cases for the single-game environment."""
+
+    def play(self, env, seed):
+        rng = np.random.default_rng(seed)
+        obs, info = env.reset(seed)
+        trace = [obs.copy()]
+        for _ in range(2000):
+            action = random_actions(info["action_mask"][None], rng)[0]
+            obs, reward, terminated, truncated, info = env.step(action)
+            trace.append(obs.copy())
+            if terminated or truncated:
+                return reward, terminated, trace
+        self.fail("Game didn't end")
+
+    def test_episode_reward(self):
+        """Test games end with a win or loss reward, in the arrays handed out at reset."""
+        env = UnoEnv(["hoarder", None])
+        rewards = set()
+        for seed in range(30):
+            obs, info = env.reset(seed)
+            reward, terminated, _ = self.play(env, seed)
+            self.assertTrue(terminated)
+            rewards.add(reward)
+            self.assertIs(env.obs, obs)
+            self.assertIs(env.info["action_mask"], info["action_mask"])
+        self.assertEqual(rewards, {1.0, -1.0})
+
+    def test_seeded_reset_repeats(self):
+        """Test the same seed and actions replay the same game."""
+        first = self.play(UnoEnv(), 3)[2]
+        second = self.play(UnoEnv(), 3)[2]
+        self.assertEqual(len(first), len(second))
+        for a, b in zip(first, second):
+            np.testing.assert_array_equal(a, b)
+
+    def test_illegal_action(self):
+        """Test an action outside the mask is refused."""
+        env = UnoEnv()
+        _, info = env.reset(0)
+        illegal = np.flatnonzero(~info["action_mask"][:ACTION_DRAW])[0]
+        with self.assertRaises(ValueError):
+            env.step(illegal)
+
+
+class TestVectorEnv(unittest.TestCase):
+    """Test cases for the vectorized environments."""
+
+    def run_env(self, env, steps=150):
+        rng = np.random.default_rng(0)
+        with env:
+            obs, info = env.reset(seed=5)
+            self.assertEqual(obs.shape, (4, OBS_SIZE))
+            trace = []
+            finished = 0
+            for _ in range(steps):
+                obs, rewards, terminated, truncated, info = env.step(random_actions(info["action_mask"], rng))
+                trace.append((obs.copy(), rewards.copy(), terminated.copy()))
+                finished += terminated.sum()
+                # Games that finished were reset in the same step
+                self.assertTrue(info["action_mask"].any(axis=1).all())
+        self.assertGreater(finished, 0)
+        return trace
+
+    def test_sync_and_async_agree(self):
+        """Test worker processes play exactly the games the in-process env plays."""
+        sync = self.run_env(SyncVectorEnv(4, [None, "counting"]))
+        async_ = self.run_env(AsyncVectorEnv(4, [None, "counting"], workers=2))
+        for (obs_a, rewards_a, done_a), (obs_b, rewards_b, done_b) in zip(sync, async_):
+            np.testing.assert_array_equal(obs_a, obs_b)
+            np.testing.assert_array_equal(rewards_a, rewards_b)
+            np.testing.assert_array_equal(done_a, done_b)
+
+    def test_rows_are_envs(self):
+        """Test row i of the batch is env i's own observation."""
+        env = SyncVectorEnv(3)
+        obs, _ = env.reset(seed=0)
+        single = UnoEnv()
+        for i in range(3):
+            np.testing.assert_array_equal(obs[i], single.reset(i)[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
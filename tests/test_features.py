@@ -0,0 +1,78 @@
+import unittest
+import os
+import sys
+
+# Add the src directory to Python path for imports
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+src_path = os.path.join(project_root, 'src')
+sys.path.insert(0, src_path)
+from pyuno.core.uno_classes import Card
+from pyuno.core.cards import CARD_IDS
+from pyuno.ai.features import HandFeatures, features_for, playable_faces, COLOR_TOTAL
+from pyuno.ai.strategies import FeatureStrategy, get_strategy
+from pyuno.sim.headless import new_headless_game, play_headless_game
+
+
+def fresh_counts(game):
+    features = HandFeatures(game)
+    game.remove_listener(features.on_event)
+    return (features.face_counts, features.color_counts, features.action_counts,
+            features.wild_counts, features.hand_sizes)
+
+
+class TestHandFeatures(unittest.TestCase):
+    """Test cases for incrementally maintained hand features and the strategy using them."""
+
+    def test_incremental_matches_rescan(self):
+        """Test counts kept from events match a fresh scan of the hands after every turn."""
+        for seed in range(5):
+            game = new_headless_game([FeatureStrategy(), None, None], seed)
+            features = features_for(game)
+            for _ in range(150):
+                if game.check_winner() or not game.handle_ai_turn():
+                    break
+                self.assertEqual((features.face_counts, features.color_counts, features.action_counts,
+                                  features.wild_counts, features.hand_sizes), fresh_counts(game))
+
+    def test_seen_colors_reset_on_reshuffle(self):
+        """Test only the top card counts as seen after the discard pile is reshuffled."""
+        game = new_headless_game([None, None], seed=1)
+        features = features_for(game)
+        features.seen_colors = [5, 5, 5, 5]
+        features.on_event("reshuffle")
+        self.assertEqual(sum(features.seen_colors), 1)
+        self.assertLessEqual(features.unseen(0, 0), COLOR_TOTAL)
+
+    def test_playable_faces(self):
+        """Test the playable-face table agrees with can_play_on."""
+        faces = playable_faces("red_5", None)
+        self.assertIn(CARD_IDS["red_9"], faces)
+        self.assertIn(CARD_IDS["blue_5"], faces)
+        self.assertIn(CARD_IDS["wild_drawfour"], faces)
+        self.assertNotIn(CARD_IDS["blue_6"], faces)
+        on_wild = playable_faces("wild_standard", "blue")
+        self.assertEqual(len(on_wild), 15)  # 13 blue faces and both wilds
+        self.assertIn(CARD_IDS["blue_skip"], on_wild)
+
+    def test_strategy_plays_full_games(self):
+        """Test the feature strategy only picks playable cards and finishes games."""
+        self.assertIsInstance(get_strategy("features"), FeatureStrategy)
+        finished = sum(play_headless_game([FeatureStrategy(), None, FeatureStrategy()], seed).winner is not None
+                       for seed in range(20))
+        self.assertGreater(finished, 15)
+
+    def test_passes_draw_stack(self):
+        """Test a matching draw card is chosen when a draw stack is active."""
+        game = new_headless_game([FeatureStrategy(), None], seed=2)
+        player = game.players[0]
+        player.hand = [Card("blue", "drawtwo"), Card("red", "9"), Card("red", "3")]
+        game.deck.discard_pile.append(Card("red", "drawtwo"))
+        game.draw_stack_active = True
+        game.draw_cards_pending = 2
+        game.selected_color = None
+        choice = player.strategy.choose_card(game, player, player.get_playable_cards(game.deck.get_top_card()))
+        self.assertEqual(str(choice), "blue_drawtwo")
+
+
+if __name__ == '__main__':
+    unittest.main()
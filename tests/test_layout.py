@@ -0,0 +1,37 @@
+import unittest
+import random
+import sys
+import os
+
+# Add the src directory to Python path for imports
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+src_path = os.path.join(project_root, 'src')
+sys.path.insert(0, src_path)
+from pyuno.ui.layout import HandLayout
+
+
+class TestHandLayout(unittest.TestCase):
+    """Test cases for the cached hand layout and hit-testing."""
+
+    def test_card_at_matches_scan(self):
+        """Test bisect hit-testing picks the same card as scanning from the top card down."""
+        rng = random.Random(5)
+        layout = HandLayout()
+        for hand_size in (0, 1, 2, 7, 30, 108):
+            rects = layout.update(hand_size, (1280, 720), (76, 110))
+            for _ in range(500):
+                pos = (rng.uniform(-100, 1400), rng.uniform(550, 720))
+                expected = next((j for j in range(hand_size - 1, -1, -1) if rects[j].collidepoint(pos)), -1)
+                self.assertEqual(layout.card_at(pos), expected)
+
+    def test_rects_cached(self):
+        """Test rects are only recomputed when the hand or window size changes."""
+        layout = HandLayout()
+        rects = layout.update(7, (1280, 720), (76, 110))
+        self.assertIs(layout.update(7, (1280, 720), (76, 110)), rects)
+        self.assertIsNot(layout.update(8, (1280, 720), (76, 110)), rects)
+        self.assertEqual(len(layout.rects), 8)
+
+
+if __name__ == '__main__':
+    unittest.main()
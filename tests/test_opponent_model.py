@@ -0,0 +1,80 @@
+import unittest
+import os
+import sys
+
+# Add the src directory to Python path for imports
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+src_path = os.path.join(project_root, 'src')
+sys.path.insert(0, src_path)
+from pyuno.core.uno_classes import Card
+from pyuno.ai.opponent_model import model_for
+from pyuno.ai.strategies import CountingStrategy
+from pyuno.sim.headless import new_headless_game, play_headless_game
+
+
+class TestOpponentModel(unittest.TestCase):
+    """Test cases for seen-card counts, can't-play-color flags and their use by the AI."""
+
+    def test_counts_follow_the_game(self):
+        """Test seen cards and hand sizes match the table after every turn, across reshuffles."""
+        for seed in range(5):
+            game = new_headless_game([None] * 4, seed)
+            model = model_for(game)
+            for _ in range(300):
+                if game.check_winner() or not game.handle_ai_turn():
+                    break
+                self.assertEqual(model.seen_total, len(game.deck.discard_pile))
+                self.assertEqual(model.hand_sizes, [len(player.hand) for player in game.players])
+
+    def test_forced_draw_flags_color(self):
+        """Test drawing instead of playing marks the color as missing until the next pickup."""
+        game = new_headless_game([None, None], seed=4)
+        model = model_for(game)
+        seat = game.current_player_index
+        player = game.players[seat]
+        game.deck.discard_pile.append(Card("green", "4"))
+        player.hand = [Card("red", "1"), Card("blue", "8")]
+        model.hand_sizes[seat] = 2
+        game.deck.cards.append(Card("yellow", "9"))  # Not playable, so the turn passes
+        game.draw_card(player)
+        green = 2
+        self.assertTrue(model.lacks_color[seat][green])
+        self.assertEqual(model.color_probability(seat, green), 0.0)
+        model.on_event("draw", seat, Card("green", "7"))
+        self.assertFalse(model.lacks_color[seat][green])
+        self.assertGreater(model.color_probability(seat, green), 0.0)
+
+    def test_playable_draw_not_flagged(self):
+        """Test a playable drawn card kept in hand (one card left, so no auto-play) doesn't mark its color missing."""
+        game = new_headless_game([None, None], seed=4)
+        model = model_for(game)
+        seat = game.current_player_index
+        player = game.players[seat]
+        game.deck.discard_pile.append(Card("green", "4"))
+        player.hand = [Card("red", "1")]
+        model.hand_sizes[seat] = 1
+        game.deck.cards.append(Card("green", "9"))
+        drawn = game.draw_card(player)
+        self.assertEqual(drawn, Card("green", "9"))
+        self.assertEqual(game.current_player_index, seat)  # The card can still be played
+        self.assertFalse(any(model.lacks_color[seat]))
+
+    def test_probability_grows_with_hand_size(self):
+        """Test bigger hands are more likely to hold a color."""
+        game = new_headless_game([None, None], seed=5)
+        model = model_for(game)
+        model.hand_sizes[1] = 1
+        small = model.color_probability(1, 0)
+        model.hand_sizes[1] = 15
+        large = model.color_probability(1, 0)
+        self.assertTrue(0.0 < small < large <= 1.0)
+
+    def test_counting_strategy_plays_full_games(self):
+        """Test the card-counting strategy finishes games."""
+        finished = sum(play_headless_game([CountingStrategy(), None, CountingStrategy()], seed).winner is not None
+                       for seed in range(20))
+        self.assertGreater(finished, 15)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+import os
+import sys
+import tempfile
+
+# Add the src directory to Python path for imports
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+src_path = os.path.join(project_root, 'src')
+sys.path.insert(0, src_path)
+import numpy as np
+
+from pyuno.ai.encoding import OBS_SIZE, NUM_ACTIONS, legal_mask, new_mask
+from pyuno.ai.policy import MLPPolicy, PolicyBatcher, PolicyStrategy
+from pyuno.sim.batched import play_policy_tables
+from pyuno.sim.headless import new_headless_game, play_headless_game
+
+
+class TestMLPPolicy(unittest.TestCase):
+    """Test cases for the NumPy policy network."""
+
+    def test_save_and_load(self):
+        """Test weights survive an .npz round trip."""
+        policy = MLPPolicy.random((32, 16), seed=0)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "policy.npz")
+            policy.save(path)
+            loaded = MLPPolicy.load(path)
+        obs = np.random.default_rng(0).integers(0, 3, (5, OBS_SIZE), dtype=np.uint8)
+        np.testing.assert_array_equal(loaded.logits(obs), policy.logits(obs))
+
+    def test_shapes_checked(self):
+        """Test weights that don't map observations to actions are rejected."""
+        with self.assertRaises(ValueError):
+            MLPPolicy([np.zeros((OBS_SIZE, 8))], [np.zeros(8)])
+        with self.assertRaises(ValueError):
+            MLPPolicy([np.zeros((OBS_SIZE, 8)), np.zeros((9, NUM_ACTIONS))], [np.zeros(8), np.zeros(NUM_ACTIONS)])
+
+    def test_act_is_legal(self):
+        """Test the chosen action is always one the mask allows."""
+        policy = MLPPolicy.random(seed=1)
+        rng = np.random.default_rng(1)
+        obs = rng.integers(0, 3, (200, OBS_SIZE), dtype=np.uint8)
+        mask = rng.random((200, NUM_ACTIONS)) < 0.1
+        mask[np.arange(200), rng.integers(0, NUM_ACTIONS, 200)] = True
+        actions = policy.act(obs, mask)
+        self.assertTrue(mask[np.arange(200), actions].all())
+
+
+class TestBatchedPlay(unittest.TestCase):
+    """Test cases for batched decisions across many tables."""
+
+    def test_batch_matches_single_decisions(self):
+        """Test one batched pass answers each game as evaluating it alone would."""
+        policy = MLPPolicy.random(seed=2)
+        batcher = PolicyBatcher(policy, capacity=2)
+        games = [new_headless_game([None] * 3, seed) for seed in range(5)]
+        for game in games:
+            batcher.submit(game, game.current_player_index)
+        batched = batcher.evaluate()
+        self.assertEqual(len(batched), 5)
+        self.assertEqual(batcher.pending, 0)
+        for game, action in zip(games, batched):
+            batcher.submit(game, game.current_player_index)
+            self.assertEqual(batcher.evaluate()[0], action)
+            self.assertTrue(legal_mask(game, game.current_player_index, new_mask())[action])
+
+    def test_tables_finish(self):
+        """Test every table plays to a winner with few forward passes."""
+        policy = MLPPolicy.random(seed=3)
+        batcher = PolicyBatcher(policy, capacity=40)
+        results = play_policy_tables(policy, 40, ["hoarder", None], seed=10, batcher=batcher)
+        self.assertEqual([result.seed for result in results], list(range(10, 50)))
+        self.assertTrue(all(result.winner is not None for result in results))
+        self.assertGreater(batcher.decisions / batcher.batches, 5)
+
+    def test_policy_strategy(self):
+        """Test a policy can also play a seat through the strategy interface."""
+        strategy = PolicyStrategy(MLPPolicy.random(seed=4))
+        for seed in range(5):
+            self.assertIsNotNone(play_headless_game([strategy, None, None], seed).winner)
+
+
+if __name__ == '__main__':
+    unittest.main()
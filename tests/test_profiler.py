@@ -0,0 +1,71 @@
+import unittest
+import json
+import os
+import sys
+import tempfile
+
+# Add the src directory to Python path for imports
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+src_path = os.path.join(project_root, 'src')
+sys.path.insert(0, src_path)
+from pyuno.ui.profiler import FrameProfiler, percentile
+
+
+def record_frame(profiler, *sections):
+    profiler.begin_frame()
+    for name in sections:
+        profiler.end(profiler.begin(name))
+    profiler.end_frame()
+
+
+class TestFrameProfiler(unittest.TestCase):
+    """Test cases for frame timing, its summary and the trace export."""
+
+    def test_disabled_records_nothing(self):
+        """Test a disabled profiler hands out no tokens and keeps no frames."""
+        profiler = FrameProfiler()
+        self.assertIsNone(profiler.begin('events'))
+        record_frame(profiler, 'events')
+        self.assertEqual(len(profiler.frames), 0)
+        self.assertEqual(profiler.summary()['frames'], 0)
+
+    def test_ring_buffer_keeps_last_frames(self):
+        """Test only the most recent frames are kept, with their sections."""
+        profiler = FrameProfiler(capacity=5, enabled=True)
+        for _ in range(12):
+            record_frame(profiler, 'events', 'hands', 'flip')
+        self.assertEqual(len(profiler.frames), 5)
+        summary = profiler.summary()
+        self.assertEqual(summary['frames'], 5)
+        self.assertEqual(set(summary['sections']), {'events', 'hands', 'flip'})
+        self.assertLessEqual(summary['p50'], summary['p95'])
+        self.assertLessEqual(summary['p99'], summary['max'])
+
+    def test_percentile(self):
+        """Test percentiles index into the sorted values."""
+        values = list(range(100))
+        self.assertEqual(percentile(values, 0.5), 50)
+        self.assertEqual(percentile(values, 0.99), 99)
+        self.assertEqual(percentile(values, 1.0), 99)
+        self.assertEqual(percentile([], 0.5), 0.0)
+
+    def test_chrome_trace(self):
+        """Test the dumped trace has one complete event per frame and section."""
+        profiler = FrameProfiler(enabled=True)
+        for _ in range(3):
+            record_frame(profiler, 'events', 'ai_turn')
+        with tempfile.TemporaryDirectory() as tmp:
+            path = profiler.dump(os.path.join(tmp, 'trace.json'))
+            with open(path) as f:
+                trace = json.load(f)
+        events = trace['traceEvents']
+        self.assertEqual(len(events), 9)
+        self.assertEqual([e['name'] for e in events[:3]], ['frame', 'events', 'ai_turn'])
+        self.assertTrue(all(e['ph'] == 'X' and e['dur'] >= 0 for e in events))
+        frame, section = events[0], events[1]
+        self.assertGreaterEqual(section['ts'], frame['ts'])
+        self.assertLessEqual(section['ts'] + section['dur'], frame['ts'] + frame['dur'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+import os
+import random
+import sys
+import tempfile
+
+# Add the src directory to Python path for imports
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+src_path = os.path.join(project_root, 'src')
+sys.path.insert(0, src_path)
+from pyuno.net.diff import game_snapshot
+from pyuno.net.replay import Replay, ReplayGame, ReplayRecorder, record_game
+from pyuno.sim.headless import new_headless_game
+
+
+def recorded_game(seats, seed, keyframe_interval):
+    """A game's replay and the game's snapshot after each recorded turn."""
+    game = new_headless_game([None] * seats, seed)
+    recorder = ReplayRecorder(game, keyframe_interval=keyframe_interval)
+    recorder.capture()
+    snapshots = [game_snapshot(game)]
+    while not game.check_winner() and game.handle_ai_turn():
+        if recorder.capture():
+            snapshots.append(game_snapshot(game))
+    unchanged = recorder.capture()
+    recorder.close()
+    return recorder.replay(), snapshots, unchanged
+
+
+class TestReplay(unittest.TestCase):
+    """Test cases for recording replays and seeking in them."""
+
+    def test_seek_matches_game(self):
+        """Test seeking to any turn, in any order, gives the table as it was then."""
+        rng = random.Random(0)
+        for seats in (2, 4):
+            for seed in range(4):
+                replay, snapshots, _ = recorded_game(seats, seed, keyframe_interval=8)
+                self.assertEqual(len(replay), len(snapshots))
+                turns = list(range(len(replay)))
+                rng.shuffle(turns)
+                for turn in turns + list(range(len(replay))):
+                    self.assertEqual(replay.seek(turn).snapshot(), snapshots[turn])
+
+    def test_seek_cost_bounded(self):
+        """Test a seek applies at most a keyframe interval of frames, and stepping applies one."""
+        replay, _, _ = recorded_game(4, 2, keyframe_interval=8)
+        self.assertGreater(len(replay), 24)
+        for turn in (len(replay) - 1, 0, len(replay) // 2, 7, 8, 9):
+            replay.seek(turn)
+            self.assertLessEqual(replay.frames_applied, 8)
+        replay.step()
+        self.assertEqual(replay.frames_applied, 1)
+
+    def test_unchanged_table_adds_no_frame(self):
+        """Test capturing when nothing moved records nothing."""
+        _, _, captured = recorded_game(2, 0, keyframe_interval=8)
+        self.assertFalse(captured)
+
+    def test_save_and_load(self):
+        """Test a saved replay loads with the same frames and shows the winner at the end."""
+        replay = record_game([None, None, None], seed=5)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "game.pyrep")
+            replay.save(path)
+            loaded = Replay.load(path)
+        self.assertEqual(loaded.frames, replay.frames)
+        self.assertEqual(loaded.keyframes, replay.keyframes)
+        game = ReplayGame(loaded)
+        self.assertIsNone(game.check_winner())
+        self.assertEqual(sum(len(player.hand) for player in game.players), 21)
+        game.seek(len(loaded) - 1)
+        self.assertIsNotNone(game.check_winner())
+        self.assertFalse(game.can_draw_card(game.get_current_player()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+import os
+import random
+import sys
+import tempfile
+
+# Add the src directory to Python path for imports
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+src_path = os.path.join(project_root, 'src')
+sys.path.insert(0, src_path)
+import numpy as np
+
+from pyuno.ai.encoding import (HAND, TOP, OPPONENTS, OBS_SIZE, NUM_ACTIONS, ACTION_DRAW, ACTION_COLOR,
+                               encode_observation, legal_mask, apply_action, new_observation, new_mask,
+                               card_action)
+from pyuno.sim.headless import new_headless_game
+from pyuno.sim.selfplay import generate, open_shards, RECORD_DTYPE
+
+
+class TestEncoding(unittest.TestCase):
+    """Test cases for observation encoding, legal-move masks and actions."""
+
+    def test_observation_matches_table(self):
+        """Test the hand counts, top card and opponent sizes in an observation."""
+        game = new_headless_game([None] * 3, seed=1)
+        obs = encode_observation(game, 0, new_observation())
+        self.assertEqual(obs.shape, (OBS_SIZE,))
+        self.assertEqual(obs[HAND].sum(), len(game.players[0].hand))
+        for card in game.players[0].hand:
+            self.assertGreaterEqual(obs[HAND][card_action(card)], 1)
+        self.assertEqual(obs[TOP][card_action(game.deck.get_top_card())], 1)
+        self.assertEqual(list(obs[OPPONENTS][:2]), [7, 7])
+
+    def test_random_legal_actions_finish_games(self):
+        """Test every action a mask allows is accepted, through to the end of the game."""
+        rng = random.Random(0)
+        obs, mask = new_observation(), new_mask()
+        for seed in range(10):
+            game = new_headless_game([None] * 3, seed)
+            for _ in range(3000):
+                if game.check_winner():
+                    break
+                seat = game.current_player_index
+                legal_mask(game, seat, mask)
+                encode_observation(game, seat, obs)
+                action = rng.choice(np.flatnonzero(mask).tolist())
+                if action >= ACTION_COLOR:
+                    self.assertTrue(game.waiting_for_color)
+                self.assertTrue(apply_action(game, action), (seed, action))
+            self.assertIsNotNone(game.check_winner())
+
+
+class TestSelfPlay(unittest.TestCase):
+    """Test cases for the sharded self-play dataset."""
+
+    def test_generate_dataset(self):
+        """Test shards hold legal, labelled records and are listed in the manifest."""
+        with tempfile.TemporaryDirectory() as tmp:
+            manifest = generate(tmp, games=30, strategy_names=["counting", "default"], seats=3,
+                                workers=0, shard_size=100, games_per_job=15)
+            shards = list(open_shards(tmp))
+            self.assertGreater(len(shards), 2)
+            self.assertEqual(sum(len(shard) for shard in shards), manifest["records"])
+            for shard in shards:
+                self.assertIsInstance(shard, np.memmap)
+                self.assertEqual(shard.dtype, RECORD_DTYPE)
+                self.assertLessEqual(len(shard), 100)
+                self.assertTrue(shard["mask"][np.arange(len(shard)), shard["action"]].all())
+                self.assertTrue((shard["mask"].sum(axis=1) > 1).all())
+                self.assertTrue(set(np.unique(shard["outcome"])) <= {-1, 0, 1})
+            del shards, shard
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+import unittest
+import asyncio
+import sys
+import os
+
+# Add the src directory to Python path for imports
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+src_path = os.path.join(project_root, 'src')
+sys.path.insert(0, src_path)
+from pyuno.net.server import GameServer, LatencyStats
+from pyuno.net.protocol import encode_message, decode_message, card_from_name, ProtocolError
+from pyuno.core.uno_classes import Card
+
+
+class JsonLinesClient:
+    """Minimal test client that pairs replies with requests by id."""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.next_id = 0
+        self.pushed = []
+
+    async def request(self, op, **fields):
+        self.next_id += 1
+        fields.update(op=op, id=self.next_id)
+        self.writer.write(encode_message(fields))
+        await self.writer.drain()
+        while True:
+            message = decode_message(await self.reader.readline())
+            if message.get("id") == self.next_id:
+                return message
+            self.pushed.append(message)
+
+
+class TestProtocol(unittest.TestCase):
+    """Test cases for the JSON-lines protocol helpers."""
+
+    def test_round_trip(self):
+        """Test messages survive encoding and decoding."""
+        message = {"op": "play", "card": "red_5", "seat": 0}
+        line = encode_message(message)
+        self.assertTrue(line.endswith(b"\n"))
+        self.assertEqual(decode_message(line), message)
+
+    def test_card_from_name(self):
+        """Test parsing card names."""
+        self.assertEqual(card_from_name("wild_drawfour"), Card("wild", "drawfour"))
+        self.assertEqual(card_from_name("blue_reverse"), Card("blue", "reverse"))
+        with self.assertRaises(ProtocolError):
+            card_from_name("purple_5")
+
+    def test_latency_stats(self):
+        """Test latency summaries."""
+        stats = LatencyStats()
+        self.assertEqual(stats.summary(), {"count": 0})
+        for ms in range(1, 101):
+            stats.record(ms / 1000)
+        summary = stats.summary()
+        self.assertEqual(summary["count"], 100)
+        self.assertEqual(summary["max_ms"], 100.0)
+        self.assertAlmostEqual(summary["mean_ms"], 50.5)
+
+
+class TestGameServer(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the asyncio game server on localhost."""
+
+    async def asyncSetUp(self):
+        self.server = GameServer(ai_delay=0)
+        host, port = await self.server.start("127.0.0.1", 0)
+        reader, writer = await asyncio.open_connection(host, port)
+        self.client = JsonLinesClient(reader, writer)
+
+    async def asyncTearDown(self):
+        self.client.writer.close()
+        await self.server.close()
+
+    async def test_many_ai_tables(self):
+        """Test hundreds of AI-only tables run concurrently and report latency."""
+        for _ in range(200):
+            reply = await self.client.request("create_table", seats=["ai", "ai", "ai"])
+            self.assertTrue(reply["ok"])
+
+        for _ in range(200):
+            if all(table.finished for table in self.server.tables.values()):
+                break
+            await asyncio.sleep(0.05)
+
+        reply = await self.client.request("stats")
+        self.assertEqual(len(reply["stats"]), 200)
+        for stats in reply["stats"].values():
+            self.assertTrue(stats["finished"])
+            self.assertGreater(stats["ai_turn"]["count"], 0)
+
+    async def test_remote_seat_turn(self):
+        """Test a remote seat can join and take a turn."""
+        reply = await self.client.request("create_table", seats=["remote", "ai"])
+        table_id = reply["table"]
+        self.assertEqual(reply["open_seats"], [0])
+
+        reply = await self.client.request("join", table=table_id, seat=0)
+        self.assertTrue(reply["ok"])
+        state = reply["state"]
+        self.assertEqual(len(state["hand"]), 7)
+        self.assertEqual(state["current"], 0)
+
+        top = card_from_name(state["top_card"])
+        playable = [name for name in state["hand"]
+                    if card_from_name(name).can_play_on(top) and not name.startswith("wild")]
+        if playable:
+            reply = await self.client.request("play", table=table_id, seat=0, card=playable[0])
+        else:
+            reply = await self.client.request("draw", table=table_id, seat=0)
+        self.assertTrue(reply["ok"], reply)
+
+        reply = await self.client.request("stats", table=table_id)
+        self.assertGreater(reply["stats"][table_id]["requests"]["count"], 0)
+
+    async def test_errors(self):
+        """Test invalid requests get error replies without dropping the connection."""
+        reply = await self.client.request("bogus")
+        self.assertFalse(reply["ok"])
+
+        reply = await self.client.request("create_table", seats=["remote", "ai"])
+        table_id = reply["table"]
+        reply = await self.client.request("play", table=table_id, seat=0, card="red_5")
+        self.assertEqual(reply["error"], "Not seated at this seat")
+
+        reply = await self.client.request("join", table=table_id, seat=[0])
+        self.assertFalse(reply["ok"])
+
+        reply = await self.client.request("list_tables")
+        self.assertTrue(reply["ok"])
+
+    async def test_close_notifies_clients(self):
+        """Test shutting down sends seated and watching clients one table_closed message per table."""
+        reply = await self.client.request("create_table", seats=["remote", "ai"])
+        table_id = reply["table"]
+        await self.client.request("join", table=table_id, seat=0)
+        await self.client.request("watch", table=table_id)
+        await self.server.close()
+        while line := await self.client.reader.readline():
+            self.client.pushed.append(decode_message(line))
+        closed = [message for message in self.client.pushed if message.get("type") == "table_closed"]
+        self.assertEqual(closed, [{"type": "table_closed", "table": table_id}])
+        self.assertEqual(self.server.tables, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
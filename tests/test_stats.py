@@ -0,0 +1,103 @@
+import unittest
+import os
+import sys
+import tempfile
+
+# Add the src directory to Python path for imports
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+src_path = os.path.join(project_root, 'src')
+sys.path.insert(0, src_path)
+from pyuno.core.uno_classes import Card, Game
+from pyuno.core.stats import GameStats, TIMED_METHODS
+from pyuno.sim.headless import new_headless_game, run_to_completion, play_headless_game
+
+
+class TestGameStats(unittest.TestCase):
+    """Test cases for the engine counters and their Prometheus export."""
+
+    def test_disabled_game_is_untouched(self):
+        """Test games run the plain class methods unless stats are enabled, and again after disabling."""
+        original = Card.can_play_on
+        game = new_headless_game([None, None], seed=1)
+        self.assertIsNone(game.stats)
+        game.enable_stats()
+        self.assertIn("_can_play", vars(game))
+        self.assertIs(Card.can_play_on, original)
+        game.disable_stats()
+        self.assertIsNone(game.stats)
+        for name in TIMED_METHODS + ("_can_play", "_playable_cards"):
+            self.assertNotIn(name, vars(game))
+        self.assertEqual(game.listeners, [])
+
+    def test_counts_match_the_game(self):
+        """Test counters agree with what a listener sees and results match an uninstrumented game."""
+        events = {"draw": 0, "reshuffle": 0}
+        game = new_headless_game([None] * 4, seed=3)
+        game.add_listener(lambda event, *args: events.__setitem__(event, events[event] + 1)
+                          if event in events else None)
+        stats = game.enable_stats()
+        turns = run_to_completion(game)
+        game.disable_stats()
+        self.assertEqual(stats.timers["handle_ai_turn"].count, turns)
+        self.assertEqual(stats.cards_drawn, events["draw"])
+        self.assertEqual(stats.reshuffles, events["reshuffle"])
+        self.assertGreater(stats.can_play_on_calls, 0)
+        self.assertGreaterEqual(stats.timers["play_card"].count, 1)
+        self.assertEqual(play_headless_game([None] * 4, seed=3, stats=GameStats()),
+                         play_headless_game([None] * 4, seed=3))
+
+    def test_totals_across_games(self):
+        """Test one GameStats keeps totalling across several games."""
+        stats = GameStats()
+        turns = sum(play_headless_game([None, None], seed, stats=stats).turns for seed in range(5))
+        self.assertEqual(stats.timers["handle_ai_turn"].count, turns)
+        frozen = stats.can_play_on_calls
+        play_headless_game([None, None], seed=9)
+        self.assertEqual(stats.can_play_on_calls, frozen)
+
+    def test_games_side_by_side(self):
+        """Test two games stepped in turn each count only their own can_play_on checks."""
+        alone = []
+        for seed in (4, 5):
+            game = new_headless_game([None] * 3, seed=seed)
+            stats = game.enable_stats()
+            run_to_completion(game)
+            alone.append(stats.can_play_on_calls)
+        games = [new_headless_game([None] * 3, seed=seed) for seed in (4, 5)]
+        stats = [game.enable_stats() for game in games]
+        running = list(games)
+        while running:
+            for game in list(running):
+                if game.check_winner() or not game.handle_ai_turn():
+                    running.remove(game)
+        self.assertEqual([s.can_play_on_calls for s in stats], alone)
+
+    def test_draw_stack_histogram(self):
+        """Test draw stack lengths land in cumulative buckets."""
+        stats = GameStats()
+        for length in (2, 4, 4, 20):
+            stats.record_draw_stack(length)
+        text = stats.to_prometheus()
+        self.assertIn('pyuno_draw_stack_length_bucket{le="2"} 1', text)
+        self.assertIn('pyuno_draw_stack_length_bucket{le="4"} 3', text)
+        self.assertIn('pyuno_draw_stack_length_bucket{le="+Inf"} 4', text)
+        self.assertIn('pyuno_draw_stack_length_sum 30', text)
+
+    def test_write_prometheus(self):
+        """Test the exported file has a TYPE line per metric and labels on every series."""
+        game = Game.from_seat_types(["ai", "ai"])
+        stats = game.enable_stats()
+        game.disable_stats()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "pyuno.prom")
+            stats.write_prometheus(path, {"job": "sim"})
+            with open(path) as f:
+                lines = f.read().splitlines()
+            self.assertEqual(os.listdir(tmp), ["pyuno.prom"])
+        samples = [line for line in lines if not line.startswith("#")]
+        self.assertTrue(all('job="sim"' in line for line in samples))
+        self.assertEqual(sum(line.startswith("# TYPE") for line in lines), 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
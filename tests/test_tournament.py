@@ -0,0 +1,106 @@
+import unittest
+import sys
+import os
+
+# Add the src directory to Python path for imports
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+src_path = os.path.join(project_root, 'src')
+sys.path.insert(0, src_path)
+from pyuno.ai.strategies import RandomStrategy, HoarderStrategy, DefaultStrategy, get_strategy
+from pyuno.sim.headless import play_headless_game
+from pyuno.sim.ratings import Rating, update, ranking_settled
+from pyuno.sim.tournament import Tournament, _play_pairing
+
+
+class TestHeadless(unittest.TestCase):
+    """Test cases for headless games between strategies."""
+
+    def test_seeded_games_repeat(self):
+        """Test the same seed replays the same game."""
+        strategies = [RandomStrategy(), HoarderStrategy(), DefaultStrategy()]
+        first = play_headless_game(strategies, seed=42)
+        second = play_headless_game(strategies, seed=42)
+        self.assertEqual(first, second)
+        self.assertIsNotNone(first.winner)
+        self.assertEqual(first.hand_sizes[first.winner], 0)
+
+    def test_turn_cap(self):
+        """Test games stop at the turn cap without a winner."""
+        result = play_headless_game([RandomStrategy(), RandomStrategy()], seed=1, max_turns=3)
+        self.assertIsNone(result.winner)
+        self.assertEqual(result.turns, 3)
+
+    def test_unknown_strategy(self):
+        with self.assertRaises(ValueError):
+            get_strategy("nope")
+
+
+class TestRatings(unittest.TestCase):
+    """Test cases for Glicko rating updates."""
+
+    def test_update(self):
+        """Test a win moves ratings apart and shrinks both deviations."""
+        a, b = Rating(), Rating()
+        update(a, b, 1.0)
+        self.assertGreater(a.rating, 1500)
+        self.assertLess(b.rating, 1500)
+        self.assertAlmostEqual(a.rating - 1500, 1500 - b.rating)
+        self.assertLess(a.rd, 350)
+        self.assertEqual((a.games, a.score, b.score), (1, 1.0, 0.0))
+
+    def test_settled(self):
+        """Test the ranking is settled only when neighbouring intervals don't overlap."""
+        self.assertTrue(ranking_settled([Rating(1700, 40), Rating(1500, 40), Rating(1300, 40)]))
+        self.assertFalse(ranking_settled([Rating(1700, 40), Rating(1550, 40), Rating(1500, 40)]))
+
+
+class TestTournament(unittest.TestCase):
+    """Test cases for the tournament runner."""
+
+    def test_pairing_scores(self):
+        """Test the worker reports one score per game."""
+        scores = _play_pairing(("default", "random", 7, 4, 2000))
+        self.assertEqual(len(scores), 4)
+        self.assertTrue(all(score in (0.0, 0.5, 1.0) for score in scores))
+
+    def test_round_robin_inline(self):
+        """Test a seeded inline tournament is reproducible."""
+        standings = []
+        for _ in range(2):
+            tournament = Tournament(["default", "random", "hoarder"], games_per_match=4,
+                                    min_rounds=2, max_rounds=2, workers=0, seed=3)
+            standings.append([(name, rating.rating) for name, rating in tournament.run()])
+        self.assertEqual(standings[0], standings[1])
+        self.assertEqual(tournament.games_played, 24)
+
+    def test_swiss_pairings(self):
+        """Test Swiss rounds pair rating neighbours, rotate the bye and avoid rematches."""
+        tournament = Tournament(["default", "random", "hoarder", "default"], pairing="swiss", workers=0)
+        self.assertEqual(len(tournament.pairings()), 1)
+        tournament.ratings["default"].rating = 1600
+        tournament.ratings["hoarder"].rating = 1550
+        self.assertEqual(tournament.pairings(), [("default", "hoarder")])
+        tournament._last_opponent = {"default": "hoarder", "hoarder": "default"}
+        tournament.ratings["random"].rating = 1580
+        tournament.rounds_played = 1
+        self.assertEqual(tournament.pairings(), [("default", "hoarder")])
+
+    def test_early_stop(self):
+        """Test the tournament stops once the ranking is settled."""
+        tournament = Tournament(["default", "random"], games_per_match=2, min_rounds=1,
+                                max_rounds=10, workers=0)
+        tournament.ratings["default"] = Rating(2500, 10)
+        tournament.ratings["random"] = Rating(500, 10)
+        tournament.run()
+        self.assertEqual(tournament.rounds_played, 1)
+
+    def test_process_pool(self):
+        """Test matches can be played in worker processes."""
+        tournament = Tournament(["default", "random"], games_per_match=2, min_rounds=1,
+                                max_rounds=1, workers=2)
+        tournament.run()
+        self.assertEqual(tournament.games_played, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,7 +8,8 @@ from unittest.mock import patch, MagicMock
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 src_path = os.path.join(project_root, 'src')
 sys.path.insert(0, src_path)
-from pyuno.core.uno_classes import Card, Deck, Player, Game
+from pyuno.core.uno_classes import Card, Deck, Player, Game, SEAT_HUMAN, SEAT_AI, SEAT_REMOTE
+from pyuno.core.turn_order import TurnOrder
 
 
 class TestCard(unittest.TestCase):
@@ -602,6 +603,96 @@ class TestGame(unittest.TestCase):
         self.assertIn(self.player1, penalized)
 
 
+class TestTurnOrder(unittest.TestCase):
+    """Test cases for the TurnOrder scheduler."""
+    
+    def test_advance_and_skip(self):
+        """Test advancing one seat and skipping a seat."""
+        order = TurnOrder(10)
+        self.assertEqual(order.advance(), 1)
+        self.assertEqual(order.advance(skip=True), 3)
+        self.assertEqual(order.peek(), 4)
+        self.assertEqual(order.index, 3)
+    
+    def test_wraparound_and_reverse(self):
+        """Test wrapping around the table in both directions."""
+        order = TurnOrder(3)
+        order.reverse()
+        self.assertEqual(order.advance(), 2)
+        self.assertEqual(order.advance(skip=True), 0)
+        order.reverse()
+        order.index = 2
+        self.assertEqual(order.advance(), 0)
+    
+    def test_resize(self):
+        """Test resizing keeps the index on the table."""
+        order = TurnOrder(10)
+        order.index = 9
+        order.resize(4)
+        self.assertEqual(order.index, 1)
+        self.assertEqual(order.advance(), 2)
+
+
+class TestSeatTypes(unittest.TestCase):
+    """Test cases for seat-type tables and larger games."""
+    
+    def test_default_seat_types(self):
+        """Test players without a seat type get the classic human/AI layout."""
+        game = Game()
+        game.add_player(Player("Player 1"))
+        game.add_player(Player("Player 2"))
+        self.assertEqual(game.players[0].seat_type, SEAT_HUMAN)
+        self.assertEqual(game.players[1].seat_type, SEAT_AI)
+    
+    def test_invalid_seat_type(self):
+        """Test invalid seat types are rejected."""
+        with self.assertRaises(ValueError):
+            Player("Player 1", "robot")
+    
+    def test_from_seat_types(self):
+        """Test building a ten player game from a seat-type table."""
+        seat_types = [SEAT_AI, SEAT_HUMAN, SEAT_REMOTE] + [SEAT_AI] * 7
+        game = Game.from_seat_types(seat_types)
+        game.start_game()
+        self.assertEqual(len(game.players), 10)
+        self.assertEqual([p.seat_type for p in game.players], seat_types)
+        for player in game.players:
+            self.assertEqual(len(player.hand), 7)
+        
+        # Seat 0 is AI, seat 1 is human, seat 2 is remote
+        self.assertTrue(game.is_ai_turn)
+        game.next_player()
+        self.assertFalse(game.is_ai_turn)
+        game.next_player()
+        self.assertFalse(game.is_ai_turn)
+    
+    def test_draw_four_skips_next_seat(self):
+        """Test draw four penalizes and skips the next seat at a large table."""
+        game = Game.from_seat_types([SEAT_HUMAN] + [SEAT_AI] * 9)
+        game.start_game()
+        game.current_player_index = 9
+        player = game.players[9]
+        victim = game.players[0]
+        wild = Card("wild", "drawfour")
+        player.hand = [wild, Card("red", "1"), Card("red", "2")]
+        victim_hand_size = len(victim.hand)
+        
+        self.assertTrue(game.play_card(player, wild))
+        self.assertTrue(game.select_color("red"))
+        self.assertEqual(len(victim.hand), victim_hand_size + 4)
+        self.assertEqual(game.current_player_index, 1)
+        self.assertTrue(game.is_ai_turn)
+    
+    def test_ai_only_game_progresses(self):
+        """Test a ten player all-AI game keeps taking turns."""
+        game = Game.from_seat_types([SEAT_AI] * 10)
+        game.start_game()
+        for _ in range(200):
+            if game.check_winner():
+                break
+            self.assertTrue(game.handle_ai_turn())
+
+
 class TestGameIntegration(unittest.TestCase):
     """Integration tests for the game."""
     